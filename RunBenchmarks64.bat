@@ -0,0 +1,17 @@
+:: RunBenchmarks64.bat [<option>...]
+:: <option>
+::     --suites=<suite_name>[,<suite_name>...]     (default: all, suites: recognizers, register)
+::     --engines=<engine_name>[,<engine_name>...]  (default: all)
+::     --repeat=<number>                          (default: 3)
+::     --easyocr-profile=<name>=<value>[,<name>=<value>...]
+::     --entries=<number>                         (default: 1000000)
+::
+:: Runs recognizer engines over synthetic in-game exp tooltips of all default layouts
+:: and measures exp data register with many entries. Doesn't need GPU nor network.
+
+@echo off
+set PROJECT_PATH=%~dp0
+set PYTHONPATH=%PROJECT_PATH%src;%PYTHONPATH%
+set PYTHONPATH=%PROJECT_PATH%tests;%PYTHONPATH%
+
+py -3.11-64 -m poe_exp_after_dot_tests benchmarks %*
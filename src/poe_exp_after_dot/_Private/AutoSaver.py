@@ -0,0 +1,172 @@
+import threading as _threading
+
+from collections    import deque as _deque
+from time           import monotonic as _get_monotonic_time
+
+from .LogManager    import to_logger
+from .Measurer      import SaveJob
+
+
+_MAX_DELAY_FACTOR = 6 # jobs wait at most this many delays, even when new requests keep coming
+
+
+class AutoSaver:
+    """
+    Runs save jobs (see 'Measurer.prepare_save_exp_data') in dedicated thread, in order of requests.
+    Jobs are run once there is no new request for 'delay'.
+    New job absorbs waiting job, which writes into same file (see 'SaveJob.absorb'), so burst of measurements ends with single write of each file.
+    Idle job (see 'set_idle_job') is run after each run of waiting jobs, so it's run once per burst too.
+    """
+    _delay              : float                 # in seconds
+    _condition          : _threading.Condition
+    _jobs               : _deque[SaveJob]
+    _first_time         : float                 # of oldest waiting job, in seconds, monotonic
+    _last_time          : float                 # of newest waiting job, in seconds, monotonic
+    _is_busy            : bool
+    _running_jobs       : list[SaveJob]
+    _idle_job           : SaveJob | None
+    _number_of_flushers : int                   # threads waiting in 'flush'
+    _is_stopped         : bool
+    _thread             : _threading.Thread
+
+    def __init__(self, delay : float):
+        """
+        delay
+            In seconds. Time without new request, after which waiting jobs are run.
+        """
+        self._delay                 = max(delay, 0.0)
+        self._condition             = _threading.Condition()
+        self._jobs                  = _deque()
+        self._first_time            = 0.0
+        self._last_time             = 0.0
+        self._is_busy               = False
+        self._running_jobs          = []
+        self._idle_job              = None
+        self._number_of_flushers    = 0
+        self._is_stopped            = False
+
+        self._thread = _threading.Thread(target = self._run, name = "Auto Saver", daemon = True)
+        self._thread.start()
+
+    def request(self, job : SaveJob):
+        """
+        Raises
+            RuntimeError - When auto saver is stopped.
+        """
+        with self._condition:
+            if self._is_stopped:
+                raise RuntimeError("Auto saver is stopped.")
+
+            now = _get_monotonic_time()
+            if not self._jobs:
+                self._first_time = now
+            self._last_time = now
+
+            self._absorb_waiting(job)
+            self._jobs.append(job)
+            self._condition.notify_all()
+
+    def set_idle_job(self, job : SaveJob | None):
+        """
+        job
+            Run in dedicated thread, whenever waiting jobs have been run (also by 'flush' and 'stop').
+            Need to write only what has changed since its last run. None - no idle job.
+        """
+        with self._condition:
+            self._idle_job = job
+
+    def is_busy(self) -> bool:
+        """
+        Returns
+            True    - If any job is waiting or being run.
+        """
+        with self._condition:
+            return self._is_busy or bool(self._jobs)
+
+    def is_saving(self, file_name : str) -> bool:
+        """
+        Returns
+            True    - If any job, which writes into file, is waiting or being run.
+        """
+        with self._condition:
+            return any(job.get_file_name() == file_name for job in self._running_jobs) or any(job.get_file_name() == file_name for job in self._jobs)
+
+    def flush(self):
+        """
+        Runs waiting jobs without delay and waits until they are finished. Can be called from any thread.
+        """
+        with self._condition:
+            self._number_of_flushers += 1
+            self._condition.notify_all()
+
+            while self._is_busy or self._jobs:
+                self._condition.wait()
+
+            self._number_of_flushers -= 1
+
+    def stop(self):
+        """
+        Flushes waiting jobs, then stops thread. New requests aren't accepted.
+        """
+        with self._condition:
+            if self._is_stopped:
+                return
+            self._is_stopped = True
+            self._condition.notify_all()
+
+        self._thread.join()
+
+    def _absorb_waiting(self, job : SaveJob):
+        """
+        Only the newest waiting job of same file can be absorbed, so jobs of same file stay in order.
+        Absorbing job goes to the end of queue, as the newest one.
+        """
+        for index in range(len(self._jobs) - 1, -1, -1):
+            if self._jobs[index].get_file_name() == job.get_file_name():
+                if job.absorb(self._jobs[index]):
+                    del self._jobs[index]
+                return
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if not self._jobs:
+                        if self._is_stopped:
+                            return
+                        self._condition.wait()
+                        continue
+
+                    if self._is_stopped or self._number_of_flushers > 0:
+                        break
+
+                    now = _get_monotonic_time()
+                    remaining = min(self._last_time + self._delay, self._first_time + self._delay * _MAX_DELAY_FACTOR) - now
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                self._running_jobs = list(self._jobs)
+                self._jobs.clear()
+                self._is_busy = True
+
+            for job in self._running_jobs:
+                self._run_job(job)
+
+            # new jobs could have come meanwhile, then idle job waits for them
+            with self._condition:
+                idle_job = self._idle_job if not self._jobs else None
+
+            if idle_job is not None:
+                self._run_job(idle_job)
+
+            with self._condition:
+                self._running_jobs = []
+                self._is_busy = False
+                self._condition.notify_all()
+
+    def _run_job(self, job : SaveJob):
+        try:
+            job.run()
+        except Exception as exception:
+            to_logger().error(f"Can't save into \"{job.get_file_name()}\". {str(exception)}")
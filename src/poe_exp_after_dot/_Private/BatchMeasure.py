@@ -0,0 +1,257 @@
+import os       as _os
+import numpy    as _numpy
+import cv2      as _cv2
+
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+
+from .Settings          import Settings
+from .LogManager        import to_logger
+from .Measurer          import Measurer
+from .Recognizers       import Recognizer, TemplateRecognizer, EasyOCRRecognizer, RECOGNIZER_ENGINE_NAMES
+from .ScreenCapture     import FileScreenCapture
+from .OverlaySupport    import solve_layout
+
+
+IMAGE_FILE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+_MIN_TEXT_BRIGHTNESS    = 128   # text of in-game exp tooltip is bright on dark background
+_TEXT_MARGIN            = 4     # in pixels, kept on the left side of text, when in-game exp tooltip is cropped
+
+
+class ImageMeasurement:
+    file_name   : str
+    time_       : float         # modification time of file, in seconds, since epoch
+    total_exp   : int | None    # None - not recognized
+    text        : str           # text read by recognizer, or reason of failure
+
+    def __init__(self, file_name : str, time_ : float, total_exp : int | None, text : str):
+        self.file_name  = file_name
+        self.time_      = time_
+        self.total_exp  = total_exp
+        self.text       = text
+
+
+def find_image_files(directory : str) -> list[str]:
+    """
+    Returns
+        Image files from directory (not recursive), ordered by modification time (oldest first), then by name.
+    """
+    file_names = [
+        _os.path.join(directory, name) for name in _os.listdir(directory)
+        if name.lower().endswith(IMAGE_FILE_EXTENSIONS) and _os.path.isfile(_os.path.join(directory, name))
+    ]
+    return sorted(file_names, key = lambda file_name: (_os.path.getmtime(file_name), file_name))
+
+
+def get_exp_tooltip_band(settings : Settings) -> tuple[int, int, int, int]:
+    """
+    Position of cursor is unknown for screenshot, so returned region covers each place
+    where in-game exp tooltip can appear, while cursor is over in-game exp bar.
+    Layout need to be solved.
+
+    Returns
+        Left, top, width and height of region, in pixels.
+    """
+    x_offset = settings.get_int("_solved_layout.in_game_exp_tooltip_x_offset")
+
+    left    = settings.get_int("_solved_layout.in_game_exp_bar_x") + x_offset
+    top     = settings.get_int("_solved_layout.in_game_exp_tooltip_y")
+    width   = settings.get_int("_solved_layout.in_game_exp_bar_width") + settings.get_int("_solved_layout.in_game_exp_tooltip_width")
+    height  = settings.get_int("_solved_layout.in_game_exp_tooltip_height")
+
+    return left, top, width, height
+
+
+def find_exp_tooltip_left(band : _numpy.ndarray) -> int | None:
+    """
+    band
+        Image of region from 'get_exp_tooltip_band' in OpenCV format (BGR).
+
+    Returns
+        Position of left side of in-game exp tooltip text in band, in pixels, with small margin.
+        None - If there is no bright text.
+    """
+    gray : _numpy.ndarray = _numpy.asarray(_cv2.cvtColor(band, _cv2.COLOR_BGR2GRAY))
+    columns = _numpy.flatnonzero((gray >= _MIN_TEXT_BRIGHTNESS).any(axis = 0))
+
+    if len(columns) == 0:
+        return None
+
+    return max(int(columns[0]) - _TEXT_MARGIN, 0)
+
+
+def _create_batch_recognizer(settings : Settings) -> Recognizer:
+    """
+    Same engine as 'create_recognizer', but without cache (each screenshot is different)
+    and learned glyphs aren't stored, so worker processes don't write to same glyph atlas file.
+    """
+    engine_name = settings.get_str("recognizer_engine")
+
+    if engine_name not in RECOGNIZER_ENGINE_NAMES:
+        engine_name = "easyocr"
+
+    if engine_name == "template":
+        recognizer = TemplateRecognizer(None, EasyOCRRecognizer(settings))
+
+        atlas_file_name = settings.get_str("_data_path") + "\\cache\\glyph_atlas.npz"
+        try:
+            recognizer.to_atlas().load(atlas_file_name)
+        except (OSError, ValueError, KeyError) as exception:
+            to_logger().warning(f"Can't load glyph atlas. {str(exception)}")
+
+        return recognizer
+
+    return EasyOCRRecognizer(settings)
+
+
+class _Worker:
+    """
+    Recognizer is kept warm between images measured by the same process.
+    """
+    _settings           : Settings
+    _recognizer         : Recognizer
+    _screen_capture     : FileScreenCapture
+    _solved_layout_name : str | None
+
+    def __init__(self, settings : Settings):
+        self._settings              = settings
+        self._recognizer            = _create_batch_recognizer(settings)
+        self._screen_capture        = FileScreenCapture()
+        self._solved_layout_name    = None
+
+    def measure(self, file_name : str) -> ImageMeasurement:
+        time_ = _os.path.getmtime(file_name)
+
+        try:
+            self._screen_capture.load(file_name)
+        except ValueError as exception:
+            return ImageMeasurement(file_name, time_, None, str(exception))
+
+        if self._settings.get_bool("is_detect_layout"):
+            width, height = self._screen_capture.get_screen_size()
+            layout_name = f"{width}x{height}"
+        else:
+            layout_name = self._settings.get_str("selected_layout_name")
+
+        if layout_name != self._solved_layout_name:
+            try:
+                solve_layout(self._settings, layout_name)
+            except KeyError:
+                return ImageMeasurement(file_name, time_, None, f"There is no layout \"{layout_name}\".")
+
+            self._solved_layout_name = layout_name
+
+        # Recognizers expect image of in-game exp tooltip only (background of tooltip is most of image),
+        # so tooltip is cropped from band, starting at its text.
+        band_left, top, band_width, height = get_exp_tooltip_band(self._settings)
+
+        tooltip_left = find_exp_tooltip_left(self._screen_capture.grab(band_left, top, band_width, height))
+        if tooltip_left is None:
+            return ImageMeasurement(file_name, time_, None, "")
+
+        width = self._settings.get_int("_solved_layout.in_game_exp_tooltip_width")
+        left = min(band_left + tooltip_left, self._screen_capture.get_screen_size()[0] - width)
+
+        image = self._screen_capture.grab(left, top, width, height)
+
+        total_exp = self._recognizer.recognize_exp(image)
+
+        return ImageMeasurement(file_name, time_, total_exp, self._recognizer.get_last_text())
+
+
+_worker : _Worker | None = None # one for each process of pool
+
+
+def _initialize_worker(settings : Settings):
+    global _worker
+    _worker = _Worker(settings)
+
+
+def _measure_in_worker(file_name : str) -> ImageMeasurement:
+    return _worker.measure(file_name) # type: ignore[union-attr]
+
+
+def measure_images(settings : Settings, file_names : list[str], *, number_of_processes : int | None = None) -> list[ImageMeasurement]:
+    """
+    Recognizes current exp from in-game exp tooltip on each screenshot, without GUI.
+
+    settings
+        Needs default settings, layouts, '_data_path' and '_command_line_layout'.
+    number_of_processes
+        None    - Number of processors.
+        1       - Measures in current process.
+
+    Returns
+        Measurement for each file, in same order as 'file_names'.
+    """
+    if not file_names:
+        return []
+
+    if number_of_processes is None:
+        number_of_processes = _os.cpu_count() or 1
+    number_of_processes = max(1, min(number_of_processes, len(file_names)))
+
+    if number_of_processes == 1:
+        worker = _Worker(settings)
+        return [worker.measure(file_name) for file_name in file_names]
+
+    # threads of EasyOCR are shared between processes
+    if settings.get_int("easyocr_profile.number_of_threads") == 0:
+        settings.set_tmp_int("easyocr_profile.number_of_threads", max(1, (_os.cpu_count() or 1) // number_of_processes))
+
+    with _ProcessPoolExecutor(number_of_processes, initializer = _initialize_worker, initargs = (settings,)) as executor:
+        return list(executor.map(_measure_in_worker, file_names, chunksize = 4))
+
+
+def apply_measurements(measurer : Measurer, measurements : list[ImageMeasurement]) -> int:
+    """
+    Updates measurer with recognized measurements, in order of their time.
+
+    Returns
+        Number of measurements, which updated measurer.
+    """
+    number_of_updated = 0
+    last_time : float | None = None
+
+    for measurement in sorted(measurements, key = lambda measurement: measurement.time_):
+        if measurement.total_exp is None:
+            to_logger().error(f"Can't find current exp amount in \"{measurement.file_name}\". Scanned Text: \"{measurement.text}\".")
+            continue
+
+        # measurements at the same time can't give exp per hour
+        if last_time is not None and measurement.time_ <= last_time:
+            to_logger().warning(f"Skipped \"{measurement.file_name}\", because it has the same time as previous measured image.")
+            continue
+
+        measurer.update(measurement.total_exp, measurement.time_)
+
+        if measurer.is_update_fail():
+            to_logger().error(f"Current exp amount from \"{measurement.file_name}\" is out of range.")
+        else:
+            number_of_updated += 1
+            last_time = measurement.time_
+
+    return number_of_updated
+
+
+def run_batch_measure(settings : Settings, directory : str) -> str:
+    """
+    Measures each screenshot from directory and saves exp data into 'exp_data.json' in that directory.
+
+    Returns
+        Name of saved exp data file.
+    """
+    file_names = find_image_files(directory)
+    to_logger().info(f"Measuring {len(file_names)} image(s) from \"{directory}\".")
+
+    measurements = measure_images(settings, file_names)
+
+    measurer = Measurer()
+    number_of_updated = apply_measurements(measurer, measurements)
+
+    exp_data_file_name = _os.path.join(directory, "exp_data.json")
+    measurer.save_exp_data(exp_data_file_name)
+
+    to_logger().info(f"Measured {number_of_updated} of {len(file_names)} image(s). Saved exp data into \"{exp_data_file_name}\".")
+
+    return exp_data_file_name
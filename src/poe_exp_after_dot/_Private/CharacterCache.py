@@ -0,0 +1,137 @@
+from collections        import OrderedDict
+from concurrent.futures import Future as _Future, ThreadPoolExecutor as _ThreadPoolExecutor
+
+from .LogManager        import to_logger
+from .Commons           import character_name_to_log_name
+from .Measurer          import Measurer
+from .AutoSaver         import AutoSaver
+
+
+ENTRY_SIZE = 400 # in bytes, approximate memory taken by one entry of register (row with its values)
+
+
+def estimate_measurer_size(number_of_entries : int) -> int:
+    """
+    Returns
+        Approximate memory taken by measurer with given number of entries, in bytes.
+    """
+    return number_of_entries * ENTRY_SIZE
+
+
+class CharacterCache:
+    """
+    Keeps measurers of recently used characters (other than current one), so switching to them doesn't load exp data.
+    Measurers are loaded whole in dedicated thread, after waiting saves are written (see 'AutoSaver').
+
+    Least recently used measurers are evicted, when there are more of them than capacity,
+    or when they take more memory than maximal size (estimated from number of entries).
+    Evicted measurers need to be saved already (their saves are requested before they are put into cache).
+    """
+    _capacity           : int
+    _max_size           : int   # in bytes
+    _session_idle_gap   : float # in seconds
+    _auto_saver         : AutoSaver
+    _loader             : _ThreadPoolExecutor
+    _measurers          : OrderedDict[str, _Future] # result: Measurer, from the least recently used
+
+    def __init__(self, capacity : int, max_size : int, session_idle_gap : float, auto_saver : AutoSaver):
+        """
+        capacity
+            Maximal number of cached measurers. 0 - disabled.
+        max_size
+            In bytes. Maximal memory taken by cached measurers.
+        """
+        self._capacity          = max(capacity, 0)
+        self._max_size          = max(max_size, 0)
+        self._session_idle_gap  = session_idle_gap
+        self._auto_saver        = auto_saver
+        self._loader            = _ThreadPoolExecutor(1, thread_name_prefix = "CharacterCacheLoader")
+        self._measurers         = OrderedDict()
+
+    def prefetch(self, name : str, file_name : str):
+        """
+        Loads measurer of character in background, if it isn't cached yet.
+        """
+        if self._capacity == 0 or name in self._measurers:
+            return
+
+        self._measurers[name] = self._loader.submit(self._load, file_name)
+        self._measurers.move_to_end(name, last = False) # prefetched one isn't used yet
+
+        self._evict()
+
+    def put(self, name : str, measurer : Measurer):
+        """
+        measurer
+            Its changes need to be saved or requested to be saved already.
+        """
+        if self._capacity == 0:
+            return
+
+        future : _Future = _Future()
+        future.set_result(measurer)
+
+        self._measurers[name] = future
+        self._measurers.move_to_end(name)
+
+        self._evict()
+
+    def take(self, name : str) -> Measurer | None:
+        """
+        Removes measurer of character from cache. Waits, if it's still loading.
+
+        Returns
+            None    - If character isn't cached, or its exp data can't be loaded.
+        """
+        future = self._measurers.pop(name, None)
+        if future is None:
+            return None
+
+        try:
+            return future.result()
+        except Exception as exception:
+            to_logger().warning(f"Can't prefetch character data of {character_name_to_log_name(name)}. {str(exception)}")
+            return None
+
+    def discard(self, name : str):
+        future = self._measurers.pop(name, None)
+        if future is not None:
+            future.cancel()
+
+    def get_names(self) -> list[str]:
+        """
+        Returns
+            Names of cached characters, from the least recently used.
+        """
+        return list(self._measurers.keys())
+
+    def close(self):
+        """
+        Drops cached measurers. Waiting loads are cancelled.
+        """
+        self._loader.shutdown(wait = False, cancel_futures = True)
+        self._measurers.clear()
+
+    def _load(self, file_name : str) -> Measurer:
+        # measurer could have been evicted while its save was waiting
+        if self._auto_saver.is_saving(file_name):
+            self._auto_saver.flush()
+
+        measurer = Measurer()
+        measurer.set_session_idle_gap(self._session_idle_gap)
+        measurer.load_exp_data(file_name)
+        return measurer
+
+    def _evict(self):
+        while self._measurers and (len(self._measurers) > self._capacity or self._get_size() > self._max_size):
+            name, future = self._measurers.popitem(last = False)
+            future.cancel()
+
+            to_logger().debug(f"Evicted character data of {character_name_to_log_name(name)} from cache.")
+
+    def _get_size(self) -> int:
+        size = 0
+        for future in self._measurers.values():
+            if future.done() and not future.cancelled() and future.exception() is None:
+                size += estimate_measurer_size(future.result().get_number_of_entries())
+        return size
@@ -1,7 +1,51 @@
-import os as _os
+import os           as _os
+import json         as _json
+import sqlite3      as _sqlite3
+import threading    as _threading
+
+from typing         import Any
+from dataclasses    import dataclass, replace as _replace
+
+from .LogManager        import to_logger
+from .Commons           import character_name_to_log_name
+from .Measurer          import Measurer, SaveJob, get_journal_file_name
+from .ExpDataDatabase   import ExpDataDatabase, is_exp_data_database, get_exp_data_database_file_names
+
+
+# json      - exp data file with journal file
+# sqlite    - SQLite database
+EXP_DATA_STORAGE_NAMES = ["json", "sqlite"]
+
+
+def _get_character_folder_path(name : str, data_path : str) -> str | None:
+    if name == "":
+        return None
+    return _os.path.abspath(data_path) + "\\characters\\" + name
+
+
+def get_exp_data_file_name(name : str, data_path : str, storage : str) -> str:
+    """
+    name
+        Name of character or empty string.
+    storage
+        One of 'EXP_DATA_STORAGE_NAMES'.
+    """
+    folder_path = _get_character_folder_path(name, data_path)
+    if folder_path is None:
+        folder_path = _os.path.abspath(data_path)
+
+    return folder_path + ("\\exp_data.db" if storage == "sqlite" else "\\exp_data.json")
+
+
+def _get_exp_data_file_names(exp_data_file_name : str) -> list[str]:
+    """
+    Returns
+        Exp data file with files, which belong to it.
+    """
+    if is_exp_data_database(exp_data_file_name):
+        return get_exp_data_database_file_names(exp_data_file_name)
+    return [exp_data_file_name, get_journal_file_name(exp_data_file_name)]
 
-from .LogManager    import to_logger
-from .Commons       import character_name_to_log_name
 
 class Character:
     _name                   : str
@@ -9,23 +53,26 @@ class Character:
 
     _character_folder_path  : str | None
     _exp_data_file_name     : str
+    _is_created             : bool
 
-    def __init__(self, name : str, data_path : str):
+    def __init__(self, name : str, data_path : str, storage : str = "json", *, is_create = True):
         """
         name 
             Name of character or empty string.
+        storage
+            One of 'EXP_DATA_STORAGE_NAMES'.
+        is_create
+            False   - Files aren't checked nor created until 'create' is called.
         """
         self._name                  = name
         self._data_path             = data_path
 
-        if name == "":
-            self._character_folder_path     = None
-            self._exp_data_file_name        = _os.path.abspath(data_path) + "\\exp_data.json"
-        else:
-            self._character_folder_path     = _os.path.abspath(data_path) + "\\characters\\" + name
-            self._exp_data_file_name        = self._character_folder_path + "\\exp_data.json"
+        self._character_folder_path = _get_character_folder_path(name, data_path)
+        self._exp_data_file_name    = get_exp_data_file_name(name, data_path, storage)
+        self._is_created            = False
 
-        self._create()
+        if is_create:
+            self.create()
 
     def get_name(self) -> str:
         return self._name
@@ -33,37 +80,286 @@ class Character:
     def get_exp_data_file_name(self) -> str:
         return self._exp_data_file_name
 
-    def _create(self):
+    def create(self):
+        """
+        Creates folder and empty exp data file, if they don't exist. Checks files only once.
+        """
+        if self._is_created:
+            return
+        self._is_created = True
+
         if self._character_folder_path is not None:
             _os.makedirs(self._character_folder_path, exist_ok = True)
 
         if not _os.path.exists(self._exp_data_file_name):
-            with open(self._exp_data_file_name, "w") as file:
-                file.write("[]")
+            if is_exp_data_database(self._exp_data_file_name):
+                ExpDataDatabase(self._exp_data_file_name).close()
+            else:
+                with open(self._exp_data_file_name, "w") as file:
+                    file.write("[]")
 
     def destroy(self):
-        if _os.path.isfile(self._exp_data_file_name):
-            _os.remove(self._exp_data_file_name)
+        for file_name in _get_exp_data_file_names(self._exp_data_file_name):
+            if _os.path.isfile(file_name):
+                _os.remove(file_name)
 
         # to make sure it's a correct folder
-        if self._character_folder_path is not None and "characters" in self._character_folder_path and len(_os.listdir(self._character_folder_path)) == 0:
+        if self._character_folder_path is not None and "characters" in self._character_folder_path and _os.path.isdir(self._character_folder_path) and len(_os.listdir(self._character_folder_path)) == 0:
             _os.rmdir(self._character_folder_path)
 
+        self._is_created = False
+
+
+@dataclass(frozen = True, slots = True)
+class CharacterSummary:
+    """
+    Cached in manifest, so character menu and startup don't need to load exp data of each character.
+    """
+    number_of_entries   : int
+    level               : int       # of last entry, 0 - no entry
+    total_exp           : int       # of last entry
+    time_               : float     # of last entry, since epoch, in seconds
+    file_size           : int       # of exp data file with files, which belong to it, in bytes
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "number_of_entries" : self.number_of_entries,
+            "level"             : self.level,
+            "total_exp"         : self.total_exp,
+            "time_"             : self.time_,
+            "file_size"         : self.file_size,
+        }
+
+    @staticmethod
+    def from_dict(dict_ : dict[str, Any]) -> "CharacterSummary":
+        return CharacterSummary(
+            number_of_entries   = int(dict_["number_of_entries"]),
+            level               = int(dict_["level"]),
+            total_exp           = int(dict_["total_exp"]),
+            time_               = float(dict_["time_"]),
+            file_size           = int(dict_["file_size"]),
+        )
+
+    @staticmethod
+    def from_measurer(measurer : Measurer, file_size : int) -> "CharacterSummary":
+        entry = measurer.to_last_entry()
+        if entry is None:
+            return CharacterSummary(0, 0, 0, 0.0, file_size)
+
+        return CharacterSummary(measurer.get_number_of_entries(), entry.info.level, entry.total_exp, entry.time_, file_size)
+
+
+def _get_files_size(file_names : list[str]) -> int:
+    return sum(_os.path.getsize(file_name) for file_name in file_names if _os.path.isfile(file_name))
+
+
+class _ManifestSaveJob(SaveJob):
+    """
+    Writes manifest, if any summary has changed since it was written (see 'CharacterRegister._write_manifest').
+    """
+    _register : "CharacterRegister"
+
+    def __init__(self, file_name : str, register : "CharacterRegister"):
+        super().__init__(file_name)
+
+        self._register = register
+
+    def absorb(self, older : SaveJob) -> bool:
+        # manifest is made from summaries of register, when job is run
+        return isinstance(older, _ManifestSaveJob)
+
+    def _write(self):
+        self._register._write_manifest(is_forced = False)
+
+
+def _find_character_names(data_path : str) -> list[str]:
+    characters_path = _os.path.abspath(data_path) + "\\characters"
+
+    if not _os.path.exists(characters_path):
+        return []
+
+    return [name for name in _os.listdir(characters_path) if _os.path.isdir(characters_path + "\\" + name)]
+
+
 class CharacterRegister:
+    """
+    Characters with their summaries are listed in manifest file ('cache\\character_manifest.json' in data folder).
+    Manifest is trusted, while modification time of 'characters' folder is same as when manifest was written,
+    so startup reads one small file instead of probing each character folder.
+    Otherwise, 'characters' folder is scanned and manifest is rewritten.
+    """
     _data_path : str
+    _storage : str
     _characters : dict[str, Character]
+    _summaries : dict[str, CharacterSummary | None] # None - not known yet
+    _is_scanned : bool # manifest is written only after scan, so characters added before scan don't hide others
+    _changed_file_names : dict[str, list[str]] # exp data files of characters, whose summaries have changed since manifest was written
+    _lock : _threading.Lock # guards summaries, which are read by manifest save job in other thread
+    _manifest_lock : _threading.Lock # manifest is written by one thread at time
+
+    def __init__(self, data_path : str, storage : str = "json"):
+        """
+        storage
+            One of 'EXP_DATA_STORAGE_NAMES'. Unknown storage is treated as "json".
+        """
+        if storage not in EXP_DATA_STORAGE_NAMES:
+            to_logger().error(f"Unknown exp data storage \"{storage}\". Using \"json\" instead.")
+            storage = "json"
 
-    def __init__(self, data_path : str):
         self._data_path = _os.path.abspath(data_path)
+        self._storage = storage
         self._characters = {}
+        self._summaries = {}
+        self._is_scanned = False
+        self._changed_file_names = {}
+        self._lock = _threading.Lock()
+        self._manifest_lock = _threading.Lock()
+
+    def get_manifest_file_name(self) -> str:
+        return self._data_path + "\\cache\\character_manifest.json"
 
     def scan_for_characters(self):
-        characters_path = self._data_path + "\\characters"
+        manifest = self._read_manifest()
+
+        if manifest is not None and manifest["characters_folder_time"] == self._get_characters_folder_time():
+            for name, summary in manifest["characters"].items():
+                if name not in self._characters:
+                    self._characters[name] = Character(name, self._data_path, self._storage, is_create = False)
+                with self._lock:
+                    self._summaries[name] = None if summary is None else CharacterSummary.from_dict(summary)
 
-        if _os.path.exists(characters_path):
-            for name in _os.listdir(characters_path):
-                if _os.path.isdir(characters_path + "\\" + name):
-                    self.add_character(name)
+            self._is_scanned = True
+
+            to_logger().info(f"Registered {len(self._characters)} character(s) from manifest.")
+            return
+
+        for name in _find_character_names(self._data_path):
+            if name not in self._characters:
+                self.add_character(name)
+
+        # summaries of characters, which still exist, are kept
+        if manifest is not None:
+            for name, summary in manifest["characters"].items():
+                if name in self._characters and summary is not None:
+                    with self._lock:
+                        self._summaries[name] = CharacterSummary.from_dict(summary)
+
+        self._is_scanned = True
+        self.save_manifest()
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        """
+        Returns
+            None    - If there is no manifest file or it's malformed.
+        """
+        try:
+            with open(self.get_manifest_file_name(), "r") as file:
+                manifest = _json.load(file)
+
+            int(manifest["characters_folder_time"])
+            for summary in manifest["characters"].values():
+                if summary is not None:
+                    CharacterSummary.from_dict(summary)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as exception:
+            to_logger().warning(f"Ignored character manifest, because it's malformed. {str(exception)}")
+            return None
+
+        return manifest
+
+    def _get_characters_folder_time(self) -> int:
+        """
+        Returns
+            Modification time of 'characters' folder, in nanoseconds. 0 - there is no folder.
+        """
+        try:
+            return _os.stat(self._data_path + "\\characters").st_mtime_ns
+        except OSError:
+            return 0
+
+    def _write_manifest(self, *, is_forced : bool):
+        """
+        Can be called from any thread. Sizes of exp data files of characters with changed summaries are measured and kept in their summaries.
+
+        is_forced
+            False   - Manifest is written only if any summary has changed since it was written.
+
+        Raises
+            OSError - When manifest can't be written.
+        """
+        with self._manifest_lock:
+            with self._lock:
+                changed_file_names = self._changed_file_names
+                self._changed_file_names = {}
+
+            if not changed_file_names and not is_forced:
+                return
+
+            # exp data is saved before, so sizes are up to date
+            file_sizes = {name : _get_files_size(file_names) for name, file_names in changed_file_names.items()}
+
+            with self._lock:
+                for name, file_size in file_sizes.items():
+                    summary = self._summaries.get(name)
+                    if summary is not None:
+                        self._summaries[name] = _replace(summary, file_size = file_size)
+
+                characters = {name : (None if summary is None else summary.to_dict()) for name, summary in self._summaries.items()}
+
+            manifest = {
+                "characters_folder_time"    : self._get_characters_folder_time(),
+                "characters"                : characters,
+            }
+
+            try:
+                _os.makedirs(_os.path.dirname(self.get_manifest_file_name()), exist_ok = True)
+
+                temporary_file_name = self.get_manifest_file_name() + ".tmp"
+                with open(temporary_file_name, "w") as file:
+                    _json.dump(manifest, file, indent = 4)
+                _os.replace(temporary_file_name, self.get_manifest_file_name())
+            except OSError:
+                # written by next run
+                with self._lock:
+                    self._changed_file_names = {**changed_file_names, **self._changed_file_names}
+                raise
+
+    def save_manifest(self):
+        try:
+            self._write_manifest(is_forced = True)
+        except OSError as exception:
+            to_logger().warning(f"Can't save character manifest. {str(exception)}")
+
+    def update_summary(self, name : str, measurer : Measurer):
+        """
+        Takes summary of character from measurer and marks it as changed. Manifest isn't written (see 'prepare_save_manifest').
+        """
+        file_names = _get_exp_data_file_names(self.to_character(name).get_exp_data_file_name())
+
+        with self._lock:
+            # size is measured when manifest is written
+            previous_summary = self._summaries.get(name)
+            file_size = previous_summary.file_size if previous_summary is not None else 0
+
+            self._summaries[name] = CharacterSummary.from_measurer(measurer, file_size)
+            self._changed_file_names[name] = file_names
+
+    def prepare_save_manifest(self) -> SaveJob:
+        """
+        Returned job writes manifest in any thread, if any summary has changed since it was written. Job can be run repeatedly.
+        Need to be run after exp data of changed characters is saved, so size of their files is known.
+        """
+        return _ManifestSaveJob(self.get_manifest_file_name(), self)
+
+    def get_summary(self, name : str) -> CharacterSummary | None:
+        """
+        Returns
+            Summary of character, as of its last save.
+            None    - If it's not known yet.
+        """
+        with self._lock:
+            return self._summaries.get(name)
 
     def add_character(self, name : str):
         """
@@ -75,9 +371,15 @@ class CharacterRegister:
             If empty string, then is identified as generic character.
             Generic character is without name.
         """
-        character = Character(name, self._data_path)
+        character = Character(name, self._data_path, self._storage)
         self._characters[name] = character
 
+        with self._lock:
+            if name not in self._summaries:
+                self._summaries[name] = None
+        if self._is_scanned:
+            self.save_manifest()
+
         to_logger().info(f"Registered character data for {character_name_to_log_name(name)}. (Creates file structure if doesn't exist.)")
 
         return character
@@ -85,17 +387,59 @@ class CharacterRegister:
     def destroy_character(self, name : str):
         self._characters[name].destroy()
         del self._characters[name]
+        with self._lock:
+            self._summaries.pop(name, None)
+        if self._is_scanned:
+            self.save_manifest()
 
         to_logger().info(f"Destroyed character data for {character_name_to_log_name(name)}.")
 
     def to_character(self, name) -> Character:
+        """
+        Makes sure, that files of character exist.
+        """
         if name not in self._characters:
             self.add_character(name)
 
-        return self._characters[name]
+        character = self._characters[name]
+        character.create()
+        return character
     
     def get_character_names(self, *, is_include_empty_name = False) -> list[str]:
         if is_include_empty_name:
             return [name for name in self._characters.keys()]
         else:
-            return [name for name in self._characters.keys() if name != ""]
\ No newline at end of file
+            return [name for name in self._characters.keys() if name != ""]
+
+
+def migrate_exp_data_to_database(data_path : str) -> str:
+    """
+    Copies exp data of each character (and of character without name) from exp data file (with its journal file) into database.
+    Exp data files are kept. Existing databases are overwritten.
+
+    Returns
+        Text of report, with one line for each character.
+    """
+    lines = []
+
+    for name in [""] + _find_character_names(data_path):
+        json_file_name = get_exp_data_file_name(name, data_path, "json")
+        if not _os.path.isfile(json_file_name):
+            continue
+
+        database_file_name = get_exp_data_file_name(name, data_path, "sqlite")
+
+        try:
+            measurer = Measurer()
+            measurer.load_exp_data(json_file_name)
+            measurer.save_exp_data(database_file_name)
+        except (OSError, ValueError, KeyError, TypeError, _sqlite3.Error) as exception:
+            lines.append(f"Can't migrate exp data of {character_name_to_log_name(name)}. {str(exception)}")
+            continue
+
+        lines.append(f"Migrated {measurer.get_number_of_entries()} entries of {character_name_to_log_name(name)} into \"{database_file_name}\".")
+
+    if not lines:
+        return f"There is no exp data in \"{data_path}\"."
+
+    return "\n".join(lines)
@@ -0,0 +1,103 @@
+import numpy    as _numpy
+
+from .Settings          import Settings
+from .LogManager        import to_logger
+from .ScreenCapture     import ScreenCapture
+
+
+_MIN_CONTRAST           = 24    # minimal difference of brightness between filled and empty part of exp bar
+_MIN_FILLED_BRIGHTNESS  = 64    # brightness of exp bar, above which bar without contrast is considered as full
+_MIN_CHANGE             = 1     # in pixels
+
+
+def find_fill_column(image : _numpy.ndarray) -> int:
+    """
+    image
+        Image of in-game exp bar in OpenCV format (BGR). Bar is filled from left.
+
+    Returns
+        Number of filled columns of exp bar. From 0 to width of image.
+    """
+    width = image.shape[1]
+    if width == 0 or image.shape[0] == 0:
+        return 0
+
+    # brightest channel, because fill of exp bar is colored
+    profile = image.max(axis = 2).mean(axis = 0)
+
+    low     = float(profile.min())
+    high    = float(profile.max())
+
+    if (high - low) < _MIN_CONTRAST:
+        return width if low >= _MIN_FILLED_BRIGHTNESS else 0
+
+    filled_columns = _numpy.flatnonzero(profile >= (low + high) / 2)
+
+    return int(filled_columns[-1]) + 1
+
+
+class ExpBarSampler:
+    """
+    Watches fill of in-game exp bar by grabbing only its strip of screen.
+    It's much cheaper than recognition of in-game exp tooltip, so it can be done periodically.
+    """
+    _settings       : Settings
+    _screen_capture : ScreenCapture
+    _fill_column    : int | None # reference, None - not sampled yet
+
+    def __init__(self, settings : Settings, screen_capture : ScreenCapture):
+        self._settings          = settings
+        self._screen_capture    = screen_capture
+        self._fill_column       = None
+
+    def sample(self) -> int:
+        """
+        Returns
+            Current number of filled columns of in-game exp bar.
+        """
+        image = self._screen_capture.grab(
+            self._settings.get_int("_solved_layout.in_game_exp_bar_x"),
+            self._settings.get_int("_solved_layout.in_game_exp_bar_y"),
+            self._settings.get_int("_solved_layout.in_game_exp_bar_width"),
+            self._settings.get_int("_solved_layout.in_game_exp_bar_height"),
+        )
+        return find_fill_column(image)
+
+    def is_changed(self) -> bool:
+        """
+        Samples exp bar and compares it with reference. Changed fill becomes new reference.
+        First sample (after construction or 'invalidate') only sets reference.
+
+        Returns
+            True    - If fill of exp bar has changed by at least one pixel.
+        """
+        fill_column = self.sample()
+
+        if self._fill_column is None:
+            self._fill_column = fill_column
+            return False
+
+        if abs(fill_column - self._fill_column) < _MIN_CHANGE:
+            return False
+
+        to_logger().debug(f"Fill of in-game exp bar has changed. ({self._fill_column} -> {fill_column})")
+
+        self._fill_column = fill_column
+        return True
+
+    def invalidate(self):
+        """
+        Next sample will only set reference.
+        """
+        self._fill_column = None
+
+    def get_fill_column(self) -> int | None:
+        """
+        Returns
+            Reference number of filled columns.
+            None    - If there is no reference.
+        """
+        return self._fill_column
+
+    def close(self):
+        self._screen_capture.close()
@@ -0,0 +1,141 @@
+import os       as _os
+import sqlite3  as _sqlite3
+
+from typing import Any, Iterable
+
+from .ExpThresholdInfo import ExpThresholdInfo, to_canonical_exp_threshold_info
+
+
+EXP_DATA_DATABASE_EXTENSION = ".db"
+
+# Row is in same order as fields of 'Entry', except 'info', which is stored in three columns.
+_COLUMN_NAMES = (
+    "total_exp", "level", "base_exp", "exp_to_next", "time_", "is_other_level", "is_gained_level",
+    "progress", "progress_in_exp", "progress_step", "progress_step_in_exp",
+    "progress_step_time", "exp_per_hour", "time_to_10_percent", "time_to_next_level",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    position                INTEGER PRIMARY KEY,
+    total_exp               INTEGER NOT NULL,
+    level                   INTEGER NOT NULL,
+    base_exp                INTEGER NOT NULL,
+    exp_to_next             INTEGER NOT NULL,
+    time_                   REAL    NOT NULL,
+    is_other_level          INTEGER NOT NULL,
+    is_gained_level         INTEGER NOT NULL,
+    progress                REAL    NOT NULL,
+    progress_in_exp         INTEGER NOT NULL,
+    progress_step           REAL    NOT NULL,
+    progress_step_in_exp    INTEGER NOT NULL,
+    progress_step_time      REAL    NOT NULL,
+    exp_per_hour            INTEGER NOT NULL,
+    time_to_10_percent      REAL    NOT NULL,
+    time_to_next_level      REAL    NOT NULL
+);
+"""
+
+_SELECT = "SELECT " + ", ".join(_COLUMN_NAMES) + " FROM entries"
+_INSERT = "INSERT INTO entries (position, " + ", ".join(_COLUMN_NAMES) + ") VALUES (" + ", ".join("?" * (len(_COLUMN_NAMES) + 1)) + ")"
+
+_FETCH_SIZE = 10_000 # number of rows converted at once
+
+
+def is_exp_data_database(file_name : str) -> bool:
+    return _os.path.splitext(file_name)[1].lower() == EXP_DATA_DATABASE_EXTENSION
+
+
+def get_exp_data_database_file_names(file_name : str) -> list[str]:
+    """
+    Returns
+        Database file and files, which belong to it in WAL mode.
+    """
+    return [file_name, file_name + "-wal", file_name + "-shm"]
+
+
+def _to_record(position : int, row : tuple) -> tuple:
+    info : ExpThresholdInfo = row[1]
+    return (position, row[0], info.level, info.base_exp, info.exp_to_next, *row[2:])
+
+
+def _to_row(record : tuple) -> tuple:
+    info = to_canonical_exp_threshold_info(ExpThresholdInfo(record[1], record[2], record[3]))
+    return (record[0], info, record[4], bool(record[5]), bool(record[6]), *record[7:])
+
+
+class ExpDataDatabase:
+    """
+    Exp data in SQLite database, one row per entry.
+    Database is in WAL mode, so it can be read, while it's written from other connection (for example, by background save).
+
+    Rows are in same form as rows of register (values in order of fields of 'Entry').
+    Position of entry in exp data is its primary key, positions go from 0 without gaps.
+    Connection can be used only in thread, which opened it.
+    """
+    _connection : _sqlite3.Connection
+
+    def __init__(self, file_name : str):
+        """
+        Creates database, if it doesn't exist.
+
+        Raises
+            sqlite3.Error - When database can't be opened.
+        """
+        self._connection = _sqlite3.connect(file_name)
+        try:
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+            self._connection.executescript(_SCHEMA)
+        except _sqlite3.Error:
+            self._connection.close()
+            raise
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self) -> "ExpDataDatabase":
+        return self
+
+    def __exit__(self, *_ : Any):
+        self.close()
+
+    def get_number_of_entries(self) -> int:
+        return self._connection.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM entries").fetchone()[0]
+
+    def read_rows(self, begin : int = 0, end : int | None = None) -> list[tuple]:
+        """
+        Returns
+            Rows of entries from position 'begin' to 'end' (exclusive), in order.
+            None 'end' - to last entry.
+        """
+        if end is None:
+            cursor = self._connection.execute(_SELECT + " WHERE position >= ? ORDER BY position", (begin,))
+        else:
+            cursor = self._connection.execute(_SELECT + " WHERE position >= ? AND position < ? ORDER BY position", (begin, end))
+        return self._fetch_rows(cursor)
+
+    def replace_changed(self, position : int, rows : Iterable[tuple]):
+        """
+        Removes entries from position, then appends rows after them, in one transaction.
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM entries WHERE position >= ?", (position,))
+            self._connection.executemany(_INSERT, (_to_record(position_, row) for position_, row in enumerate(rows, position)))
+
+    def replace_all(self, rows : Iterable[tuple]):
+        self.replace_changed(0, rows)
+
+    def _fetch_rows(self, cursor : _sqlite3.Cursor) -> list[tuple]:
+        rows : list[tuple] = []
+        while records := cursor.fetchmany(_FETCH_SIZE):
+            rows.extend(map(_to_row, records))
+        return rows
+
+
+def read_exp_data_database_rows(file_name : str, begin : int = 0, end : int | None = None) -> list[tuple]:
+    """
+    Opens own connection, so it can be called from any thread.
+    """
+    with ExpDataDatabase(file_name) as database:
+        return database.read_rows(begin, end)
@@ -2,8 +2,11 @@ from typing import Any
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen = True, slots = True)
 class ExpThresholdInfo:
+    """
+    Immutable, so rows of 'EXP_THRESHOLD_INFO_TABLE' can be shared by all entries.
+    """
     level       : int
     base_exp    : int
     exp_to_next : int
@@ -17,11 +20,17 @@ class ExpThresholdInfo:
     
     @staticmethod
     def from_dict(dict_ : dict[str, Any]) -> "ExpThresholdInfo":
-        return ExpThresholdInfo(
+        """
+        Returns
+            Row of 'EXP_THRESHOLD_INFO_TABLE' for level, if it's equal to values from dictionary.
+            New object otherwise.
+        """
+        info = ExpThresholdInfo(
             int(dict_["level"]),
             int(dict_["base_exp"]),
             int(dict_["exp_to_next"]),
         )
+        return to_canonical_exp_threshold_info(info)
 
 
 EXP_THRESHOLD_INFO_TABLE = (
@@ -125,4 +134,16 @@ EXP_THRESHOLD_INFO_TABLE = (
     ExpThresholdInfo(98, 3638186694, 294631836),
     ExpThresholdInfo(99, 3932818530, 317515914),
     ExpThresholdInfo(100, 4250334444, 0),
-)
\ No newline at end of file
+)
+
+def to_canonical_exp_threshold_info(info : ExpThresholdInfo) -> ExpThresholdInfo:
+    """
+    Returns
+        Row of 'EXP_THRESHOLD_INFO_TABLE' for level of info, if it's equal to info.
+        Info itself otherwise.
+    """
+    if 1 <= info.level <= len(EXP_THRESHOLD_INFO_TABLE):
+        canonical = EXP_THRESHOLD_INFO_TABLE[info.level - 1]
+        if canonical == info:
+            return canonical
+    return info
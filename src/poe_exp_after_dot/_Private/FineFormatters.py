@@ -437,3 +437,51 @@ class FinePercent:
     
     def __str__(self) -> str:
         return self._text_representation
+
+
+class FineStageTime:
+    # format:
+    # <p50>/<p95>/<max>ms   - for example: 3.2/5.1/12.0ms
+    # -                     - not measured yet
+
+    # in milliseconds, can be used in format file, for example: {ocr_ms.p95:.0f}
+    p50                     : float
+    p95                     : float
+    max                     : float
+
+    _text_representation    : str
+
+    def __init__(self, p50 : SupportsFloat | None = None, p95 : SupportsFloat | None = None, max_ : SupportsFloat | None = None, *, value_color : str | None = None, unit_color : str | None = None):
+        """
+        p50, p95, max_
+            Durations of stage in seconds.
+            None - Stage hasn't been measured yet.
+
+        value_color
+            None or color of all values. 
+            Can be name: "grey", "yellow", "red", "green", "blue", "white", ...
+            Can be value: "#7F7F7F", "#FFFF00", ...
+
+        unit_color
+            None or color of all unit symbols. 
+            Can be name: "grey", "yellow", "red", "green", "blue", "white", ...
+            Can be value: "#7F7F7F", "#FFFF00", ...
+        """
+        self.p50 = float(p50) * 1000 if p50 is not None else 0.0
+        self.p95 = float(p95) * 1000 if p95 is not None else 0.0
+        self.max = float(max_) * 1000 if max_ is not None else 0.0
+
+        if p50 is None:
+            self._text_representation = "-"
+            return
+
+        vb = f"<font color=\"{value_color}\">" if value_color else ""
+        ve = "</font>" if value_color else ""
+
+        b = f"<font color=\"{unit_color}\">" if unit_color else ""
+        e = "</font>" if unit_color else ""
+
+        self._text_representation = f"{vb}{self.p50:.1f}{ve}/{vb}{self.p95:.1f}{ve}/{vb}{self.max:.1f}{ve}{b}ms{e}"
+
+    def __str__(self) -> str:
+        return self._text_representation
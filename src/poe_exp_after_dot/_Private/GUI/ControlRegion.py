@@ -1,8 +1,10 @@
 import ctypes as _ctypes
 
+from typing import Any, Callable
+
 from PySide6.QtWidgets  import QMainWindow, QWidget
 from PySide6.QtCore     import Qt, QPoint, QRect, QEvent, QTimer, QSize
-from PySide6.QtGui      import QColor, QMouseEvent, QEnterEvent, QPainter, QWheelEvent
+from PySide6.QtGui      import QColor, QMouseEvent, QEnterEvent, QPainter, QWheelEvent, QCursor
 
 from ..Commons               import to_app
 from ..Logic                 import Logic
@@ -74,6 +76,8 @@ class ControlRegion(QMainWindow, ControlRegionInterface):
     _flags_backup           : Qt.WindowType
     _foreground_guardian    : ForegroundGuardian
 
+    _auto_measure_timer     : QTimer
+
     _is_debug               : bool
     _debug_in_game_exp_tooltip_region : _DebugRegion
 
@@ -116,6 +120,26 @@ class ControlRegion(QMainWindow, ControlRegionInterface):
         )
         self._is_debug = False
 
+        self._logic.to_measure_worker().measured.connect(self._on_measured)
+
+        self._auto_measure_timer = QTimer(self)
+        self._auto_measure_timer.timeout.connect(self._auto_measure)
+        self.enable_auto_measure(self._logic.to_settings().get_bool("is_auto_measure"))
+
+    def enable_auto_measure(self, is_enable : bool = True):
+        """
+        While cursor is over control region, in-game exp bar is periodically sampled, and measurement is done when its fill changes.
+        """
+        if is_enable:
+            self._auto_measure_timer.start(self._logic.to_settings().get_int("auto_measure_interval"))
+        else:
+            self._auto_measure_timer.stop()
+
+        self._frac_exp_bar.enable_exclusion_from_capture(is_enable)
+
+        # fractional exp bar appears in or disappears from sampled image
+        self._logic.invalidate_exp_bar_reference()
+
     def enable_debug(self, is_enable : bool = True):
         if is_enable:
             self.setMouseTracking(True)
@@ -250,6 +274,7 @@ class ControlRegion(QMainWindow, ControlRegionInterface):
                 self._frac_exp_bar.update_bar()
             elif modifiers == (_CTRL | _SHIFT | _ALT):
                 self._logic.to_measurer().remove_current_entry_and_all_entries_above()
+                self._logic.request_save()
                 self.refresh()
             else:
                 pos_in_screen = self.mapToGlobal(QPoint(event.x(), event.y()))
@@ -272,7 +297,16 @@ class ControlRegion(QMainWindow, ControlRegionInterface):
         if not self._info_board.is_dismissed():
             self._info_board.dismiss()
 
-        if event.angleDelta().y() > 0:
+        # with Alt (or Shift on some systems) wheel scrolls horizontally
+        delta = event.angleDelta().y() or event.angleDelta().x()
+        modifiers = _get_key_modifiers()
+        measurer = self._logic.to_measurer()
+
+        if modifiers == _SHIFT:
+            self._jump(measurer.go_to_next_session if delta > 0 else measurer.go_to_previous_session, is_forward = delta > 0)
+        elif modifiers == _CTRL:
+            self._jump(measurer.go_to_next_level if delta > 0 else measurer.go_to_previous_level, is_forward = delta > 0)
+        elif delta > 0:
             self._next_entry()
         else:
             self._previous_entry()
@@ -313,9 +347,21 @@ class ControlRegion(QMainWindow, ControlRegionInterface):
 
     def _measure(self, cursor_x_in_screen : int, cursor_y_in_screen : int):
         self._foreground_guardian.pause()
-        self._logic.measure(cursor_x_in_screen, cursor_y_in_screen, [self])
+        self._logic.request_measure(cursor_x_in_screen, cursor_y_in_screen, [self])
         self._foreground_guardian.resume()
 
+    def _auto_measure(self):
+        if not self.isVisible() or not self.underMouse() or self._logic.is_measuring():
+            return
+
+        if self._logic.is_exp_bar_changed():
+            cursor_pos = QCursor.pos()
+            self._measure(cursor_pos.x(), cursor_pos.y())
+
+    def _on_measured(self, request_id : int, current_exp : int | None, time_ : float, exception : BaseException | None):
+        if not self._logic.finish_measure(request_id, current_exp, time_, exception):
+            return # newer measurement is on the way
+
         if self._logic.is_fetch_failed():
             self._info_board.set_text_by_template("Error")
         else:
@@ -324,35 +370,30 @@ class ControlRegion(QMainWindow, ControlRegionInterface):
         self._frac_exp_bar.update_bar()
 
     def _next_entry(self):
-        measurer = self._logic.to_measurer()
-
-        measurer.go_to_next_entry()
-        page = measurer.get_current_entry_page()
-        if page == 0:
-            self._info_board.set_text_by_template("On No Entry")
-        elif page == measurer.get_number_of_entries():
-            self._info_board.set_text_by_template("On Last")
-        elif page == 1:
-            self._info_board.set_text_by_template("On First")
-        else:
-            self._info_board.set_text_by_template("On Next")
-        self._info_board.show()
-        
-        self._frac_exp_bar.update_bar()
+        self._jump(self._logic.to_measurer().go_to_next_entry, is_forward = True)
 
     def _previous_entry(self):
+        self._jump(self._logic.to_measurer().go_to_previous_entry, is_forward = False)
+
+    def _jump(self, go_to : Callable[[], Any], *, is_forward : bool):
+        """
+        go_to
+            Changes current entry of measurer.
+        """
         measurer = self._logic.to_measurer()
 
-        measurer.go_to_previous_entry()
+        go_to()
         page = measurer.get_current_entry_page()
+        number_of_entries = measurer.get_number_of_entries()
         if page == 0:
             self._info_board.set_text_by_template("On No Entry")
+        # only entry is both first and last, it's shown as last when moving forward and as first when moving backward
+        elif page == number_of_entries and (is_forward or number_of_entries > 1):
+            self._info_board.set_text_by_template("On Last")
         elif page == 1:
             self._info_board.set_text_by_template("On First")
-        elif page == measurer.get_number_of_entries():
-            self._info_board.set_text_by_template("On Last")
         else:
-            self._info_board.set_text_by_template("On Previous")
+            self._info_board.set_text_by_template("On Next" if is_forward else "On Previous")
         self._info_board.show()
         
         self._frac_exp_bar.update_bar()
@@ -28,3 +28,6 @@ class ControlRegionInterface:
 
     def enable_debug(self, is_enable : bool):
         raise NotImplementedError("This method need to be overridden.")
+
+    def enable_auto_measure(self, is_enable : bool):
+        raise NotImplementedError("This method need to be overridden.")
@@ -1,8 +1,17 @@
+import ctypes as _ctypes
+
 from PySide6.QtWidgets  import QWidget
 from PySide6.QtCore     import Qt, QRect
 from PySide6.QtGui      import QColor, QPainter
 
 from ..Logic             import Logic
+from ..LogManager        import to_logger
+
+
+_WDA_NONE                = 0x00000000
+_WDA_EXCLUDEFROMCAPTURE = 0x00000011
+
+_user32 = _ctypes.windll.user32
 
 
 class FracExpBar(QWidget):
@@ -35,6 +44,14 @@ class FracExpBar(QWidget):
         
         self.update_bar_manually(0.0, 0.0, is_try_show = False)
 
+    def enable_exclusion_from_capture(self, is_enable : bool = True):
+        """
+        This bar covers in-game exp bar. Excluding it from screen capture (Windows 10 2004+) lets sampling of in-game exp bar see only the game.
+        Bar is also missing in screenshots and recordings made by user, so it's excluded only while auto measure is enabled.
+        """
+        if not _user32.SetWindowDisplayAffinity(int(self.winId()), _WDA_EXCLUDEFROMCAPTURE if is_enable else _WDA_NONE):
+            to_logger().warning(f"Can't {'exclude' if is_enable else 'include'} fractional exp bar {'from' if is_enable else 'in'} screen capture.")
+
     def reposition_and_resize(self):
         self.setGeometry(QRect(
             self._logic.to_settings().get_int("_solved_layout.in_game_exp_bar_x"),
@@ -81,6 +98,9 @@ class FracExpBar(QWidget):
 
         self.repaint()
 
+        # in case when this bar is captured together with in-game exp bar
+        self._logic.invalidate_exp_bar_reference()
+
         if is_try_show:
             if self._frac_progress_width >= 1:
                 self.show()
@@ -1,5 +1,7 @@
 import os as _os
 
+from datetime import datetime as _datetime
+
 from PySide6.QtWidgets  import QWidget, QMenu, QWidgetAction, QLineEdit
 from PySide6.QtCore     import Qt
 from PySide6.QtGui      import QMouseEvent, QAction, QActionGroup
@@ -189,12 +191,20 @@ class ExpDataSubMenu(PersistentMenu):
         self._logic = logic
         self._control_region = control_region
 
+        self.setToolTipsVisible(True)
+
         for character_name in self._logic.to_character_register().get_character_names(is_include_empty_name = True):
             if character_name == logic.get_character_name():
                 self.setTitle("Character: " + _to_description_name(character_name))
 
             action = QAction(_to_description_name(character_name), self)
             action.triggered.connect(self._switch_character)
+
+            # from manifest, so exp data of character isn't loaded
+            summary = self._logic.to_character_register().get_summary(character_name)
+            if summary is not None and summary.number_of_entries > 0:
+                action.setToolTip(f"Level {summary.level}, last measured {_datetime.fromtimestamp(summary.time_).strftime('%Y-%m-%d %H:%M')}, {summary.number_of_entries} entries")
+
             self.addAction(action)
 
         self._separator = self.addSeparator()
@@ -276,7 +286,7 @@ class ExpDataSubMenu(PersistentMenu):
                 if character_name == self._logic.get_character_name():
                     self._switch_character_by_character_name("")
 
-                self._logic.to_character_register().destroy_character(character_name)
+                self._logic.destroy_character(character_name)
 
     def _switch_character(self):
         action : QAction = self.sender() # type: ignore[annotation-unchecked]
@@ -297,6 +307,7 @@ class Menu(QMenu):
     _clear_log_file_action      : QAction
     _open_data_folder_action    : QAction
     _hide_action                : QAction
+    _auto_measure_action        : QAction
     _enable_debug_action        : QAction
     _quit_action                : QAction
     _close_menu_action          : QAction
@@ -351,6 +362,16 @@ class Menu(QMenu):
         self._hide_action.triggered.connect(hide_overlay)
         self.addAction(self._hide_action)
 
+        self._auto_measure_action = QAction("Auto Measure", self, checkable = True) # type: ignore
+        self._auto_measure_action.setChecked(self._logic.to_settings().get_bool("is_auto_measure"))
+        def enable_auto_measure(is_enable):
+            self._logic.to_settings().set_bool("is_auto_measure", is_enable)
+            self._control_region.enable_auto_measure(is_enable)
+            self.setWindowFlags(self._flags_backup)
+
+        self._auto_measure_action.triggered.connect(enable_auto_measure)
+        self.addAction(self._auto_measure_action)
+
         self._enable_debug_action = QAction("Enable Debug", self, checkable = True) # type: ignore
         self._enable_debug_action.setChecked(self._logic.to_settings().get_bool("_is_debug"))
         def enable_debug(is_enable):
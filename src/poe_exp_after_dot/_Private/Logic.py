@@ -1,89 +1,38 @@
-import re       as _re
 import logging  as _logging
 import numpy    as _numpy
-import cv2      as _cv2
-import sys      as _sys
-import easyocr  as _easyocr # type: ignore
-import io       as _io
-import faulthandler as _faulthandler
-
-from typing         import Any, AnyStr as _AnyStr
-from dataclasses    import dataclass
+
+from typing         import Any
 from time           import time as _get_time_since_epoch
-from PIL            import ImageGrab as _ImageGrab
-from contextlib     import redirect_stdout as _redirect_stdout, redirect_stderr as _redirect_stderr
-from typing         import Callable as _Callable
 
 from PySide6.QtWidgets  import QWidget
 
 from .Commons           import EXIT_FAILURE, EXIT_SUCCESS, time_unit_to_short, character_name_to_log_name
-from .FineFormatters    import FineBareLevel, FineExp, FineExpPerHour, FinePercent, FineTime
+from .FineFormatters    import FineBareLevel, FineExp, FineExpPerHour, FinePercent, FineTime, FineStageTime, SECONDS_IN_MINUTE, SECONDS_IN_HOUR
 from .Settings          import Settings
 from .LogManager        import to_logger
 from .CharacterRegister import CharacterRegister, Character
 from .Measurer          import Measurer
-
-
-class Point:
-    x : int
-    y : int
-
-    def __init__(self, x, y):
-        self.x = int(x)
-        self.y = int(y)
-
-    def __str__(self):
-        return f"PointI(x={self.x}, y={self.y})"
-
-
-class Polygon:
-    lb : Point
-    rb : Point
-    rt : Point
-    lt : Point
-
-    def __init__(self, data):
-        # corners
-        self.lb = Point(data[0][0], data[0][1]) # left bottom
-        self.rb = Point(data[1][0], data[1][1]) # right bottom
-        self.rt = Point(data[2][0], data[2][1]) # right top
-        self.lt = Point(data[3][0], data[3][1]) # left top
-
-    def __str__(self):
-        return f"Polygon(lb={self.lb}, rb={self.rb}, rt={self.rt}, lt={self.lt})" 
-
-
-class TextFragment:
-    text    : str
-    polygon : Polygon
-
-    def __init__(self, data):
-        self.text       = data[1]
-        self.polygon    = Polygon(data[0])
-
-    def __str__(self):
-        return f"TextFragment(text=\"{self.text}\", polygon={self.polygon})" 
-
-
-def _do_with_redirect_to_logger(do : _Callable[[], None], *, message_prefix : str = "", is_only_stdout : bool = False):
-    if is_only_stdout:
-        with _redirect_stdout(_io.StringIO()) as buffer:
-            do()
-
-        text = buffer.getvalue().rstrip("\n")
-        if text:
-            to_logger().info(f"{message_prefix}{text}")
-    else:
-        with _redirect_stdout(_io.StringIO()) as buffer, _redirect_stderr(_io.StringIO()) as error_buffer:
-            do()
-
-        text = buffer.getvalue().rstrip("\n")
-        if text:
-            to_logger().info(f"{message_prefix}{text}")
-
-        error_text = error_buffer.getvalue().rstrip("\n")
-        if error_text:
-            to_logger().error(f"{message_prefix}{error_text}")
+from .Recognizers       import Recognizer, create_recognizer
+from .ScreenCapture     import ScreenCapture, create_screen_capture
+from .MeasureWorker     import MeasureWorker
+from .AutoSaver         import AutoSaver
+from .CharacterCache    import CharacterCache, estimate_measurer_size
+from .ExpBarSampler     import ExpBarSampler
+from .StopWatch         import StageTimer
+from .Telemetry         import TelemetryLog
+from .Version           import get_version as _get_version
+
+
+# Stages of measurement, in order. Each is available in info board as '<stage_name>_ms' parameter.
+# capture       - grabbing image of in-game exp tooltip from screen (with conversion to OpenCV format)
+# cache         - looking up recognition cache
+# locate        - locating text lines (EasyOCR)
+# ocr           - reading text
+# sort          - sorting read text fragments (EasyOCR)
+# parse         - finding current exp in read text
+# recognize     - whole recognition (cache, locate, ocr, sort, parse)
+# update        - computing new entry from current exp
+STAGE_NAMES = ["capture", "cache", "locate", "ocr", "sort", "parse", "recognize", "update"]
 
 
 class Logic:
@@ -91,29 +40,46 @@ class Logic:
     _measurer               : Measurer
     _character_register     : CharacterRegister
 
-    _reader                 : _easyocr.Reader
+    _recognizer             : Recognizer
+    _screen_capture         : ScreenCapture
+    _measure_worker         : MeasureWorker
+    _last_finished_id       : int       # of measure request, which has been passed to 'finish_measure'
+    _auto_saver             : AutoSaver
+    _character_cache        : CharacterCache
+    _exp_bar_sampler        : ExpBarSampler
+    _stage_timer            : StageTimer
+    _telemetry_log          : TelemetryLog | None
     _is_fetch_failed        : bool
 
-    _current_exp_pattern    : _re.Pattern[_AnyStr]
-
     def __init__(self, settings : Settings):
         self._settings = settings
 
-        self._measurer = Measurer()
+        self._measurer = self._make_measurer()
 
-        self._reader = _easyocr.Reader(['en'], gpu = True, verbose = False, quantize = False)
-        _do_with_redirect_to_logger(self._initialize_debug_reader, message_prefix = "EasyOCR, Debug Reader: ")
+        self._stage_timer = StageTimer()
 
-        self._character_register = CharacterRegister(settings.get_str("_data_path"))
+        self._telemetry_log = None
+        if settings.get_bool("is_telemetry"):
+            self._telemetry_log = TelemetryLog(settings.get_str("_data_path") + "\\cache\\telemetry.jsonl", settings.get_int("telemetry_max_size"))
 
-        self._is_fetch_failed = False
+        self._recognizer = create_recognizer(settings)
+        self._recognizer.set_stage_timer(self._stage_timer)
+        self._screen_capture = create_screen_capture()
+        self._measure_worker = MeasureWorker(self._recognize_exp)
+        self._last_finished_id = 0
+        self._auto_saver = AutoSaver(settings.get_int("autosave_delay") / 1000)
+        self._character_cache = CharacterCache(
+            settings.get_int("character_cache_capacity"),
+            settings.get_int("character_cache_max_size"),
+            settings.get_int("session_idle_gap"),
+            self._auto_saver,
+        )
+        self._exp_bar_sampler = ExpBarSampler(settings, create_screen_capture()) # own capture, so buffer for tooltip isn't reallocated
 
-        # Common Thousands Separators: ',', '.', ' '.
-        EXP_VALUE_PATTERN_TEXT = r"(0|([1-9][0-9]{0,2})([,\. ][0-9]{3}){0,3})"
-        self._current_exp_pattern = _re.compile(fr"^.*?Current[ ]+Exp\:[ ]+({EXP_VALUE_PATTERN_TEXT})[ ]+.*$")
+        self._character_register = CharacterRegister(settings.get_str("_data_path"), settings.get_str("exp_data_storage"))
+        self._auto_saver.set_idle_job(self._character_register.prepare_save_manifest())
 
-    def _initialize_debug_reader(self):
-        self._debug_reader  = _easyocr.Reader(['en'], gpu = True, verbose = True, quantize = False)
+        self._is_fetch_failed = False
 
     def to_character_register(self):
         return self._character_register
@@ -125,6 +91,7 @@ class Logic:
         to_logger().info(f"Scanned for character data.")
 
         self.load_character()
+        self._prefetch_characters()
 
     def load_character(self):
         self._load_character()
@@ -132,18 +99,56 @@ class Logic:
         to_logger().info(f"Loaded character data of {character_name_to_log_name(self.get_character_name())}.")
 
     def switch_character(self, character_name : str):
+        """
+        Save of current character is written in background, character manifest after it. Character from cache is taken as it is, other one is loaded.
+        """
         current_character_name = self.get_character_name()
-        self._save_character()
+
+        self._auto_saver.request(self._measurer.prepare_save_exp_data(self.to_character().get_exp_data_file_name()))
+        self._character_register.update_summary(current_character_name, self._measurer)
+        self._character_cache.put(current_character_name, self._measurer)
+
         self._settings.set_str("character_name", character_name)
-        self._load_character()
+
+        measurer = self._character_cache.take(character_name)
+        if measurer is not None:
+            self._measurer = measurer
+            to_logger().debug(f"Took character data of {character_name_to_log_name(character_name)} from cache.")
+        else:
+            # other object, so cached measurer of current character isn't changed
+            self._measurer = self._make_measurer()
+            self._load_character()
 
         to_logger().info(f"Switched character data from {character_name_to_log_name(current_character_name)} to {character_name_to_log_name(self.get_character_name())}. (Switch = Save Current & Load Existing/New)")
 
+    def destroy_character(self, character_name : str):
+        """
+        Character need to be other than current one.
+        """
+        self._character_cache.discard(character_name)
+
+        # waiting saves would create files again
+        self._auto_saver.flush()
+        self._character_register.destroy_character(character_name)
+
     def save_character(self):
         self._save_character()
 
         to_logger().info(f"Saved character data of {character_name_to_log_name(self.get_character_name())}.")
 
+    def request_save(self):
+        """
+        Saves changes of exp data of current character in background, after 'autosave_delay' from settings.
+        Its summary is marked as changed, character manifest is written once auto saver goes idle.
+        Need to be called after each change of exp data. Does nothing, if autosave is disabled.
+        """
+        if self._settings.get_int("autosave_delay") > 0:
+            self._auto_saver.request(self._measurer.prepare_save_exp_data(self.to_character().get_exp_data_file_name()))
+            self._character_register.update_summary(self.get_character_name(), self._measurer)
+
+    def to_auto_saver(self) -> AutoSaver:
+        return self._auto_saver
+
     def get_character_name(self) -> str:
         """
         Returns
@@ -159,6 +164,19 @@ class Logic:
         is_just_weeks_if_cap = self._settings.get_bool("is_just_weeks_if_cap")
         is_ms_if_below_1s = self._settings.get_bool("is_ms_if_below_1s")
 
+        stage_times = {}
+        for stage_name in STAGE_NAMES:
+            statistics = self._stage_timer.get_statistics(stage_name)
+            if statistics is None:
+                stage_times[f"{stage_name}_ms"] = FineStageTime()
+            else:
+                stage_times[f"{stage_name}_ms"] = FineStageTime(statistics.p50, statistics.p95, statistics.max, value_color = "#CFCFCF", unit_color = "#9F9F9F")
+
+        self._measurer.poll_loading()
+
+        session = self._measurer.to_current_session()
+        session_index = self._measurer.get_current_session_index()
+
         return {
             "page"                  : self._measurer.get_current_entry_page(),
             "number"                : self._measurer.get_number_of_entries(),
@@ -173,6 +191,16 @@ class Logic:
             "progress_step"         : FinePercent(self._measurer.get_progress_step(), is_sign = True, integer_color = "#F8CD82", two_dig_after_dot_color = "#7FFFFF"),
             "progress_step_time"    : FineTime(self._measurer.get_progress_step_time(), max_unit = max_unit, unit_color = "#8F8F8F", never_color = "#FF4F1F", is_just_weeks_if_cap = is_just_weeks_if_cap, is_show_ms_if_below_1s = is_ms_if_below_1s),
             "exp_per_hour"          : FineExpPerHour(self._measurer.get_exp_per_hour(), value_color = "#6FFF6F", unit_color = "#9F9F9F"),
+            "exp_per_hour_5m"       : FineExpPerHour(self._measurer.get_window_exp_per_hour(5 * SECONDS_IN_MINUTE), value_color = "#6FFF6F", unit_color = "#9F9F9F"),
+            "exp_per_hour_15m"      : FineExpPerHour(self._measurer.get_window_exp_per_hour(15 * SECONDS_IN_MINUTE), value_color = "#6FFF6F", unit_color = "#9F9F9F"),
+            "exp_per_hour_1h"       : FineExpPerHour(self._measurer.get_window_exp_per_hour(SECONDS_IN_HOUR), value_color = "#6FFF6F", unit_color = "#9F9F9F"),
+            "exp_per_hour_session"  : FineExpPerHour(self._measurer.get_session_exp_per_hour(), value_color = "#6FFF6F", unit_color = "#9F9F9F"),
+
+            "session"               : session_index + 1 if session_index is not None else 0,
+            "number_of_sessions"    : self._measurer.get_number_of_sessions(),
+            "session_time"          : FineTime(session.duration if session else 0.0, max_unit = max_unit, unit_color = "#9F9F9F", never_color = "#FF4F1F", is_just_weeks_if_cap = is_just_weeks_if_cap, is_show_ms_if_below_1s = is_ms_if_below_1s),
+            "session_exp"           : FineExp(session.exp_gained if session else 0, unit_color = "#9F9F9F"),
+            "session_levels"        : session.levels_gained if session else 0,
 
             "time_to_10_percent"    : FineTime(self._measurer.get_time_to_10_percent(), max_unit = max_unit, unit_color = "#9F9F9F", never_color = "#FF4F1F", is_just_weeks_if_cap = is_just_weeks_if_cap, is_show_ms_if_below_1s = is_ms_if_below_1s),
             "time_to_next_level"    : FineTime(self._measurer.get_time_to_next_level(), max_unit = max_unit, unit_color = "#9F9F9F", never_color = "#FF4F1F", is_just_weeks_if_cap = is_just_weeks_if_cap, is_show_ms_if_below_1s = is_ms_if_below_1s),
@@ -181,6 +209,8 @@ class Logic:
             "h"                     : "#",
             "y"                     : "-",
             "nothing"               : "",
+
+            **stage_times,
         }
 
     def to_settings(self) -> Settings:
@@ -188,114 +218,227 @@ class Logic:
 
     def to_measurer(self) -> Measurer:
         return self._measurer
+
+    def to_stage_timer(self) -> StageTimer:
+        return self._stage_timer
         
     def measure(self, cursor_x_in_screen : int, cursor_y_in_screen : int, widgets_to_hide : list[QWidget]):
+        """
+        Measures synchronously.
+        """
         time_ = _get_time_since_epoch()
 
         current_exp = self._fetch_exp(cursor_x_in_screen, cursor_y_in_screen, widgets_to_hide)
 
+        self._apply_measure(current_exp, time_)
+
+    def request_measure(self, cursor_x_in_screen : int, cursor_y_in_screen : int, widgets_to_hide : list[QWidget]) -> int:
+        """
+        Grabs image of in-game exp tooltip immediately, but recognizes current exp in measure worker thread.
+        Result is delivered by 'measured' signal of measure worker and need to be passed to 'finish_measure'.
+
+        Returns
+            Id of measure request.
+        """
+        time_ = _get_time_since_epoch()
+
+        image, capture_duration = self._grab_in_game_exp_tooltip_image(cursor_x_in_screen, cursor_y_in_screen, widgets_to_hide)
+
+        # copy, because buffer of image is reused by next grab
+        return self._measure_worker.request(image.copy(), time_, capture_duration)
+
+    def finish_measure(self, request_id : int, current_exp : int | None, time_ : float, exception : BaseException | None) -> bool:
+        """
+        Parameters are same as in 'measured' signal of measure worker.
+
+        Returns
+            True    - If measurement has been applied.
+            False   - If measurement is stale (newer measure request has been made) and has been dropped.
+
+        Raises
+            Exception which occurred in measure worker thread.
+        """
+        self._last_finished_id = max(self._last_finished_id, request_id)
+
+        if exception is not None:
+            raise exception
+
+        if request_id != self._measure_worker.get_last_request_id():
+            to_logger().debug(f"Dropped stale measurement. ({request_id=})")
+            return False
+
+        self._apply_measure(current_exp, time_)
+        return True
+
+    def is_measuring(self) -> bool:
+        """
+        Returns
+            True    - If result of last measure request hasn't been passed to 'finish_measure' yet.
+        """
+        return self._last_finished_id < self._measure_worker.get_last_request_id()
+
+    def is_exp_bar_changed(self) -> bool:
+        """
+        Cheap check, which doesn't recognize anything. Grabs only in-game exp bar.
+
+        Returns
+            True    - If fill of in-game exp bar has changed by at least one pixel since last check.
+        """
+        return self._exp_bar_sampler.is_changed()
+
+    def invalidate_exp_bar_reference(self):
+        """
+        Next check of in-game exp bar only takes new reference. 
+        Need to be called when anything drawn over in-game exp bar changes.
+        """
+        self._exp_bar_sampler.invalidate()
+
+    def to_measure_worker(self) -> MeasureWorker:
+        return self._measure_worker
+
+    def close(self):
+        """
+        Stops measure worker and auto saver (waiting saves are finished) and releases screen captures.
+        """
+        self._measure_worker.stop()
+        self._character_cache.close()
+        self._auto_saver.stop()
+        self._screen_capture.close()
+        self._exp_bar_sampler.close()
+
+    def is_fetch_failed(self) -> bool:
+        return self._is_fetch_failed
+
+    def _apply_measure(self, current_exp : int | None, time_ : float):
         if current_exp is None:
             self._is_fetch_failed = True
         else:
-            self._measurer.update(current_exp, time_)
+            with self._stage_timer.measure("update"):
+                self._measurer.update(current_exp, time_)
             self._is_fetch_failed = False
 
-    def is_fetch_failed(self) -> bool:
-        return self._is_fetch_failed
+            if not self._measurer.is_update_fail():
+                self.request_save()
     
+    def _make_measurer(self) -> Measurer:
+        measurer = Measurer()
+        measurer.set_session_idle_gap(self._settings.get_int("session_idle_gap"))
+        return measurer
+
+    def _prefetch_characters(self):
+        """
+        Loads characters measured most recently (according to summaries from manifest) in background, within limits of cache.
+        """
+        current_character_name = self.get_character_name()
+
+        summaries = []
+        for character_name in self._character_register.get_character_names(is_include_empty_name = True):
+            summary = self._character_register.get_summary(character_name)
+            if character_name != current_character_name and summary is not None and summary.number_of_entries > 0:
+                summaries.append((character_name, summary))
+        summaries.sort(key = lambda item: item[1].time_, reverse = True)
+
+        remaining_size = self._settings.get_int("character_cache_max_size")
+        for character_name, summary in summaries[:self._settings.get_int("character_cache_capacity")]:
+            size = estimate_measurer_size(summary.number_of_entries)
+            if size > remaining_size:
+                continue
+            remaining_size -= size
+
+            self._character_cache.prefetch(character_name, self._character_register.to_character(character_name).get_exp_data_file_name())
+
     def _load_character(self):
         character = self._character_register.to_character(self.get_character_name())
-        self._measurer.load_exp_data(character.get_exp_data_file_name())
+
+        # save of this character might still be waiting, if it was evicted from cache
+        if self._auto_saver.is_saving(character.get_exp_data_file_name()):
+            self._auto_saver.flush()
+
+        self._measurer.load_exp_data(character.get_exp_data_file_name(), tail_size = self._settings.get_int("exp_data_tail_size"), is_background = True)
 
     def _save_character(self):
+        # background saves of current character need to be written first, the rest is small
+        self._auto_saver.flush()
         self._measurer.save_exp_data(self.to_character().get_exp_data_file_name())
 
+        self._character_register.update_summary(self.get_character_name(), self._measurer)
+        try:
+            self._character_register.prepare_save_manifest().run()
+        except OSError as exception:
+            to_logger().warning(f"Can't save character manifest. {str(exception)}")
+
     def _fetch_exp(self, cursor_x_in_screen : int, cursor_y_in_screen: int, widgets_to_hide : list[QWidget]) -> int | None:
         """
         Returns
             Current experience.
         """
-        for widget in widgets_to_hide:
-            widget.hide()
+        in_game_exp_tooltip_image, capture_duration = self._grab_in_game_exp_tooltip_image(cursor_x_in_screen, cursor_y_in_screen, widgets_to_hide)
 
-        if to_logger().isEnabledFor(_logging.DEBUG):
-            to_logger().debug(f"Getting image of screen.")
-
-        screenshot = _ImageGrab.grab()
-
-        for widget in widgets_to_hide:
-            widget.show()
+        return self._recognize_exp(in_game_exp_tooltip_image, capture_duration)
 
+    def _grab_in_game_exp_tooltip_image(self, cursor_x_in_screen : int, cursor_y_in_screen: int, widgets_to_hide : list[QWidget]) -> tuple[_numpy.ndarray, float]:
+        """
+        Returns
+            Image in OpenCV format (its buffer is reused by next grab) and time taken by grabbing it, in seconds.
+        """
         left    = cursor_x_in_screen + self._settings.get_int("_solved_layout.in_game_exp_tooltip_x_offset")
         top     = self._settings.get_int("_solved_layout.in_game_exp_tooltip_y")
         width   = self._settings.get_int("_solved_layout.in_game_exp_tooltip_width")
         height  = self._settings.get_int("_solved_layout.in_game_exp_tooltip_height")
 
-        if to_logger().isEnabledFor(_logging.DEBUG):
-            to_logger().debug(f"Cropping image of screen to region where in-game exp tooltip should be. ({left=}, {top=}, {width=}, {height=})")
-
-        in_game_exp_tooltip_image_tmp = screenshot.crop((
-            left,
-            top,
-            left + width,
-            top + height,
-        ))
-        
-        in_game_exp_tooltip_image = _cv2.cvtColor(_numpy.array(in_game_exp_tooltip_image_tmp), _cv2.COLOR_RGB2BGR) # converts image from Pillow format to OpenCV format
-        
-        if self._settings.get_bool("_is_debug"):
-            to_logger().debug(f"Reading text of in-game exp tooltip...")
-
-            if _sys.stdout:
-                # When running by 'start pyw', then there is no 'stderr'.
-                _faulthandler.enable()
-
-            text_fragments = []
-            def do():
-                text_raw_fragments = self._debug_reader.readtext(in_game_exp_tooltip_image)
-
-                text_fragments.extend([TextFragment(text_raw_fragment) for text_raw_fragment in text_raw_fragments])
-            _do_with_redirect_to_logger(do, message_prefix = "EasyOCR, Reading Text: ", is_only_stdout = _faulthandler.is_enabled())
-
-            if _faulthandler.is_enabled():
-                _faulthandler.disable()
-
-            to_logger().debug(f"Text of in-game exp tooltip has been read.") 
-        else:
-            text_fragments = [TextFragment(text_fragment) for text_fragment in self._reader.readtext(in_game_exp_tooltip_image)]
+        for widget in widgets_to_hide:
+            widget.hide()
 
-        min_text_height = in_game_exp_tooltip_image.shape[0] 
-        
-        # used to fix little misalignment on Y axis 
-        for text_fragment in text_fragments:
-            min_text_height = min(text_fragment.polygon.lt.y - text_fragment.polygon.lb.y, min_text_height)
+        if to_logger().isEnabledFor(_logging.DEBUG):
+            to_logger().debug(f"Getting image of region of screen where in-game exp tooltip should be. ({left=}, {top=}, {width=}, {height=})")
 
-        width = in_game_exp_tooltip_image.shape[1]
+        with self._stage_timer.collect() as durations, self._stage_timer.measure("capture"):
+            in_game_exp_tooltip_image = self._screen_capture.grab(left, top, width, height)
 
-        def extract_comparison_key(text_fragment : TextFragment):
-            p = text_fragment.polygon.lb # position of left bottom corner
-            return p.x + width * (p.y // min_text_height)
+        for widget in widgets_to_hide:
+            widget.show()
 
-        if to_logger().isEnabledFor(_logging.DEBUG):
-            to_logger().debug(f"Sorting read text fragments of in-game exp tooltip to be in correct order.")
+        return in_game_exp_tooltip_image, durations["capture"]
 
-        text_fragments.sort(key = extract_comparison_key)
+    def _recognize_exp(self, in_game_exp_tooltip_image : _numpy.ndarray, capture_duration : float) -> int | None:
+        """
+        Can be called from measure worker thread.
 
-        full_text = ""
-        for text_fragment in text_fragments:
-            full_text += text_fragment.text + " "
+        capture_duration
+            Time taken by grabbing image, in seconds. Written into telemetry with durations of recognition.
 
-        if to_logger().isEnabledFor(_logging.DEBUG):
-            to_logger().debug(f"Scanned In-Game Exp Tooltip Text: \"{full_text}\".")
-            for text_fragment in text_fragments:
-                to_logger().debug(text_fragment)
-            to_logger().debug("---")
+        Returns
+            Current experience.
+        """
+        with self._stage_timer.collect() as durations, self._stage_timer.measure("recognize"):
+            total_exp = self._recognizer.recognize_exp(in_game_exp_tooltip_image)
 
+        self._write_telemetry(in_game_exp_tooltip_image, total_exp is not None, {"capture" : capture_duration, **durations})
 
-        match_ = self._current_exp_pattern.search(full_text)
-        if match_:
-            return int(match_.group(1).replace(",", "").replace(".", "").replace(" ", ""))
+        if total_exp is not None:
+            return total_exp
         
-        to_logger().error(f"Can't find current exp amount in In-Game Exp Tooltip. Scanned Text: \"{full_text}\".")
+        to_logger().error(f"Can't find current exp amount in In-Game Exp Tooltip. Scanned Text: \"{self._recognizer.get_last_text()}\".")
 
         return None
+
+    def _write_telemetry(self, in_game_exp_tooltip_image : _numpy.ndarray, is_success : bool, durations : dict[str, float]):
+        """
+        Can be called from measure worker thread.
+
+        durations
+            Durations of capture and recognition stages, in seconds.
+        """
+        if self._telemetry_log is None:
+            return
+
+        self._telemetry_log.append({
+            "time"          : _get_time_since_epoch(),
+            "version"       : _get_version(),
+            "engine"        : self._recognizer.get_name(),
+            "layout"        : self._settings.get_str("selected_layout_name"),
+            "width"         : in_game_exp_tooltip_image.shape[1],
+            "height"        : in_game_exp_tooltip_image.shape[0],
+            "is_success"    : is_success,
+            "stages"        : {stage_name : round(duration * 1000, 3) for stage_name, duration in durations.items()}, # in milliseconds
+        })
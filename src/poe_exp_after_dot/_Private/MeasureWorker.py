@@ -0,0 +1,133 @@
+import threading as _threading
+import numpy     as _numpy
+
+from typing import Callable
+
+from PySide6.QtCore import QObject, Signal
+
+from .LogManager import to_logger
+
+
+RecognizeFunction = Callable[[_numpy.ndarray, float], int | None] # image, capture_duration
+
+
+class _MeasureRequest:
+    request_id          : int
+    image               : _numpy.ndarray
+    time_               : float
+    capture_duration    : float
+
+    def __init__(self, request_id : int, image : _numpy.ndarray, time_ : float, capture_duration : float):
+        self.request_id         = request_id
+        self.image              = image
+        self.time_              = time_
+        self.capture_duration   = capture_duration
+
+
+class MeasureWorker(QObject):
+    """
+    Recognizes current exp from images of in-game exp tooltip in dedicated thread.
+    Results are posted back through 'measured' signal, which is delivered in thread of this object (GUI thread).
+
+    Only one request waits for processing. New request replaces waiting one.
+    """
+    measured = Signal(int, object, float, object) # request_id, total_exp : int | None, time_, exception : BaseException | None
+
+    _recognize          : RecognizeFunction
+    _condition          : _threading.Condition
+    _pending            : _MeasureRequest | None
+    _is_busy            : bool
+    _is_stopped         : bool
+    _last_request_id    : int
+    _thread             : _threading.Thread
+
+    def __init__(self, recognize : RecognizeFunction):
+        super().__init__()
+
+        self._recognize         = recognize
+        self._condition         = _threading.Condition()
+        self._pending           = None
+        self._is_busy           = False
+        self._is_stopped        = False
+        self._last_request_id   = 0
+
+        self._thread = _threading.Thread(target = self._run, name = "Measure Worker", daemon = True)
+        self._thread.start()
+
+    def request(self, image : _numpy.ndarray, time_ : float, capture_duration : float = 0.0) -> int:
+        """
+        image
+            Image of in-game exp tooltip. Is not copied.
+        time_
+            Time of measurement. In seconds. Since epoch.
+        capture_duration
+            Time taken by grabbing image. In seconds. Passed to recognize function with image.
+
+        Returns
+            Id of request. Id of newer request is always greater.
+        """
+        with self._condition:
+            self._last_request_id += 1
+
+            if self._pending is not None:
+                to_logger().debug(f"Measure request {self._pending.request_id} has been replaced by newer one.")
+
+            self._pending = _MeasureRequest(self._last_request_id, image, time_, capture_duration)
+            self._condition.notify()
+
+            return self._last_request_id
+
+    def get_last_request_id(self) -> int:
+        with self._condition:
+            return self._last_request_id
+
+    def is_busy(self) -> bool:
+        """
+        Returns
+            True    - If any request is waiting or being processed.
+        """
+        with self._condition:
+            return self._is_busy or self._pending is not None
+
+    def stop(self):
+        """
+        Waits until currently processed request is finished. Waiting request is dropped.
+        """
+        with self._condition:
+            self._is_stopped = True
+            self._pending = None
+            self._condition.notify()
+
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._is_stopped:
+                    self._condition.wait()
+
+                if self._is_stopped:
+                    return
+
+                request = self._pending
+                self._pending = None
+                self._is_busy = True
+
+            total_exp : int | None = None
+            exception : BaseException | None = None
+
+            try:
+                total_exp = self._recognize(request.image, request.capture_duration) # type: ignore[union-attr]
+            except Exception as exception_:
+                exception = exception_
+
+            with self._condition:
+                if self._is_stopped:
+                    self._is_busy = False
+                    return
+
+            self.measured.emit(request.request_id, total_exp, request.time_, exception) # type: ignore[union-attr]
+
+            # after emit, so result on its way counts as busy
+            with self._condition:
+                self._is_busy = False
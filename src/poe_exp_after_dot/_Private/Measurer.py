@@ -1,13 +1,22 @@
 
-import json as _json
+import os       as _os
+import json     as _json
+import logging  as _logging
+import bisect   as _bisect
+import operator as _operator
+import sqlite3  as _sqlite3
+import numpy    as _numpy
 
 from datetime           import datetime as _datetime
-from typing             import Any
-from dataclasses        import dataclass
+from concurrent.futures import Future as _Future, ThreadPoolExecutor as _ThreadPoolExecutor
+from functools          import partial as _partial
+from typing             import Any, Callable, cast as _cast
+from dataclasses        import dataclass, fields as _dataclass_fields
 
 from .FineFormatters    import SECONDS_IN_DAY, SECONDS_IN_HOUR, SECONDS_IN_MINUTE, SECONDS_IN_WEEK
 from .LogManager        import to_logger
 from .ExpThresholdInfo  import ExpThresholdInfo, EXP_THRESHOLD_INFO_TABLE
+from .ExpDataDatabase   import ExpDataDatabase, is_exp_data_database, read_exp_data_database_rows
 
 
 def _float_to_proper_value(value : float) -> float | str:
@@ -18,8 +27,12 @@ def _float_to_proper_value(value : float) -> float | str:
     return value
 
 
-@dataclass
+@dataclass(slots = True)
 class Entry:
+    """
+    Slotted, because register can hold many entries.
+    Field 'info' refers to row of 'EXP_THRESHOLD_INFO_TABLE', which is shared.
+    """
     total_exp               : int
     info                    : ExpThresholdInfo
     time_                   : float     # since epoch, in seconds
@@ -85,77 +98,976 @@ class Entry:
         )
 
 
+_JOURNAL_COMPACTION_THRESHOLD = 1000 # number of records in journal file, above which 'save' rewrites whole exp data file
+
+
+def get_journal_file_name(exp_data_file_name : str) -> str:
+    """
+    Returns
+        Name of journal file, which belongs to exp data file. For example: "exp_data.json" -> "exp_data.journal".
+    """
+    return _os.path.splitext(exp_data_file_name)[0] + ".journal"
+
+
+# Compact form of entry kept by register. Values are in same order as fields of 'Entry'.
+_Row = tuple[int, ExpThresholdInfo, float, bool, bool, float, int, float, int, float, int, float, float]
+
+_to_row_total_exp   = _operator.itemgetter(0)
+_to_row_info        = _operator.itemgetter(1)
+_to_row_time        = _operator.itemgetter(2)
+
+DEFAULT_SESSION_IDLE_GAP = 30 * SECONDS_IN_MINUTE # in seconds
+
+
+def _entry_to_row(entry : Entry) -> _Row:
+    return (
+        entry.total_exp, entry.info, entry.time_, entry.is_other_level, entry.is_gained_level,
+        entry.progress, entry.progress_in_exp, entry.progress_step, entry.progress_step_in_exp,
+        entry.progress_step_time, entry.exp_per_hour, entry.time_to_10_percent, entry.time_to_next_level,
+    )
+
+
+def _to_row_level(row : _Row) -> int:
+    return row[1].level
+
+
+_HEAD_PARSE_CHUNK_SIZE = 256 * 1024 # in bytes, parsed at once, so background thread gives up GIL between chunks
+
+_head_loader = _ThreadPoolExecutor(1, thread_name_prefix = "ExpDataHeadLoader")
+
+
+def _parse_entries(text : bytes) -> list[_Row]:
+    """
+    text
+        Entries in JSON, separated by commas.
+    """
+    return [_entry_to_row(Entry.from_dict(entry)) for entry in _json.loads(b"[" + text + b"]")]
+
+
+def _parse_head(exp_data : bytes, end : int) -> list[_Row]:
+    """
+    end
+        Position of separator after last entry of head, in exp data file saved in one entry per line format.
+    """
+    rows = []
+
+    begin = 2 # after "[\n"
+    while begin < end:
+        chunk_end = exp_data.find(b",\n", min(begin + _HEAD_PARSE_CHUNK_SIZE, end), end + 2)
+        rows.extend(_parse_entries(exp_data[begin:chunk_end]))
+        begin = chunk_end + 2
+
+    return rows
+
+
+def _export_rows(rows : list[_Row | None], number_of_unloaded : int, head_data : tuple[bytes, int] | None) -> str:
+    """
+    number_of_unloaded
+        Number of first rows, which aren't loaded (None). Their text is taken from 'head_data' as it is.
+    """
+    lines = [_json.dumps(Entry(*row).to_dict()) for row in _cast(list[_Row], rows[number_of_unloaded:])]
+
+    if number_of_unloaded > 0:
+        exp_data, end = head_data # type: ignore[misc]
+        lines.insert(0, exp_data[2:end].decode())
+
+    if not lines:
+        return "[]"
+
+    return "[\n" + ",\n".join(lines) + "\n]"
+
+
+class SaveJob:
+    """
+    Writes changes taken by 'Register.prepare_save'. Doesn't touch register, so it can be run in any thread.
+    """
+    _file_name  : str
+    _is_failed  : bool
+
+    def __init__(self, file_name : str):
+        self._file_name = file_name
+        self._is_failed = False
+
+    def get_file_name(self) -> str:
+        return self._file_name
+
+    def is_failed(self) -> bool:
+        return self._is_failed
+
+    def run(self):
+        """
+        Raises
+            OSError         - When files can't be written.
+            sqlite3.Error   - When database can't be written.
+        """
+        try:
+            self._write()
+        except (OSError, _sqlite3.Error):
+            self._is_failed = True
+            raise
+
+    def absorb(self, older : "SaveJob") -> bool:
+        """
+        Takes over changes of older job, which writes into same file and hasn't been run yet, so only this job needs to be run.
+
+        Returns
+            True    - If older job has been absorbed and can be dropped.
+        """
+        return False
+
+    def _write(self):
+        raise NotImplementedError("This method need to be overridden.")
+
+
+class _JournalSaveJob(SaveJob):
+    """
+    Journal file is only appended to (record cut by kill is skipped when loading).
+    """
+    _records : list[str]
+
+    def __init__(self, file_name : str, records : list[str]):
+        super().__init__(file_name)
+
+        self._records = records
+
+    def absorb(self, older : SaveJob) -> bool:
+        if not isinstance(older, _JournalSaveJob):
+            return False
+
+        self._records = older._records + self._records
+        return True
+
+    def _write(self):
+        if self._records:
+            with open(get_journal_file_name(self._file_name), "a") as file:
+                file.write("".join(record + "\n" for record in self._records))
+
+
+class _CompactSaveJob(SaveJob):
+    """
+    Whole exp data file is written into temporary file, which then replaces it, so it's never left half-written.
+    """
+    _rows               : list[_Row | None]
+    _number_of_unloaded : int
+    _head_data          : tuple[bytes, int] | None
+
+    def __init__(self, file_name : str, rows : list[_Row | None], number_of_unloaded : int, head_data : tuple[bytes, int] | None):
+        super().__init__(file_name)
+
+        self._rows                  = rows
+        self._number_of_unloaded    = number_of_unloaded
+        self._head_data             = head_data
+
+    def absorb(self, older : SaveJob) -> bool:
+        # whole file is rewritten anyway
+        return isinstance(older, (_JournalSaveJob, _CompactSaveJob))
+
+    def _write(self):
+        temporary_file_name = self._file_name + ".tmp"
+        with open(temporary_file_name, "w") as file:
+            file.write(_export_rows(self._rows, self._number_of_unloaded, self._head_data))
+        _os.replace(temporary_file_name, self._file_name)
+
+        journal_file_name = get_journal_file_name(self._file_name)
+        if _os.path.isfile(journal_file_name):
+            _os.remove(journal_file_name)
+
+
+class _DatabaseSaveJob(SaveJob):
+    """
+    Changes are written in one transaction.
+    """
+    _position   : int | None    # of first changed entry, None - no changes
+    _rows       : list[_Row]    # from position
+
+    def __init__(self, file_name : str, position : int | None, rows : list[_Row]):
+        super().__init__(file_name)
+
+        self._position  = position
+        self._rows      = rows
+
+    def absorb(self, older : SaveJob) -> bool:
+        if not isinstance(older, _DatabaseSaveJob):
+            return False
+
+        if older._position is not None:
+            if self._position is None:
+                self._position  = older._position
+                self._rows      = older._rows
+            elif older._position < self._position:
+                # older rows up to position of this job are still valid
+                self._rows      = older._rows[:self._position - older._position] + self._rows
+                self._position  = older._position
+
+        return True
+
+    def _write(self):
+        if self._position is not None:
+            with ExpDataDatabase(self._file_name) as database:
+                database.replace_changed(self._position, self._rows)
+
+
+class Session:
+    """
+    Range of entries without idle gap between them. Values are computed from first and last entry of range.
+    """
+    begin           : int       # index of first entry
+    end             : int       # index of last entry
+    begin_time      : float     # since epoch, in seconds
+    duration        : float     # in seconds
+    exp_gained      : int
+    levels_gained   : int
+    exp_per_hour    : int       # 0 - if session has no duration
+
+    def __init__(self, begin : int, end : int, first : _Row, last : _Row):
+        self.begin          = begin
+        self.end            = end
+        self.begin_time     = _to_row_time(first)
+        self.duration       = _to_row_time(last) - _to_row_time(first)
+        self.exp_gained     = _to_row_total_exp(last) - _to_row_total_exp(first)
+        self.levels_gained  = _to_row_info(last).level - _to_row_info(first).level
+        self.exp_per_hour   = int(self.exp_gained * SECONDS_IN_HOUR / self.duration) if self.duration > 0 else 0
+
+
 class Register:
-    _entries    : list[Entry]
-    _index      : int           # -1 - before first, no entry
+    """
+    Entries are kept in compact form (tuples) in one list, which is only appended to and cut in place.
+    'Entry' objects are made only when they are asked for.
+
+    Total exp and time of entries are running sums of gained exp and elapsed time, so exp per hour over any
+    range of entries is difference of two rows. Entries are in order of time, so range is found by bisection.
+
+    Entries are split into sessions, where time between two entries is longer than idle gap.
+    Beginnings of sessions are kept in sorted list, which is updated with entries, so no history is rescanned.
+
+    Exp data is stored in two files (unless it's stored in database, see below):
+    exp data file   - JSON list of entries (snapshot). Can be read by anything, which reads JSON.
+    journal file    - Changes made after snapshot was written. One JSON record per line:
+                        {"add": <position>, "entry": <entry>}   - entries are cut to <position>, then entry is appended
+                        {"cut": <position>}                     - entries are cut to <position>
+
+    'save' only appends records of changes to journal file.
+    When journal file gets too long (or register is saved to other file), whole exp data file is rewritten
+    and journal file is removed (compaction).
+
+    Exp data file can be loaded tail first: only newest entries are parsed, older ones (head) are kept as None
+    until they are needed (by navigation, export, search beyond loaded entries) or until they are parsed in background.
+    Until then, session, which began before loaded entries, is counted from first loaded entry.
+
+    Exp data file with '.db' extension is SQLite database (see 'ExpDataDatabase'). 'save' writes changed entries
+    into it in one transaction, there is no journal file. Tail is read by position, head is read the same way as from JSON.
+    """
+    _rows                       : list[_Row | None] # first '_number_of_unloaded' rows are None, until head is loaded
+    _index                      : int           # -1 - before first, no entry
+    _current                    : Entry | None  # made from row at '_index', None - not made yet
+    _session_begins             : list[int]     # index of first entry of each session, in order
+    _session_idle_gap           : float         # in seconds
+
+    _number_of_unloaded         : int                       # entries of head
+    _head_data                  : tuple[bytes, int] | None  # exp data file and end of head in it, None - head is loaded or in database
+    _head_reader                : Callable[[], list[_Row]] | None # returns rows of head, None - head is loaded
+    _head_future                : _Future | None            # result: rows of head, None - not parsed in background
+
+    _file_name                  : str | None    # exp data file, which is in sync with register (except unsaved changes), None - not any
+    _last_save_job              : "SaveJob | None"
+    _unsaved_from               : int | None    # position of first entry changed since last load or save, None - no changes
+    _number_of_journal_records  : int           # in journal file of '_file_name'
 
     def __init__(self):
-        self._entries = []
-        self._index = -1
+        self._rows          = []
+        self._index         = -1
+        self._current       = None
+
+        self._session_begins    = []
+        self._session_idle_gap  = DEFAULT_SESSION_IDLE_GAP
 
-    def load(self, file_name : str):
-        with open(file_name, "r") as file:
-            self.load_from_str(file.read())
+        self._number_of_unloaded    = 0
+        self._head_data             = None
+        self._head_reader           = None
+        self._head_future           = None
+
+        self._file_name                 = None
+        self._last_save_job             = None
+        self._unsaved_from              = None
+        self._number_of_journal_records = 0
+
+    def load(self, file_name : str, *, tail_size : int = 0, is_background = False):
+        """
+        Loads exp data file and replays its journal file, if there is any.
+
+        Raises
+            OSError         - When exp data file can't be read.
+            sqlite3.Error   - When database can't be read.
+
+        tail_size
+            Number of newest entries, which are loaded immediately. 0 - all entries.
+            Exp data files not saved in one entry per line format, are always loaded whole.
+        is_background
+            True    - Older entries are parsed in background thread. See 'poll_loading'.
+            False   - Older entries are parsed when they're needed.
+        """
+        if is_exp_data_database(file_name):
+            self._load_database(file_name, tail_size, is_background)
+            return
+
+        with open(file_name, "rb") as file:
+            exp_data = file.read()
+
+        if tail_size <= 0 or not self._load_tail(exp_data, tail_size, is_background):
+            self.load_from_str(exp_data.decode())
+
+        number_of_journal_records = self._replay_journal(get_journal_file_name(file_name))
+
+        # malformed journal can't be appended to, so next save rewrites whole exp data file
+        self._number_of_journal_records = number_of_journal_records if number_of_journal_records is not None else 0
+        self._file_name                 = file_name if number_of_journal_records is not None else None
 
     def save(self, file_name : str):
         """
-        file_name : None
-            Uses last used name either by 'load', 'save' or 'switch'.
+        Appends changes made since last load or save to journal file (or writes them into database).
+        Rewrites whole exp data file instead, if it's other file than last loaded/saved one, or if journal file is too long.
+        """
+        self.prepare_save(file_name).run()
+
+    def compact(self, file_name : str):
+        """
+        Rewrites whole exp data file and removes its journal file.
+        """
+        self.prepare_save(file_name, is_compact = True).run()
+
+    def prepare_save(self, file_name : str, *, is_compact = False) -> "SaveJob":
+        """
+        Takes changes made since last load or save (or whole exp data), so they can be written by returned job in any thread.
+        Register is treated as saved. If job fails, next save rewrites whole exp data file.
+
+        is_compact
+            True    - Whole exp data file is rewritten, even when changes could be appended to journal file.
+        """
+        # files are in unknown state
+        if self._last_save_job is not None and self._last_save_job.is_failed():
+            self._file_name = None
+
+        job : SaveJob
+
+        if is_exp_data_database(file_name):
+            job = self._prepare_database_save(file_name, is_compact)
+        else:
+            records = self._make_unsaved_records()
+
+            if is_compact or file_name != self._file_name or (self._number_of_journal_records + len(records)) > _JOURNAL_COMPACTION_THRESHOLD:
+                # head read from database has no text
+                if self._head_data is None:
+                    self._load_head()
+
+                # rows are copied, because register changes them in place
+                job = _CompactSaveJob(file_name, list(self._rows), self._number_of_unloaded, self._head_data)
+
+                self._file_name                 = file_name
+                self._number_of_journal_records = 0
+            else:
+                job = _JournalSaveJob(file_name, records)
+
+                self._number_of_journal_records += len(records)
+
+        self._unsaved_from  = None
+        self._last_save_job = job
+
+        return job
+
+    def _prepare_database_save(self, file_name : str, is_compact : bool) -> SaveJob:
+        if is_compact or file_name != self._file_name:
+            self._file_name                 = file_name
+            self._number_of_journal_records = 0
+
+            return _DatabaseSaveJob(file_name, 0, self._to_loaded_rows())
+
+        if self._unsaved_from is None:
+            return _DatabaseSaveJob(file_name, None, [])
+
+        return _DatabaseSaveJob(file_name, self._unsaved_from, self._to_loaded_rows(self._unsaved_from))
+
+    def _load_database(self, file_name : str, tail_size : int, is_background : bool):
+        with ExpDataDatabase(file_name) as database:
+            number_of_entries = database.get_number_of_entries()
+            split = max(number_of_entries - tail_size, 0) if tail_size > 0 else 0
+            tail_rows = database.read_rows(split)
+
+        self._discard_head()
+        self._number_of_unloaded = split
+        self._rows = [None] * split + tail_rows
+
+        if split > 0:
+            self._head_reader = _partial(read_exp_data_database_rows, file_name, 0, split)
+            if is_background:
+                self._head_future = _head_loader.submit(self._head_reader)
+
+        self._index     = len(self._rows) - 1
+        self._current   = None
+        self._rebuild_session_begins()
+
+        self._file_name                 = file_name
+        self._unsaved_from              = None
+        self._number_of_journal_records = 0
+
+    def _load_tail(self, exp_data : bytes, tail_size : int, is_background : bool) -> bool:
+        """
+        Returns
+            True    - If tail has been loaded.
+            False   - If exp data isn't in one entry per line format, or it has no more entries than tail size.
+        """
+        # Other formats start and end the same way (for example, indented JSON, with ",\n" inside each entry),
+        # but their lines don't start with "{" and don't end with "}".
+        if not (exp_data.startswith(b"[\n{") and exp_data.endswith(b"}\n]")):
+            return False
+
+        # "[\n<entry>,\n<entry>,\n...<entry>\n]", head is parsed later
+        split = len(exp_data) - 2
+        for _ in range(tail_size):
+            split = exp_data.rfind(b",\n", 2, split)
+            if split < 0:
+                return False
+            if exp_data[split - 1:split] != b"}" or exp_data[split + 2:split + 3] != b"{":
+                return False
+
+        try:
+            tail_rows = _parse_entries(exp_data[split + 2:-2])
+        except (ValueError, KeyError, TypeError) as exception:
+            to_logger().warning(f"Can't load tail of exp data separately, whole exp data is loaded. {str(exception)}")
+            return False
+
+        self._discard_head()
+        self._number_of_unloaded = exp_data.count(b",\n", 2, split) + 1
+        self._rows = [None] * self._number_of_unloaded + tail_rows
+
+        self._head_data     = (exp_data, split)
+        self._head_reader   = _partial(_parse_head, exp_data, split)
+        if is_background:
+            self._head_future = _head_loader.submit(self._head_reader)
+
+        self._index     = len(self._rows) - 1
+        self._current   = None
+        self._rebuild_session_begins()
+
+        self._file_name                 = None
+        self._unsaved_from              = None
+        self._number_of_journal_records = 0
+
+        return True
+
+    def is_loaded(self) -> bool:
+        """
+        Returns
+            True    - If all entries are loaded.
+        """
+        return self._number_of_unloaded == 0
+
+    def load_all(self):
+        """
+        Loads older entries, which haven't been loaded yet. Waits for background parsing, if there is any.
+        """
+        self._load_head()
+
+    def poll_loading(self) -> bool:
+        """
+        Puts older entries into register, if they have been parsed in background.
+
+        Returns
+            True    - If all entries are loaded.
         """
-        with open(file_name, "w") as file:
-            file.write(self.export_to_str())
+        if self._head_future is not None and self._head_future.done():
+            self._load_head()
+        return self.is_loaded()
+
+    def _load_head(self):
+        if self._number_of_unloaded == 0:
+            return
+
+        if self._head_future is not None:
+            rows = self._head_future.result()
+        else:
+            rows = self._head_reader() # type: ignore[misc]
+
+        self._rows[:self._number_of_unloaded] = rows
+
+        self._number_of_unloaded    = 0
+        self._head_data             = None
+        self._head_reader           = None
+        self._head_future           = None
+
+        self._rebuild_session_begins()
+
+    def _discard_head(self):
+        if self._head_future is not None:
+            self._head_future.cancel()
+
+        self._number_of_unloaded    = 0
+        self._head_data             = None
+        self._head_reader           = None
+        self._head_future           = None
+
+    def _to_row(self, index : int) -> _Row:
+        """
+        Loads head, if row is in it.
+        """
+        if self._rows[index] is None:
+            self._load_head()
+
+        return _cast(_Row, self._rows[index])
+
+    def _to_loaded_rows(self, begin : int = 0) -> list[_Row]:
+        """
+        Returns
+            Copy of rows from 'begin'. Head is loaded, if 'begin' is in it.
+        """
+        if begin < self._number_of_unloaded:
+            self._load_head()
+
+        return _cast(list[_Row], self._rows[begin:])
 
     def load_from_str(self, exp_data_text : str):
-        self._entries = []
+        self._discard_head()
+        self._rows = [_entry_to_row(Entry.from_dict(entry)) for entry in _json.loads(exp_data_text)]
 
-        exp_data = _json.loads(exp_data_text)
-        for entry in exp_data:
-            self._entries.append(Entry.from_dict(entry))
+        self._index     = len(self._rows) - 1
+        self._current   = None
+        self._rebuild_session_begins()
 
-        self._index = len(self._entries) - 1
+        self._file_name                 = None
+        self._unsaved_from              = None
+        self._number_of_journal_records = 0
 
     def export_to_str(self) -> str:
-        exp_data = []
-        for entry in self._entries:
-            exp_data.append(entry.to_dict())
+        """
+        Returns
+            JSON list of entries, each entry in its own line.
+        """
+        # head read from database has no text
+        if self._head_data is None:
+            self._load_head()
+
+        return _export_rows(self._rows, self._number_of_unloaded, self._head_data)
+
+    def _make_unsaved_records(self) -> list[str]:
+        """
+        Returns
+            Journal records, which turn saved entries into current ones.
+        """
+        if self._unsaved_from is None:
+            return []
+
+        if self._unsaved_from < self._number_of_unloaded:
+            self._load_head()
+
+        if self._unsaved_from == len(self._rows):
+            return [_json.dumps({"cut" : self._unsaved_from})]
+
+        return [_json.dumps({"add" : position, "entry" : Entry(*self._to_row(position)).to_dict()}) for position in range(self._unsaved_from, len(self._rows))]
+
+    def _replay_journal(self, journal_file_name : str) -> int | None:
+        """
+        Returns
+            Number of records in journal file.
+            None    - If journal file is malformed. Only records before malformed one are replayed.
+        """
+        if not _os.path.isfile(journal_file_name):
+            return 0
+
+        number_of_records : int | None = 0
+
+        with open(journal_file_name, "r") as file:
+            for line_number, line in enumerate(file, 1):
+                try:
+                    record = _json.loads(line)
+
+                    position = record["add"] if "add" in record else record["cut"]
+                    if position > len(self._rows):
+                        raise ValueError(f"Position {position} is after last entry.")
+                    if position < self._number_of_unloaded:
+                        self._load_head()
+
+                    del self._rows[position:]
+                    if "add" in record:
+                        self._rows.append(_entry_to_row(Entry.from_dict(record["entry"])))
+                except (ValueError, KeyError, TypeError) as exception:
+                    # For example, last line might be cut, if application has been killed while saving.
+                    to_logger().warning(f"Skipped rest of journal \"{journal_file_name}\", because record {line_number} is malformed. {str(exception)}")
+                    number_of_records = None
+                    break
+
+                number_of_records = line_number
+
+        self._index     = len(self._rows) - 1
+        self._current   = None
+        self._rebuild_session_begins()
+
+        return number_of_records
+
+    def replace_all(self, rows : list[_Row]):
+        """
+        Replaces all entries. Last entry becomes current.
+        """
+        self._discard_head()
+        self._rows      = _cast(list[_Row | None], rows)
+        self._index     = len(self._rows) - 1
+        self._current   = None
+        self._rebuild_session_begins()
+
+        self._mark_unsaved_from(0)
+
+    def to_raw_arrays(self) -> tuple[_numpy.ndarray, _numpy.ndarray]:
+        """
+        Returns
+            Total exps (array of int64) and times (array of float64) of all entries.
+        """
+        rows = self._to_loaded_rows()
+
+        return (
+            _numpy.fromiter(map(_to_row_total_exp, rows), dtype = _numpy.int64, count = len(rows)),
+            _numpy.fromiter(map(_to_row_time, rows), dtype = _numpy.float64, count = len(rows)),
+        )
+
+    def find_index_by_time(self, time_ : float, end : int | None = None) -> int:
+        """
+        end
+            Only entries before this index are searched. None - all entries.
+
+        Returns
+            Index of first entry with time equal to or after given time.
+            'end' (or number of entries), if there is no such entry.
+        """
+        return self._bisect_left(time_, _to_row_time, end)
+
+    def find_index_by_level(self, level : int) -> int:
+        """
+        Levels of entries can go down (for example, when other character is measured), so entries are searched one by one.
+
+        Returns
+            Index of first entry at given level.
+            Number of entries, if there is no such entry.
+        """
+        self._load_head()
+
+        rows = _cast(list[_Row], self._rows)
+        return next((index for index, row in enumerate(rows) if _to_row_level(row) == level), len(rows))
+
+    def find_level_begin(self, index : int) -> int:
+        """
+        index
+            Index of entry.
+
+        Returns
+            Index of first entry of run of consecutive entries at level of given entry.
+        """
+        level = _to_row_level(self._to_row(index))
+
+        while index > 0 and _to_row_level(self._to_row(index - 1)) == level:
+            index -= 1
+
+        return index
+
+    def find_next_level_begin(self, index : int) -> int | None:
+        """
+        index
+            Index of entry.
+
+        Returns
+            Index of first entry after given one, which is at other level.
+            None    - If there is no such entry.
+        """
+        level = _to_row_level(self._to_row(index))
+
+        for next_index in range(index + 1, len(self._rows)):
+            if _to_row_level(self._to_row(next_index)) != level:
+                return next_index
+
+        return None
+
+    def _bisect_left(self, value : Any, key : Callable[[_Row], Any], end : int | None) -> int:
+        """
+        Searches loaded entries first, head is loaded only when searched value can be in it.
+        """
+        end = len(self._rows) if end is None else end
+
+        # searched range is always loaded
+        rows = _cast(list[_Row], self._rows)
+
+        if end > self._number_of_unloaded:
+            index = _bisect.bisect_left(rows, value, self._number_of_unloaded, end, key = key)
+            if index > self._number_of_unloaded or self._number_of_unloaded == 0:
+                return index
+
+        self._load_head()
+        return _bisect.bisect_left(rows, value, 0, end, key = key)
+
+    def find_nearest_index_by_time(self, time_ : float) -> int | None:
+        """
+        Returns
+            Index of entry with time nearest to given time (the older one, if two are equally near).
+            None    - If there is no entry.
+        """
+        index = self.find_index_by_time(time_)
+
+        if index == len(self._rows):
+            return index - 1 if index > 0 else None
+
+        if index > 0 and (time_ - _to_row_time(self._to_row(index - 1))) <= (_to_row_time(self._to_row(index)) - time_):
+            return index - 1
+
+        return index
+
+    def get_exp_per_hour_between(self, begin : int, end : int) -> int:
+        """
+        begin
+            Index of first entry.
+        end
+            Index of last entry.
+
+        Returns
+            Exp per hour from first to last entry.
+            0 - If range is empty or has no duration.
+        """
+        if begin < 0 or end >= len(self._rows) or begin >= end:
+            return 0
 
-        return _json.dumps(exp_data, indent = 4)
+        first, last = self._to_row(begin), self._to_row(end)
+
+        elapsed_time = _to_row_time(last) - _to_row_time(first)
+        if elapsed_time <= 0:
+            return 0
+
+        return int((_to_row_total_exp(last) - _to_row_total_exp(first)) * SECONDS_IN_HOUR / elapsed_time)
+
+    def set_session_idle_gap(self, session_idle_gap : float):
+        """
+        session_idle_gap
+            In seconds. Entries further apart than this belong to different sessions.
+        """
+        self._session_idle_gap = session_idle_gap
+        self._rebuild_session_begins()
+
+    def get_number_of_sessions(self) -> int:
+        return len(self._session_begins)
+
+    def find_session(self, index : int) -> int:
+        """
+        index
+            Index of entry.
+
+        Returns
+            Index of session, which contains entry.
+        """
+        # sessions are known only for loaded entries
+        if index < self._number_of_unloaded:
+            self._load_head()
+
+        return _bisect.bisect_right(self._session_begins, index) - 1
+
+    def find_session_begin(self, index : int) -> int:
+        """
+        index
+            Index of entry.
+
+        Returns
+            Index of first entry of session, which contains entry.
+        """
+        if index < self._number_of_unloaded:
+            self._load_head()
+
+        begin = self._session_begins[self.find_session(index)]
+
+        # first loaded entry isn't beginning of session, if session began in head
+        if begin == self._number_of_unloaded and self._number_of_unloaded > 0:
+            self._load_head()
+            begin = self._session_begins[self.find_session(index)]
+
+        return begin
+
+    def find_next_session_begin(self, index : int) -> int | None:
+        """
+        index
+            Index of entry. -1 - before first entry.
+
+        Returns
+            Index of first entry of session after the one, which contains entry.
+            None    - If entry is in last session.
+        """
+        if index < self._number_of_unloaded:
+            self._load_head()
+
+        session_index = _bisect.bisect_right(self._session_begins, index)
+        return self._session_begins[session_index] if session_index < len(self._session_begins) else None
+
+    def to_session(self, session_index : int, end : int | None = None) -> Session:
+        """
+        session_index
+            From 'find_session' (which loads head, when needed), so session is made of loaded entries.
+        end
+            Index of last entry, which is taken into account. None - last entry of session.
+        """
+        begin = self._session_begins[session_index]
+        if end is None:
+            end = self._session_begins[session_index + 1] - 1 if (session_index + 1) < len(self._session_begins) else len(self._rows) - 1
+
+        return Session(begin, end, self._to_row(begin), self._to_row(end))
+
+    def _rebuild_session_begins(self):
+        self._session_begins = []
+        for position in range(self._number_of_unloaded, len(self._rows)):
+            self._append_session_begin(position)
+
+    def _cut_session_begins(self):
+        del self._session_begins[_bisect.bisect_left(self._session_begins, len(self._rows)):]
+
+    def _append_session_begin(self, position : int):
+        if position == self._number_of_unloaded or (_to_row_time(self._to_row(position)) - _to_row_time(self._to_row(position - 1))) > self._session_idle_gap:
+            self._session_begins.append(position)
+
+    def _mark_unsaved_from(self, position : int):
+        if self._unsaved_from is None or position < self._unsaved_from:
+            self._unsaved_from = position
 
     def remove_current_and_all_above(self):
+        if self._index == -1:
+            self._discard_head()
+        elif self._index < self._number_of_unloaded:
+            self._load_head()
+
         if self._index > -1:
-            self._entries = self._entries[:self._index]
+            del self._rows[self._index:]
             self._index -= 1
         elif self._index == -1:
-            self._entries = []
+            self._rows.clear()
+
+        self._current = None
+        self._cut_session_begins()
+        self._mark_unsaved_from(len(self._rows))
 
     def add_new(self, entry : Entry):
+        if (self._index + 1) < self._number_of_unloaded:
+            self._load_head()
+
         self._index += 1
-        self._entries = self._entries[:self._index] + [entry]
+        del self._rows[self._index:]
+        self._cut_session_begins()
+        self._rows.append(_entry_to_row(entry))
+        self._append_session_begin(self._index)
+
+        self._current = entry
+        self._mark_unsaved_from(self._index)
+
+    def _set_index(self, index : int):
+        if index != self._index:
+            self._index     = index
+            self._current   = None
 
     def go_to_previous(self):
         if self._index >= 0: 
-            self._index -= 1
+            self._set_index(self._index - 1)
 
     def go_to_next(self):
-        if (self._index + 1) < len(self._entries):
-            self._index += 1
+        if (self._index + 1) < len(self._rows):
+            self._set_index(self._index + 1)
 
     def go_to_last(self):
         if self._index >= -1:
-            self._index = len(self._entries) - 1
+            self._set_index(len(self._rows) - 1)
 
     def go_to_first(self):
         if self._index >= 0:
-            self._index = 0
+            self._set_index(0)
 
     def go_to_before_first(self):
-        self._index = -1
+        self._set_index(-1)
+
+    def go_to_page(self, page : int):
+        """
+        page
+            0..N    - Page of entry (index + 1). 0 - before first entry. Is clamped.
+        """
+        self._set_index(min(max(page, 0), len(self._rows)) - 1)
+
+    def go_to_nearest_time(self, time_ : float):
+        index = self.find_nearest_index_by_time(time_)
+        if index is not None:
+            self._set_index(index)
+
+    def go_to_first_of_level(self, level : int) -> bool:
+        """
+        Returns
+            True    - If there is any entry at given level.
+        """
+        index = self.find_index_by_level(level)
+        if index < len(self._rows):
+            self._set_index(index)
+            return True
+        return False
+
+    def go_to_next_session(self):
+        """
+        Goes to first entry of next session. Before first entry, goes to first entry.
+        """
+        index = self.find_next_session_begin(self._index)
+        if index is not None:
+            self._set_index(index)
+
+    def go_to_previous_session(self):
+        """
+        Goes to first entry of current session, or of previous session, if current entry is first one of its session.
+        """
+        if self._index < 0:
+            return
+
+        index = self.find_session_begin(self._index)
+        if index == self._index and index > 0:
+            index = self.find_session_begin(index - 1)
+
+        self._set_index(index)
+
+    def go_to_next_level(self):
+        """
+        Goes to first entry of next level (first following entry at other level). Before first entry, goes to first entry.
+        """
+        if self._index < 0:
+            if self._rows:
+                self._set_index(0)
+            return
+
+        index = self.find_next_level_begin(self._index)
+        if index is not None:
+            self._set_index(index)
+
+    def go_to_previous_level(self):
+        """
+        Goes to first entry of current level, or of previous level, if current entry is first one of its level.
+        """
+        if self._index < 0:
+            return
+
+        index = self.find_level_begin(self._index)
+        if index == self._index and index > 0:
+            index = self.find_level_begin(index - 1)
+
+        self._set_index(index)
     
     def to_current(self) -> Entry | None:
-        return self._entries[self._index] if self._index >= 0 else None
+        if self._index < 0:
+            return None
+
+        if self._index < self._number_of_unloaded:
+            self._load_head()
+
+        if self._current is None:
+            self._current = Entry(*self._to_row(self._index))
+
+        return self._current
     
+    def to_last(self) -> Entry | None:
+        if not self._rows:
+            return None
+        return Entry(*self._to_row(-1))
+
     def is_any(self) -> int:
-        return len(self._entries) > 0
+        return len(self._rows) > 0
     
     def is_first(self) -> bool:
         return self._index == 0
@@ -164,10 +1076,10 @@ class Register:
         return self._index == -1
     
     def is_last(self) -> bool:
-        return self._index >= 0 and self._index == (len(self._entries) - 1)
+        return self._index >= 0 and self._index == (len(self._rows) - 1)
     
     def get_number(self) -> int:
-        return len(self._entries)
+        return len(self._rows)
     
     def get_current_index(self) -> int | None:
         """
@@ -207,18 +1119,153 @@ _EMPTY_ENTRY = Entry(
 )
 
 
-_REVERSED_EXP_THRESHOLD_INFO_TABLE = tuple(reversed(EXP_THRESHOLD_INFO_TABLE))
+# sorted, same order as 'EXP_THRESHOLD_INFO_TABLE'
+_BASE_EXPS = tuple(info.base_exp for info in EXP_THRESHOLD_INFO_TABLE)
+
+_BASE_EXP_ARRAY     = _numpy.array(_BASE_EXPS, dtype = _numpy.int64)
+_EXP_TO_NEXT_ARRAY  = _numpy.array([info.exp_to_next for info in EXP_THRESHOLD_INFO_TABLE], dtype = _numpy.int64)
+_LEVEL_ARRAY        = _numpy.array([info.level for info in EXP_THRESHOLD_INFO_TABLE], dtype = _numpy.int64)
 
 class ExpOutOfRange(Exception):
     pass
 
 def find_exp_threshold_info(total_exp : int) -> ExpThresholdInfo:
-    for info in _REVERSED_EXP_THRESHOLD_INFO_TABLE:
-        if total_exp >= info.base_exp:
-            if total_exp > (info.base_exp + info.exp_to_next):
-                raise ExpOutOfRange(f"Total experience with value equal to {total_exp} is out of expected range.")
-            return info 
-    raise ExpOutOfRange(f"Total experience with value equal to {total_exp} is out of expected range.")
+    index = _bisect.bisect_right(_BASE_EXPS, total_exp) - 1
+    if index < 0:
+        raise ExpOutOfRange(f"Total experience with value equal to {total_exp} is out of expected range.")
+
+    info = EXP_THRESHOLD_INFO_TABLE[index]
+    if total_exp > (info.base_exp + info.exp_to_next):
+        raise ExpOutOfRange(f"Total experience with value equal to {total_exp} is out of expected range.")
+    return info 
+
+def _find_exp_threshold_indices(total_exps : _numpy.ndarray) -> tuple[_numpy.ndarray, _numpy.ndarray]:
+    """
+    Returns
+        Indices of rows of 'EXP_THRESHOLD_INFO_TABLE' (0 for values out of range) and mask of values out of range.
+    """
+    indices = _numpy.searchsorted(_BASE_EXP_ARRAY, total_exps, side = "right") - 1
+    is_out_of_range = indices < 0
+
+    indices = _numpy.maximum(indices, 0)
+    is_out_of_range |= total_exps > (_BASE_EXP_ARRAY[indices] + _EXP_TO_NEXT_ARRAY[indices])
+
+    return indices, is_out_of_range
+
+def _to_progresses(progress_in_exps : _numpy.ndarray, exp_to_next : _numpy.ndarray) -> _numpy.ndarray:
+    # same as in 'Measurer.update', progress of last level (with 0 exp to next) is 0
+    with _numpy.errstate(divide = "ignore", invalid = "ignore"):
+        return _numpy.where(progress_in_exps == 0, 0.0, (progress_in_exps / exp_to_next) * 100)
+
+def find_exp_threshold_infos(total_exps : _numpy.ndarray) -> tuple[_numpy.ndarray, _numpy.ndarray, _numpy.ndarray]:
+    """
+    Batch version of 'find_exp_threshold_info'.
+
+    total_exps
+        Array of total exp values.
+
+    Returns
+        Levels, base exps (both arrays of int64) and progresses (array of float64, in percent), in same order as 'total_exps'.
+    Raises
+        ExpOutOfRange - If any of total exp values is out of range. Message contains first of them.
+    """
+    total_exps = _numpy.asarray(total_exps, dtype = _numpy.int64)
+
+    indices, is_out_of_range = _find_exp_threshold_indices(total_exps)
+
+    if is_out_of_range.any():
+        total_exp = int(total_exps[_numpy.argmax(is_out_of_range)])
+        raise ExpOutOfRange(f"Total experience with value equal to {total_exp} is out of expected range.")
+
+    base_exps = _BASE_EXP_ARRAY[indices]
+
+    return _LEVEL_ARRAY[indices], base_exps, _to_progresses(total_exps - base_exps, _EXP_TO_NEXT_ARRAY[indices])
+
+def derive_entry_columns(total_exps : _numpy.ndarray, times : _numpy.ndarray) -> dict[str, _numpy.ndarray]:
+    """
+    Derives all fields of entries in one pass, same as series of 'Measurer.update' calls would.
+
+    total_exps
+        Array of int64. All total exps need to be in range.
+    times
+        Array of float64, in seconds, since epoch. Same length as 'total_exps'.
+
+    Returns
+        Key: name of field of 'Entry' ('info' is replaced by 'level'), value: array of values of field for each entry.
+    Raises
+        ValueError - If two consecutive entries of the same level have the same time.
+    """
+    number_of_entries = len(total_exps)
+
+    indices, _ = _find_exp_threshold_indices(total_exps)
+
+    levels          = _LEVEL_ARRAY[indices]
+    exp_to_next     = _EXP_TO_NEXT_ARRAY[indices]
+
+    progress_in_exps    = total_exps - _BASE_EXP_ARRAY[indices]
+    progresses          = _to_progresses(progress_in_exps, exp_to_next)
+
+    # values of previous entry, first entry doesn't have any
+    is_other_levels = _numpy.ones(number_of_entries, dtype = bool)
+    is_other_levels[1:] = levels[1:] != levels[:-1]
+
+    is_gained_levels = _numpy.zeros(number_of_entries, dtype = bool)
+    is_gained_levels[1:] = levels[1:] > levels[:-1]
+
+    elapsed_times = _numpy.zeros(number_of_entries, dtype = _numpy.float64)
+    elapsed_times[1:] = times[1:] - times[:-1]
+
+    if (~is_other_levels & (elapsed_times == 0)).any():
+        raise ValueError("Consecutive entries of the same level can't have the same time.")
+
+    progress_step_in_exps = progress_in_exps.copy()
+    progress_step_in_exps[1:] -= progress_in_exps[:-1]
+
+    progress_steps = progresses.copy()
+    progress_steps[1:] -= progresses[:-1]
+
+    is_progressing = ~is_other_levels & (progress_step_in_exps > 0)
+
+    with _numpy.errstate(divide = "ignore", invalid = "ignore"):
+        exp_per_hours           = _numpy.trunc(progress_step_in_exps * SECONDS_IN_HOUR / elapsed_times)
+        time_to_next_levels     = (exp_to_next - progress_in_exps) * elapsed_times / progress_step_in_exps
+        time_to_10_percents     = (exp_to_next * elapsed_times) / (progress_step_in_exps * 10)
+
+    # new level starts from scratch
+    progress_step_in_exps   = _numpy.where(is_other_levels, progress_in_exps, progress_step_in_exps)
+    progress_steps          = _numpy.where(is_other_levels, progresses, progress_steps)
+    exp_per_hours           = _numpy.where(is_other_levels, 0, exp_per_hours).astype(_numpy.int64)
+    progress_step_times     = _numpy.where(is_other_levels, 0.0, elapsed_times)
+    time_to_next_levels     = _numpy.where(is_progressing, time_to_next_levels, float('inf'))
+    time_to_10_percents     = _numpy.where(is_progressing, time_to_10_percents, float('inf'))
+
+    return {
+        "total_exp"             : total_exps,
+        "level"                 : levels,
+        "time_"                 : times,
+        "is_other_level"        : is_other_levels,
+        "is_gained_level"       : is_gained_levels,
+        "progress"              : progresses,
+        "progress_in_exp"       : progress_in_exps,
+        "progress_step"         : progress_steps,
+        "progress_step_in_exp"  : progress_step_in_exps,
+        "progress_step_time"    : progress_step_times,
+        "exp_per_hour"          : exp_per_hours,
+        "time_to_10_percent"    : time_to_10_percents,
+        "time_to_next_level"    : time_to_next_levels,
+    }
+
+def _derive_rows(total_exps : _numpy.ndarray, times : _numpy.ndarray) -> list[_Row]:
+    """
+    Same as 'derive_entry_columns', but returns rows for register.
+    """
+    columns = derive_entry_columns(total_exps, times)
+
+    return list(zip(
+        columns["total_exp"].tolist(),
+        [EXP_THRESHOLD_INFO_TABLE[level - 1] for level in columns["level"].tolist()],
+        *(columns[field.name].tolist() for field in _dataclass_fields(Entry)[2:]),
+    ))
 
 
 class Measurer:
@@ -229,11 +1276,34 @@ class Measurer:
         self._register = Register()
         self._is_update_fail = False
 
-    def load_exp_data(self, file_name : str):
-        self._register.load(file_name)
+    def load_exp_data(self, file_name : str, *, tail_size : int = 0, is_background = False):
+        """
+        tail_size
+            Number of newest entries, which are loaded immediately. 0 - all entries.
+        is_background
+            True    - Older entries are parsed in background thread. See 'poll_loading'.
+            False   - Older entries are parsed when they're needed (for example, when navigating to them).
+        """
+        self._register.load(file_name, tail_size = tail_size, is_background = is_background)
+
+    def poll_loading(self) -> bool:
+        """
+        Puts older entries into exp data, if they have been parsed in background.
+
+        Returns
+            True    - If all entries are loaded.
+        """
+        return self._register.poll_loading()
 
     def save_exp_data(self, file_name : str):
         self._register.save(file_name)
+
+    def prepare_save_exp_data(self, file_name : str) -> SaveJob:
+        """
+        Returns
+            Job, which writes changes made since last load or save. Can be run in any thread. See 'AutoSaver'.
+        """
+        return self._register.prepare_save(file_name)
         
     def update(self, total_exp : int, time_ : float):
         """
@@ -302,9 +1372,48 @@ class Measurer:
                 time_to_next_level      = time_to_next_level
             ))
 
-            to_logger().debug(f"entry={self._register.to_current()}")
+            if to_logger().isEnabledFor(_logging.DEBUG):
+                to_logger().debug(f"entry={self._register.to_current()}")
             self._is_update_fail = False
 
+    def recompute(self, total_exps : _numpy.ndarray, times : _numpy.ndarray) -> int:
+        """
+        Replaces all entries with entries derived from raw data, same as series of 'update' calls would
+        (values out of range are skipped), but in one pass.
+
+        total_exps
+            Array of total exp values.
+        times
+            Array of times, in seconds, since epoch. Same length as 'total_exps'.
+
+        Returns
+            Number of skipped values, which are out of range.
+        Raises
+            ValueError - If arrays have different length or two consecutive entries of the same level have the same time.
+        """
+        total_exps  = _numpy.asarray(total_exps, dtype = _numpy.int64)
+        times       = _numpy.asarray(times, dtype = _numpy.float64)
+
+        if total_exps.shape != times.shape or total_exps.ndim != 1:
+            raise ValueError("Arrays of total exps and times need to be one-dimensional and have the same length.")
+
+        _, is_out_of_range = _find_exp_threshold_indices(total_exps)
+        number_of_skipped = int(is_out_of_range.sum())
+        if number_of_skipped:
+            to_logger().warning(f"Skipped {number_of_skipped} total exp value(s), which are out of expected range.")
+
+        self._register.replace_all(_derive_rows(total_exps[~is_out_of_range], times[~is_out_of_range]))
+        self._is_update_fail = False
+
+        return number_of_skipped
+
+    def to_raw_exp_data(self) -> tuple[_numpy.ndarray, _numpy.ndarray]:
+        """
+        Returns
+            Total exps (array of int64) and times (array of float64) of all entries. Can be passed to 'recompute'.
+        """
+        return self._register.to_raw_arrays()
+
     def _to_entry_safe(self) -> Entry:
         """
         Returns
@@ -370,6 +1479,70 @@ class Measurer:
     def get_exp_per_hour(self) -> int:
         return self._to_entry_safe().exp_per_hour
     
+    def get_window_exp_per_hour(self, window : float) -> int:
+        """
+        window
+            In seconds.
+
+        Returns
+            Exp per hour from first entry within window before current entry, to current entry.
+            0 - If there is no such entry.
+        """
+        index = self._register.get_current_index()
+        if index is None:
+            return 0
+
+        begin = self._register.find_index_by_time(self.get_time_since_epoch() - window, index)
+        return self._register.get_exp_per_hour_between(begin, index)
+
+    def get_session_exp_per_hour(self) -> int:
+        """
+        Returns
+            Exp per hour from first entry of session of current entry, to current entry.
+            0 - If there is no entry.
+        """
+        session = self.to_current_session()
+        return session.exp_per_hour if session is not None else 0
+
+    def set_session_idle_gap(self, session_idle_gap : float):
+        """
+        session_idle_gap
+            In seconds. Entries further apart than this belong to different sessions.
+        """
+        self._register.set_session_idle_gap(session_idle_gap)
+
+    def get_number_of_sessions(self) -> int:
+        return self._register.get_number_of_sessions()
+
+    def get_current_session_index(self) -> int | None:
+        """
+        Returns
+            0..N    - Index of session of current entry.
+            None    - There is no entry.
+        """
+        index = self._register.get_current_index()
+        return self._register.find_session(index) if index is not None else None
+
+    def to_current_session(self) -> Session | None:
+        """
+        Returns
+            Session of current entry, up to current entry.
+            None - If there is no entry.
+        """
+        index = self._register.get_current_index()
+        if index is None:
+            return None
+
+        return self._register.to_session(self._register.find_session(index), index)
+
+    def to_sessions(self) -> list[Session]:
+        """
+        Returns
+            All sessions, from the oldest.
+        """
+        self._register.load_all()
+        return [self._register.to_session(session_index) for session_index in range(self._register.get_number_of_sessions())]
+
     def get_level(self) -> int:
         return self._to_entry_safe().info.level
     
@@ -389,6 +1562,14 @@ class Measurer:
         return self._is_update_fail
     
     ### entry navigation ###
+    def to_last_entry(self) -> Entry | None:
+        """
+        Returns
+            Newest entry, regardless of current one.
+            None    - If there is no entry.
+        """
+        return self._register.to_last()
+
     def get_number_of_entries(self) -> int:
         return self._register.get_number()
     
@@ -413,5 +1594,60 @@ class Measurer:
     def go_to_last_entry(self):
         self._register.go_to_last()
 
+    def go_to_entry_page(self, page : int):
+        """
+        page
+            0..N    - Page of entry. 0 - before first entry. Is clamped.
+        """
+        self._register.go_to_page(page)
+
+    def go_to_entry_nearest_time(self, time_ : float):
+        """
+        time_
+            In seconds. Since epoch.
+        """
+        self._register.go_to_nearest_time(time_)
+
+    def go_to_first_entry_of_level(self, level : int) -> bool:
+        """
+        Returns
+            True    - If there is any entry at given level.
+        """
+        return self._register.go_to_first_of_level(level)
+
+    def go_to_next_session(self):
+        self._register.go_to_next_session()
+
+    def go_to_previous_session(self):
+        self._register.go_to_previous_session()
+
+    def go_to_next_level(self):
+        self._register.go_to_next_level()
+
+    def go_to_previous_level(self):
+        self._register.go_to_previous_level()
+
     def remove_current_entry_and_all_entries_above(self):
-        self._register.remove_current_and_all_above()
\ No newline at end of file
+        self._register.remove_current_and_all_above()
+
+
+def create_session_report(measurer : Measurer) -> str:
+    """
+    Returns
+        Text of report, with one line for each session (from the oldest): begin, duration, gained exp, gained levels and exp per hour.
+    """
+    sessions = measurer.to_sessions()
+    if not sessions:
+        return "There are no entries in exp data."
+
+    lines = [f"{'session':>7} {'begin':<19} {'duration':>9} {'exp gained':>14} {'levels':>6} {'exp/h':>12}"]
+
+    for session_index, session in enumerate(sessions):
+        hours, remainder = divmod(int(session.duration), int(SECONDS_IN_HOUR))
+        minutes = remainder // int(SECONDS_IN_MINUTE)
+        lines.append(
+            f"{session_index + 1:>7} {_datetime.fromtimestamp(session.begin_time).strftime('%Y/%m/%d %H:%M:%S'):<19} {f'{hours}h {minutes:02}m':>9} "
+            f"{session.exp_gained:>14,} {session.levels_gained:>6} {session.exp_per_hour:>12,}"
+        )
+
+    return "\n".join(lines)
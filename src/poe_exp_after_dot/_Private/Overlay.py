@@ -16,6 +16,10 @@ from .Settings              import Settings
 from .OverlaySupport        import solve_layout as _solve_layout
 from .Version               import get_version as _get_version
 from .ExecuteSupport        import make_run_file as _make_run_file
+from .BatchMeasure          import run_batch_measure as _run_batch_measure
+from .Telemetry             import create_perf_report as _create_perf_report
+from .Measurer              import Measurer, create_session_report as _create_session_report
+from .CharacterRegister     import CharacterRegister, migrate_exp_data_to_database as _migrate_exp_data_to_database
 
 from .GUI.ControlRegion     import ControlRegion
 from .GUI.TrayMenu          import TrayMenu
@@ -107,6 +111,28 @@ poe_exp_after_dot.py [<option> ...]
 
         Examples
             --format=Default
+    --measure-images=<path>
+        Measures current exp from screenshots (png, jpg, bmp) in given folder, without starting overlay.
+        Screenshots are measured in order of their modification time, which is used as time of measurement.
+        Layout is selected by size of screenshot, if layout detection is enabled in settings.
+        Exp data is saved into 'exp_data.json' in that folder.
+
+        Examples
+            --measure-images="C:\\Screenshots\\Session 1"
+    --session-report
+        Displays sessions of selected character (see 'character_name' and 'session_idle_gap' in settings):
+        begin, duration, gained exp, gained levels and exp per hour.
+        Application won't run.
+    --migrate-exp-data
+        Copies exp data of each character from 'exp_data.json' (with its journal) into 'exp_data.db' (SQLite database) in the same folder.
+        Existing 'exp_data.db' files are overwritten, 'exp_data.json' files are kept.
+        Set 'exp_data_storage' to "sqlite" in settings to use them.
+        Application won't run.
+    --perf-report
+        Displays latency percentiles and failure rates of measurements for each recognizer engine, layout, version and day,
+        then latency percentiles of each measurement stage.
+        Report is made from telemetry records (see 'is_telemetry' in settings) in 'cache' folder of data folder.
+        Application won't run.
     --error-details
         When error occurs, then additional option is visible in ErrorBoard, which allows to show details of error.
         Details of error may contain sensitive data.
@@ -135,6 +161,48 @@ is_ms_if_below_1s
 info_board_format
     "Default"
     <text> # Name without extension of file located in 'formats' directory.
+recognizer_engine
+    "template"  # fast glyph matching, learns glyphs from EasyOCR and uses it when matching fails
+    "easyocr"
+recognition_cache_size
+    <integer> # number of remembered recognition results of unchanged in-game exp tooltip, 0 - disabled
+is_auto_measure
+    <boolean> # measures when fill of in-game exp bar changes, while cursor is over in-game exp bar, fractional exp bar is then hidden from screen capture (also from screenshots and recordings)
+auto_measure_interval
+    <natural> # in milliseconds, how often in-game exp bar is checked
+is_telemetry
+    <boolean> # records durations of measurement stages into 'cache\\telemetry.jsonl' in data folder, see '--perf-report'
+telemetry_max_size
+    <natural> # in bytes, size of telemetry file, after which it's rotated (3 older files are kept)
+session_idle_gap
+    <natural> # in seconds, entries further apart belong to different sessions
+exp_data_tail_size
+    <integer> # number of newest entries of exp data loaded at start, older ones are loaded in background, 0 - all at once
+exp_data_storage
+    "json"      # 'exp_data.json' with journal file, readable by anything, which reads JSON
+    "sqlite"    # 'exp_data.db', SQLite database written one row per entry, see '--migrate-exp-data'
+character_cache_capacity
+    <integer> # number of recently used characters (besides current one) kept in memory for instant switch, loaded in background at start, 0 - disabled
+character_cache_max_size
+    <natural> # in bytes, approximate memory taken by exp data of cached characters, least recently used ones are dropped above it
+autosave_delay
+    <integer> # in milliseconds, exp data is saved in background after this time without new measurement, 0 - saved only at exit and switch of character
+easyocr_profile.device
+    "auto" # GPU if CUDA is available, otherwise CPU
+    "cpu"
+    "gpu"
+easyocr_profile.is_quantize
+    <boolean> # quantized models, faster on CPU, not used on GPU
+easyocr_profile.number_of_threads
+    <integer> # threads used by inference on CPU, 0 - default of torch
+easyocr_profile.is_allowlist
+    <boolean> # recognizes only characters which can be in in-game exp tooltip
+easyocr_profile.decoder
+    "greedy"
+    "beamsearch"
+    "wordbeamsearch"
+easyocr_profile.batch_size
+    <integer>
 selected_layout_name
     "auto" # detects resolution and sets layout to "<width>x<height>"
     <text>
@@ -211,6 +279,10 @@ class Overlay:
         is_just_weeks_if_cap            : bool | None       = None
         is_ms_if_below_1s               : bool | None       = None
         info_board_format               : str | None        = None
+        measure_images_path             : str | None        = None
+        is_perf_report                                      = False
+        is_session_report                                   = False
+        is_migrate_exp_data                                 = False
 
         info_board_x                    : int | None        = None
         info_board_bottom               : int | None        = None
@@ -329,6 +401,19 @@ class Overlay:
                 case ["--format", info_board_format]:
                     pass
 
+                case ["--measure-images", measure_images_path]:
+                    if not _os.path.isdir(measure_images_path):
+                        raise CommandArgumentError(f"Incorrect command line argument. Option \"{option_name}\" need to be path to existing folder.")
+
+                case ["--perf-report"]:
+                    is_perf_report = True
+
+                case ["--session-report"]:
+                    is_session_report = True
+
+                case ["--migrate-exp-data"]:
+                    is_migrate_exp_data = True
+
                 case ["--error-details"]:
                     pass # processed before entering _main
 
@@ -340,6 +425,12 @@ class Overlay:
                 case ["--data-path" | "--custom" | "--font" | "--time-max-unit" | "--just-weeks-if-cap" | "--ms-if-below-1s", "--format"]:
                     raise CommandArgumentError(f"Incorrect command line argument. Option \"{option_name}\" need to have a value.")
 
+                case ["--perf-report" | "--session-report" | "--migrate-exp-data", _]:
+                    raise CommandArgumentError(f"Incorrect command line argument. Option \"{option_name}\" can't have a value.")
+
+                case ["--measure-images"]:
+                    raise CommandArgumentError(f"Incorrect command line argument. Option \"{option_name}\" need to have a value.")
+
                 case [option_name, *_]:
                     raise CommandArgumentError(f"Incorrect command line argument. Unknown option \"{option_name}\".")
         
@@ -354,6 +445,14 @@ class Overlay:
 
         _os.makedirs(data_path, exist_ok = True)
 
+        if is_perf_report:
+            print(_create_perf_report(data_path + "\\cache\\telemetry.jsonl"))
+            return EXIT_SUCCESS
+
+        if is_migrate_exp_data:
+            print(_migrate_exp_data_to_database(data_path))
+            return EXIT_SUCCESS
+
         to_log_manager().setup_logger(data_path + "\\runtime.log", is_debug = is_debug, is_stdout = True, is_stderr = True)
         
         to_logger().info("====== NEW RUN ======")
@@ -385,6 +484,26 @@ class Overlay:
             "is_just_weeks_if_cap" : True,
             "is_ms_if_below_1s" : False,
             "info_board_format" : "Default",
+            "recognizer_engine" : "template",
+            "recognition_cache_size" : 32,
+            "is_auto_measure" : False,
+            "auto_measure_interval" : 500,
+            "is_telemetry" : True,
+            "telemetry_max_size" : 1024 * 1024,
+            "session_idle_gap" : 30 * 60,
+            "exp_data_tail_size" : 1000,
+            "autosave_delay" : 5000,
+            "exp_data_storage" : "json",
+            "character_cache_capacity" : 3,
+            "character_cache_max_size" : 64 * 1024 * 1024,
+            "easyocr_profile" : {
+                "device" : "auto",
+                "is_quantize" : True,
+                "number_of_threads" : 0,
+                "is_allowlist" : True,
+                "decoder" : "greedy",
+                "batch_size" : 1
+            },
             "is_detect_layout" : True,
             "selected_layout_name" : "1920x1080",
             "_comment_layouts_help" : "", # to reserve place
@@ -532,6 +651,19 @@ class Overlay:
 
         solve_command_line_layout()
 
+        # headless, so screen isn't needed
+        if measure_images_path is not None:
+            _run_batch_measure(settings, measure_images_path)
+            return EXIT_SUCCESS
+
+        if is_session_report:
+            measurer = Measurer()
+            measurer.set_session_idle_gap(settings.get_int("session_idle_gap"))
+            character_register = CharacterRegister(data_path, settings.get_str("exp_data_storage"))
+            measurer.load_exp_data(character_register.to_character(settings.get_str("character_name")).get_exp_data_file_name())
+            print(_create_session_report(measurer))
+            return EXIT_SUCCESS
+
         primary_screen_size = to_app().primaryScreen().size()
         to_logger().info(f"Resolution: {primary_screen_size.width()}x{primary_screen_size.height()}")
 
@@ -589,6 +721,8 @@ class Overlay:
 
         _sys.excepthook = previous_excepthook
 
+        logic.close()
+
         if _exception_stash.exception:
             exception = _exception_stash.exception
             _exception_stash.exception = None
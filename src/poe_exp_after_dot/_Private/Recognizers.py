@@ -0,0 +1,974 @@
+import re       as _re
+import os       as _os
+import io       as _io
+import sys      as _sys
+import logging  as _logging
+import numpy    as _numpy
+import cv2      as _cv2
+import threading    as _threading
+import faulthandler as _faulthandler
+
+from typing         import Any, Callable as _Callable
+from collections    import OrderedDict as _OrderedDict
+from hashlib        import blake2b as _blake2b
+from contextlib     import redirect_stdout as _redirect_stdout, redirect_stderr as _redirect_stderr, nullcontext as _nullcontext
+
+from .Settings      import Settings
+from .LogManager    import to_logger
+from .StopWatch     import StageTimer
+
+
+RECOGNIZER_ENGINE_NAMES = ["template", "easyocr"]
+
+
+class Point:
+    x : int
+    y : int
+
+    def __init__(self, x, y):
+        self.x = int(x)
+        self.y = int(y)
+
+    def __str__(self):
+        return f"PointI(x={self.x}, y={self.y})"
+
+
+class Polygon:
+    lb : Point
+    rb : Point
+    rt : Point
+    lt : Point
+
+    def __init__(self, data):
+        # corners
+        self.lb = Point(data[0][0], data[0][1]) # left bottom
+        self.rb = Point(data[1][0], data[1][1]) # right bottom
+        self.rt = Point(data[2][0], data[2][1]) # right top
+        self.lt = Point(data[3][0], data[3][1]) # left top
+
+    def __str__(self):
+        return f"Polygon(lb={self.lb}, rb={self.rb}, rt={self.rt}, lt={self.lt})"
+
+
+class TextFragment:
+    text    : str
+    polygon : Polygon
+
+    def __init__(self, data):
+        self.text       = data[1]
+        self.polygon    = Polygon(data[0])
+
+    def __str__(self):
+        return f"TextFragment(text=\"{self.text}\", polygon={self.polygon})"
+
+
+def _do_with_redirect_to_logger(do : _Callable[[], None], *, message_prefix : str = "", is_only_stdout : bool = False):
+    if is_only_stdout:
+        with _redirect_stdout(_io.StringIO()) as buffer:
+            do()
+
+        text = buffer.getvalue().rstrip("\n")
+        if text:
+            to_logger().info(f"{message_prefix}{text}")
+    else:
+        with _redirect_stdout(_io.StringIO()) as buffer, _redirect_stderr(_io.StringIO()) as error_buffer:
+            do()
+
+        text = buffer.getvalue().rstrip("\n")
+        if text:
+            to_logger().info(f"{message_prefix}{text}")
+
+        error_text = error_buffer.getvalue().rstrip("\n")
+        if error_text:
+            to_logger().error(f"{message_prefix}{error_text}")
+
+
+# Common Thousands Separators: ',', '.', ' '.
+_EXP_VALUE_PATTERN_TEXT = r"(0|([1-9][0-9]{0,2})([,\. ][0-9]{3}){0,3})"
+_current_exp_pattern    = _re.compile(fr"^.*?Current[ ]+Exp\:[ ]+({_EXP_VALUE_PATTERN_TEXT})[ ]+.*$")
+
+
+def parse_current_exp(text : str) -> int | None:
+    """
+    text
+        Text of in-game exp tooltip.
+
+    Returns
+        Current experience.
+        None    - If current experience can't be found in 'text'.
+    """
+    match_ = _current_exp_pattern.search(text)
+    if match_:
+        return int(match_.group(1).replace(",", "").replace(".", "").replace(" ", ""))
+    return None
+
+
+class Recognizer:
+    """
+    Reads current experience from image of in-game exp tooltip.
+    """
+    _stage_timer : StageTimer | None = None
+
+    def get_name(self) -> str:
+        raise NotImplementedError("This method need to be overridden.")
+
+    def recognize_exp(self, image : _numpy.ndarray) -> int | None:
+        """
+        image
+            Image of in-game exp tooltip in OpenCV format (BGR).
+
+        Returns
+            Current experience.
+            None    - If current experience can't be recognized.
+        """
+        raise NotImplementedError("This method need to be overridden.")
+
+    def get_last_text(self) -> str:
+        """
+        Returns
+            Text read by last call of 'recognize_exp'.
+        """
+        raise NotImplementedError("This method need to be overridden.")
+
+    def set_stage_timer(self, stage_timer : StageTimer | None):
+        """
+        stage_timer
+            Measures stages of recognition ("locate", "ocr", "sort", "parse", ...).
+            None - Stages are not measured.
+        """
+        self._stage_timer = stage_timer
+
+    def _measure_stage(self, stage_name : str) -> Any:
+        return self._stage_timer.measure(stage_name) if self._stage_timer is not None else _nullcontext()
+
+
+# Characters of in-game exp tooltip. Space needs to be included, otherwise EasyOCR drops spaces from recognized text.
+_EASYOCR_ALLOWLIST = "".join(sorted(set("Current Exp: Next Level: 0123456789,.")))
+
+EASYOCR_DEVICES     = ["auto", "cpu", "gpu"]
+EASYOCR_DECODERS    = ["greedy", "beamsearch", "wordbeamsearch"]
+
+
+class EasyOCRProfile:
+    """
+    Inference options of EasyOCR readers. Read from 'easyocr_profile' setting.
+    """
+    device              : str   # one of EASYOCR_DEVICES, "auto" - GPU if CUDA is available, otherwise CPU
+    is_quantize         : bool  # dynamic quantization of models, only on CPU
+    number_of_threads   : int   # intra-op threads of torch, 0 - default of torch
+    is_allowlist        : bool  # recognizer considers only characters of in-game exp tooltip
+    decoder             : str   # one of EASYOCR_DECODERS
+    batch_size          : int
+
+    def __init__(
+            self,
+            device              : str   = "auto",
+            is_quantize         : bool  = True,
+            number_of_threads   : int   = 0,
+            is_allowlist        : bool  = True,
+            decoder             : str   = "greedy",
+            batch_size          : int   = 1,
+                ):
+        self.device             = device
+        self.is_quantize        = is_quantize
+        self.number_of_threads  = number_of_threads
+        self.is_allowlist       = is_allowlist
+        self.decoder            = decoder
+        self.batch_size         = batch_size
+
+    @staticmethod
+    def from_settings(settings : Settings) -> "EasyOCRProfile":
+        """
+        Missing values are default. Invalid values are logged and replaced by default.
+        """
+        profile = EasyOCRProfile()
+        values = settings.try_get_dict("easyocr_profile") or {}
+
+        for name, default in profile.to_dict().items():
+            value = values.get(name, default)
+            if type(value) != type(default):
+                to_logger().error(f"Value of \"easyocr_profile.{name}\" need to be {type(default).__name__}. Using {default!r} instead.")
+                value = default
+            setattr(profile, name, value)
+
+        if profile.device not in EASYOCR_DEVICES:
+            to_logger().error(f"Unknown EasyOCR device \"{profile.device}\". Using \"auto\" instead.")
+            profile.device = "auto"
+
+        if profile.decoder not in EASYOCR_DECODERS:
+            to_logger().error(f"Unknown EasyOCR decoder \"{profile.decoder}\". Using \"greedy\" instead.")
+            profile.decoder = "greedy"
+
+        profile.number_of_threads   = max(profile.number_of_threads, 0)
+        profile.batch_size          = max(profile.batch_size, 1)
+
+        return profile
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "device"            : self.device,
+            "is_quantize"       : self.is_quantize,
+            "number_of_threads" : self.number_of_threads,
+            "is_allowlist"      : self.is_allowlist,
+            "decoder"           : self.decoder,
+            "batch_size"        : self.batch_size,
+        }
+
+    def to_recognition_options(self) -> dict[str, Any]:
+        """
+        Returns
+            Keyword arguments for 'readtext' and 'recognize' of EasyOCR reader.
+        """
+        return {
+            "allowlist"     : _EASYOCR_ALLOWLIST if self.is_allowlist else None,
+            "decoder"       : self.decoder,
+            "batch_size"    : self.batch_size,
+        }
+
+    def __str__(self):
+        return ", ".join(f"{name}={value}" for name, value in self.to_dict().items())
+
+
+class EasyOCRRecognizer(Recognizer):
+    """
+    Reads text of in-game exp tooltip with EasyOCR.
+
+    Text lines are located by projection profile and passed directly to text recognition, which skips text detection.
+    Located lines are remembered for each size of tooltip image (layout), so next reads skip locating too.
+    When text read from lines doesn't contain current exp, whole text is read with text detection.
+
+    Reader is constructed in background thread, so construction of this recognizer does not block.
+    First read waits until reader is loaded.
+    Debug reader is constructed only when debug mode is enabled (on start, or when it's needed for the first time).
+    """
+    _settings               : Settings
+    _profile                : EasyOCRProfile
+    _reader                 : Any | None # easyocr.Reader
+    _debug_reader           : Any | None # easyocr.Reader
+
+    _loader                 : _threading.Thread
+    _load_exception         : BaseException | None
+
+    _last_text              : str
+    _last_text_fragments    : list[TextFragment]
+
+    _line_boxes_by_size     : dict[tuple[int, int], list[list[int]]] # key: (width, height) of image, value: [x_min, x_max, y_min, y_max] boxes
+
+    def __init__(self, settings : Settings):
+        self._settings = settings
+        self._profile  = EasyOCRProfile.from_settings(settings)
+
+        self._reader            = None
+        self._debug_reader      = None
+        self._load_exception    = None
+
+        self._last_text             = ""
+        self._last_text_fragments   = []
+
+        self._line_boxes_by_size    = {}
+
+        self._loader = _threading.Thread(target = self._load_reader, name = "EasyOCR Loader", daemon = True)
+        self._loader.start()
+
+    def _load_reader(self):
+        try:
+            # Importing 'easyocr' also imports 'torch', which takes a while.
+            import torch as _torch # type: ignore
+
+            if self._profile.device == "auto":
+                self._profile.device = "gpu" if _torch.cuda.is_available() else "cpu"
+
+            if self._profile.device == "gpu":
+                self._profile.is_quantize = False # quantization is done only on CPU
+
+            if self._profile.number_of_threads > 0:
+                _torch.set_num_threads(self._profile.number_of_threads)
+            else:
+                self._profile.number_of_threads = _torch.get_num_threads()
+
+            self._reader = self._create_reader(is_verbose = False)
+
+            if self._settings.get_bool("_is_debug"):
+                self._initialize_debug_reader()
+        except BaseException as exception:
+            self._load_exception = exception
+        else:
+            to_logger().info(f"EasyOCR reader has been loaded. Profile: {self._profile}.")
+
+    def _initialize_debug_reader(self):
+        self._debug_reader = self._create_reader(is_verbose = True)
+
+    def _create_reader(self, *, is_verbose : bool) -> Any:
+        import easyocr as _easyocr # type: ignore
+
+        return _easyocr.Reader(['en'], gpu = self._profile.device == "gpu", verbose = is_verbose, quantize = self._profile.is_quantize)
+
+    def to_profile(self) -> EasyOCRProfile:
+        """
+        Returns
+            Effective profile. Device and number of threads are resolved when reader is loaded.
+        """
+        return self._profile
+
+    def wait_until_loaded(self):
+        """
+        Blocks until reader is loaded.
+
+        Raises
+            RuntimeError - When reader failed to load.
+        """
+        if self._loader.is_alive():
+            to_logger().info("Waiting for EasyOCR reader to be loaded...")
+            self._loader.join()
+
+        if self._load_exception is not None:
+            raise RuntimeError("Failed to load EasyOCR reader.") from self._load_exception
+
+    def is_loaded(self) -> bool:
+        return self._reader is not None
+
+    def get_name(self) -> str:
+        return "easyocr"
+
+    def get_last_text(self) -> str:
+        return self._last_text
+
+    def get_last_text_fragments(self) -> list[TextFragment]:
+        """
+        Returns
+            Text fragments read by last call of 'recognize_exp', in reading order.
+        """
+        return self._last_text_fragments
+
+    def recognize_exp(self, image : _numpy.ndarray) -> int | None:
+        self.wait_until_loaded()
+
+        if self._settings.get_bool("_is_debug"):
+            return self._finish_reading(image, self._read_with_debug_reader(image), is_sort = True)
+
+        total_exp = self._recognize_exp_from_lines(image)
+        if total_exp is not None:
+            return total_exp
+
+        to_logger().debug("Can't find current exp in located text lines. Reading whole text of in-game exp tooltip.")
+
+        with self._measure_stage("ocr"):
+            text_fragments = [TextFragment(text_fragment) for text_fragment in self._reader.readtext(image, **self._profile.to_recognition_options())] # type: ignore[union-attr]
+
+        return self._finish_reading(image, text_fragments, is_sort = True)
+
+    def _recognize_exp_from_lines(self, image : _numpy.ndarray) -> int | None:
+        size = (image.shape[1], image.shape[0])
+
+        line_boxes = self._line_boxes_by_size.get(size)
+        is_cached = line_boxes is not None
+
+        if line_boxes is None:
+            with self._measure_stage("locate"):
+                line_boxes = locate_text_lines(image)
+            if not line_boxes:
+                return None
+
+        with self._measure_stage("ocr"):
+            text_fragments = [TextFragment(text_fragment) for text_fragment in self._reader.recognize(image, horizontal_list = line_boxes, free_list = [], **self._profile.to_recognition_options())] # type: ignore[union-attr]
+
+        # boxes are already from top to bottom, no sorting is needed
+        total_exp = self._finish_reading(image, text_fragments, is_sort = False)
+
+        if total_exp is None:
+            if is_cached:
+                # layout might have changed
+                del self._line_boxes_by_size[size]
+                return self._recognize_exp_from_lines(image)
+            return None
+
+        if not is_cached:
+            # only line with current exp is needed, if there is such line
+            line_boxes = next(([box] for box, text_fragment in zip(line_boxes, text_fragments) if parse_current_exp(text_fragment.text + " ") is not None), line_boxes)
+
+            # reaches right edge, because current exp can get longer
+            self._line_boxes_by_size[size] = [[x_min, size[0], y_min, y_max] for x_min, _, y_min, y_max in line_boxes]
+
+        return total_exp
+
+    def _read_with_debug_reader(self, image : _numpy.ndarray) -> list[TextFragment]:
+        if self._debug_reader is None:
+            _do_with_redirect_to_logger(self._initialize_debug_reader, message_prefix = "EasyOCR, Debug Reader: ")
+
+        to_logger().debug(f"Reading text of in-game exp tooltip...")
+
+        if _sys.stdout:
+            # When running by 'start pyw', then there is no 'stderr'.
+            _faulthandler.enable()
+
+        text_fragments = []
+        def do():
+            text_raw_fragments = self._debug_reader.readtext(image, **self._profile.to_recognition_options()) # type: ignore[union-attr]
+
+            text_fragments.extend([TextFragment(text_raw_fragment) for text_raw_fragment in text_raw_fragments])
+        with self._measure_stage("ocr"):
+            _do_with_redirect_to_logger(do, message_prefix = "EasyOCR, Reading Text: ", is_only_stdout = _faulthandler.is_enabled())
+
+        if _faulthandler.is_enabled():
+            _faulthandler.disable()
+
+        to_logger().debug(f"Text of in-game exp tooltip has been read.")
+
+        return text_fragments
+
+    def _finish_reading(self, image : _numpy.ndarray, text_fragments : list[TextFragment], *, is_sort : bool) -> int | None:
+        """
+        Sorts text fragments (if requested), joins them into text and parses current exp from it.
+        """
+        if is_sort:
+            min_text_height = image.shape[0]
+
+            # used to fix little misalignment on Y axis
+            for text_fragment in text_fragments:
+                min_text_height = min(text_fragment.polygon.lt.y - text_fragment.polygon.lb.y, min_text_height)
+
+            width = image.shape[1]
+
+            def extract_comparison_key(text_fragment : TextFragment):
+                p = text_fragment.polygon.lb # position of left bottom corner
+                return p.x + width * (p.y // min_text_height)
+
+            if to_logger().isEnabledFor(_logging.DEBUG):
+                to_logger().debug(f"Sorting read text fragments of in-game exp tooltip to be in correct order.")
+
+            with self._measure_stage("sort"):
+                text_fragments.sort(key = extract_comparison_key)
+
+        full_text = ""
+        for text_fragment in text_fragments:
+            full_text += text_fragment.text + " "
+
+        if to_logger().isEnabledFor(_logging.DEBUG):
+            to_logger().debug(f"Scanned In-Game Exp Tooltip Text: \"{full_text}\".")
+            for text_fragment in text_fragments:
+                to_logger().debug(text_fragment)
+            to_logger().debug("---")
+
+        self._last_text             = full_text
+        self._last_text_fragments   = text_fragments
+
+        with self._measure_stage("parse"):
+            return parse_current_exp(full_text)
+
+
+### template matching ###
+
+# Characters, which are needed to find and read current exp in in-game exp tooltip.
+LEARNABLE_CHARACTERS    = "CurentExp:0123456789,."
+
+_GLYPH_SIZE             = 16    # in pixels, side of normalized glyph image
+_GLYPH_BLUR_SIGMA       = 1.2   # in pixels of normalized glyph image, makes matching tolerant to sub-pixel shifts of glyphs
+_MAX_SAMPLES_PER_GLYPH  = 4
+_MIN_GLYPH_SCORE        = 0.8   # 0.0 .. 1.0
+_SPACE_TO_HEIGHT_RATIO  = 0.55  # minimal gap between glyphs (relative to line height), which is considered as space
+_MIN_LINE_HEIGHT        = 4     # in pixels
+_DESCENDER_RATIO        = 0.3   # space for descenders below baseline (relative to height from top of line to baseline)
+_LINE_MARGIN            = 2     # in pixels, added around located text line
+_MIN_ROW_INK_RATIO      = 0.01  # rows with less ink (relative to width) are not part of text line, it skips vertical borders
+_UNKNOWN_CHARACTER      = "?"
+_GLYPH_ATLAS_VERSION    = 2     # increased when normalization of glyphs changes, atlas with other version is not loaded
+
+
+class Glyph:
+    left    : int
+    right   : int
+    top     : int   # of line
+    bottom  : int   # of line, below baseline by space for descenders
+    image   : _numpy.ndarray # normalized, float32, _GLYPH_SIZE x _GLYPH_SIZE
+
+    def __init__(self, left : int, right : int, top : int, bottom : int, image : _numpy.ndarray):
+        self.left   = left
+        self.right  = right
+        self.top    = top
+        self.bottom = bottom
+        self.image  = image
+
+    def get_center_x(self) -> float:
+        return (self.left + self.right) / 2
+
+    def get_center_y(self) -> float:
+        return (self.top + self.bottom) / 2
+
+
+def binarize(image : _numpy.ndarray) -> _numpy.ndarray:
+    """
+    image
+        Image in OpenCV format (BGR).
+
+    Returns
+        Binary image, where 1 is text and 0 is background (uint8).
+    """
+    gray = _cv2.cvtColor(image, _cv2.COLOR_BGR2GRAY)
+    _, ink = _cv2.threshold(gray, 0, 1, _cv2.THRESH_BINARY | _cv2.THRESH_OTSU)
+    return ink
+
+
+def _find_runs(mask : _numpy.ndarray) -> list[tuple[int, int]]:
+    """
+    Returns
+        List of (begin, end) ranges of consecutive True values.
+    """
+    padded = _numpy.concatenate(([False], mask, [False]))
+    changes = _numpy.flatnonzero(padded[1:] != padded[:-1])
+    return list(zip(changes[0::2].tolist(), changes[1::2].tolist()))
+
+
+def locate_text_lines(image : _numpy.ndarray) -> list[list[int]]:
+    """
+    Locates text lines by projection profile of binarized image.
+
+    image
+        Image in OpenCV format (BGR).
+
+    Returns
+        Boxes of text lines from top to bottom, each as [x_min, x_max, y_min, y_max] (horizontal box in EasyOCR format).
+    """
+    ink = binarize(image)
+    height, width = ink.shape
+
+    min_row_ink = max(int(width * _MIN_ROW_INK_RATIO), 1)
+
+    boxes = []
+
+    for top, bottom in _find_runs(_numpy.count_nonzero(ink, axis = 1) >= min_row_ink):
+        if (bottom - top) < _MIN_LINE_HEIGHT:
+            continue
+
+        columns = _numpy.flatnonzero(ink[top:bottom].any(axis = 0))
+
+        boxes.append([
+            max(int(columns[0]) - _LINE_MARGIN, 0),
+            min(int(columns[-1]) + 1 + _LINE_MARGIN, width),
+            max(top - _LINE_MARGIN, 0),
+            min(bottom + _LINE_MARGIN, height),
+        ])
+
+    return boxes
+
+
+def _normalize_glyph(line_intensity : _numpy.ndarray, left : int, right : int) -> _numpy.ndarray:
+    """
+    Keeps vertical position and size of glyph relative to line, to distinguish between ',', '.' and ':'.
+
+    line_intensity
+        Part of intensity image from top of line to bottom of descender space.
+    """
+    height = line_intensity.shape[0]
+    width = right - left
+
+    glyph = line_intensity[:, left:right]
+    peak = glyph.max()
+
+    side = max(height, width)
+    canvas = _numpy.zeros((height, side), dtype = _numpy.float32)
+    offset = (side - width) // 2
+    canvas[:, offset:offset + width] = glyph / peak if peak > 0 else glyph
+
+    return _cv2.GaussianBlur(_cv2.resize(canvas, (_GLYPH_SIZE, _GLYPH_SIZE), interpolation = _cv2.INTER_AREA), (0, 0), _GLYPH_BLUR_SIGMA)
+
+
+def segment_glyphs(image : _numpy.ndarray) -> list[list[Glyph]]:
+    """
+    Glyphs are found in binarized image. Their normalized images are taken from intensity above background level,
+    so they don't depend on binarization threshold, which changes with content of image.
+
+    image
+        Image in OpenCV format (BGR).
+
+    Returns
+        Glyphs grouped in lines, from top to bottom and from left to right.
+    """
+    gray : _numpy.ndarray = _numpy.asarray(_cv2.cvtColor(image, _cv2.COLOR_BGR2GRAY), dtype = _numpy.uint8)
+    _, ink = _cv2.threshold(gray, 0, 1, _cv2.THRESH_BINARY | _cv2.THRESH_OTSU)
+
+    # most of tooltip is background
+    intensity = _numpy.maximum(gray.astype(_numpy.float32) - float(_numpy.median(gray)), 0.0)
+
+    lines = []
+
+    for top, bottom in _find_runs(ink.any(axis = 1)):
+        if (bottom - top) < _MIN_LINE_HEIGHT:
+            continue
+
+        run_ink = ink[top:bottom]
+
+        count, _, stats, _ = _cv2.connectedComponentsWithStats(run_ink, connectivity = 8)
+
+        # component 0 is background
+        ranges = sorted((int(stats[index, _cv2.CC_STAT_LEFT]), int(stats[index, _cv2.CC_STAT_LEFT] + stats[index, _cv2.CC_STAT_WIDTH])) for index in range(1, count))
+
+        # merges components which overlap on X axis (for example ':')
+        merged : list[list[int]] = []
+        for left, right in ranges:
+            if merged and left < merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], right)
+            else:
+                merged.append([left, right])
+
+        # Line is normalized from its top to baseline (bottom of most glyphs) with fixed space for descenders,
+        # so glyphs look same regardless of whether line contains any glyph with descender (for example 'p' or ',').
+        bottoms     = [int(_numpy.flatnonzero(run_ink[:, left:right].any(axis = 1))[-1]) + 1 for left, right in merged]
+        baseline    = int(_numpy.median(bottoms))
+        line_height = baseline + int(_numpy.ceil(baseline * _DESCENDER_RATIO))
+
+        line_intensity = _numpy.zeros((line_height, ink.shape[1]), dtype = _numpy.float32)
+        line_intensity[:min(line_height, bottom - top)] = intensity[top:bottom][:line_height]
+
+        lines.append([Glyph(left, right, top, top + line_height, _normalize_glyph(line_intensity, left, right)) for left, right in merged])
+
+    return lines
+
+
+class GlyphAtlas:
+    """
+    Stores sample images of glyphs for each character, separately for each height of in-game exp tooltip image.
+    """
+    _samples : dict[int, dict[str, list[_numpy.ndarray]]] # height, character, glyph images
+
+    def __init__(self):
+        self._samples = {}
+
+    def load(self, file_name : str):
+        self._samples = {}
+
+        if _os.path.isfile(file_name):
+            with open(file_name, "rb") as file, _numpy.load(file) as data:
+                version = int(data["version"]) if "version" in data else 1
+                if version != _GLYPH_ATLAS_VERSION:
+                    to_logger().info(f"Glyph atlas has outdated version ({version}). Glyphs will be learned again.")
+                    return
+
+                for height, code, image in zip(data["heights"].tolist(), data["codes"].tolist(), data["images"]):
+                    self._samples.setdefault(height, {}).setdefault(chr(code), []).append(image.astype(_numpy.float32))
+
+    def save(self, file_name : str):
+        heights = []
+        codes   = []
+        images  = []
+        for height, characters in self._samples.items():
+            for character, samples in characters.items():
+                for image in samples:
+                    heights.append(height)
+                    codes.append(ord(character))
+                    images.append(image)
+
+        _os.makedirs(_os.path.dirname(file_name), exist_ok = True)
+
+        with open(file_name, "wb") as file:
+            _numpy.savez_compressed(
+                file,
+                version = _numpy.array(_GLYPH_ATLAS_VERSION, dtype = _numpy.int32),
+                heights = _numpy.array(heights, dtype = _numpy.int32),
+                codes   = _numpy.array(codes, dtype = _numpy.int32),
+                images  = _numpy.array(images, dtype = _numpy.float32).reshape(-1, _GLYPH_SIZE, _GLYPH_SIZE),
+            )
+
+    def add(self, height : int, character : str, image : _numpy.ndarray) -> bool:
+        """
+        Returns
+            True    - If sample has been added.
+            False   - If there is already similar sample or enough samples for this character.
+        """
+        samples = self._samples.setdefault(height, {}).setdefault(character, [])
+
+        if len(samples) >= _MAX_SAMPLES_PER_GLYPH:
+            return False
+
+        for sample in samples:
+            if _compare(sample, image) >= 0.98:
+                return False
+
+        samples.append(image)
+        return True
+
+    def is_any(self, height : int) -> bool:
+        return height in self._samples and len(self._samples[height]) > 0
+
+    def get_characters(self, height : int) -> list[str]:
+        return sorted(self._samples.get(height, {}).keys())
+
+    def match(self, height : int, images : list[_numpy.ndarray]) -> list[str]:
+        """
+        Returns
+            Best matching character for each image, or '?' if there is no good enough match.
+        """
+        characters = self._samples.get(height, {})
+        if not images or not characters:
+            return [_UNKNOWN_CHARACTER] * len(images)
+
+        labels = []
+        samples = []
+        for character, character_samples in characters.items():
+            labels.extend([character] * len(character_samples))
+            samples.extend(character_samples)
+
+        glyphs_array    = _numpy.stack(images).reshape(len(images), 1, -1)
+        samples_array   = _numpy.stack(samples).reshape(1, len(samples), -1)
+
+        scores = 1.0 - _numpy.abs(glyphs_array - samples_array).sum(axis = 2) / _numpy.maximum(glyphs_array.sum(axis = 2) + samples_array.sum(axis = 2), 1e-6)
+
+        best_indices    = scores.argmax(axis = 1)
+        best_scores     = scores[_numpy.arange(len(images)), best_indices]
+
+        return [labels[index] if score >= _MIN_GLYPH_SCORE else _UNKNOWN_CHARACTER for index, score in zip(best_indices.tolist(), best_scores.tolist())]
+
+
+def _compare(a : _numpy.ndarray, b : _numpy.ndarray) -> float:
+    """
+    Returns
+        Similarity of two normalized glyph images. From 0.0 (nothing in common) to 1.0 (same).
+    """
+    return 1.0 - float(_numpy.abs(a - b).sum() / max(float(a.sum() + b.sum()), 1e-6))
+
+
+class TemplateRecognizer(Recognizer):
+    """
+    Reads text of in-game exp tooltip by matching glyphs with samples from glyph atlas.
+    Only needs NumPy and OpenCV.
+
+    Samples of glyphs are learned from text fragments read by fallback recognizer (EasyOCR),
+    so glyphs are taken directly from font used by "Path of Exile" in current resolution.
+    """
+    _atlas                  : GlyphAtlas
+    _atlas_file_name        : str | None
+    _fallback               : EasyOCRRecognizer | None
+    _last_text              : str
+
+    def __init__(self, atlas_file_name : str | None = None, fallback : EasyOCRRecognizer | None = None):
+        """
+        atlas_file_name
+            File where learned glyph samples are stored.
+            None - Glyph samples are not stored.
+        fallback
+            Used when text can't be recognized by template matching.
+            Glyph samples are learned from text read by this recognizer.
+        """
+        self._atlas             = GlyphAtlas()
+        self._atlas_file_name   = atlas_file_name
+        self._fallback          = fallback
+        self._last_text         = ""
+
+        if atlas_file_name is not None:
+            try:
+                self._atlas.load(atlas_file_name)
+            except (OSError, ValueError, KeyError) as exception:
+                to_logger().warning(f"Can't load glyph atlas. {str(exception)}")
+
+    def get_name(self) -> str:
+        return "template"
+
+    def get_last_text(self) -> str:
+        return self._last_text
+
+    def to_atlas(self) -> GlyphAtlas:
+        return self._atlas
+
+    def read_text(self, image : _numpy.ndarray) -> str:
+        """
+        Returns
+            Text of in-game exp tooltip. Unknown characters are replaced by '?'.
+        """
+        height = image.shape[0]
+
+        if not self._atlas.is_any(height):
+            return ""
+
+        lines = segment_glyphs(image)
+
+        full_text = ""
+        for glyphs in lines:
+            characters = self._atlas.match(height, [glyph.image for glyph in glyphs])
+
+            line_height = glyphs[0].bottom - glyphs[0].top if glyphs else 0
+            previous : Glyph | None = None
+
+            for glyph, character in zip(glyphs, characters):
+                if previous and (glyph.left - previous.right) > line_height * _SPACE_TO_HEIGHT_RATIO:
+                    full_text += " "
+                full_text += character
+                previous = glyph
+
+            full_text += " "
+
+        return full_text
+
+    def set_stage_timer(self, stage_timer : StageTimer | None):
+        super().set_stage_timer(stage_timer)
+        if self._fallback is not None:
+            self._fallback.set_stage_timer(stage_timer)
+
+    def recognize_exp(self, image : _numpy.ndarray) -> int | None:
+        with self._measure_stage("ocr"):
+            self._last_text = self.read_text(image)
+
+        if to_logger().isEnabledFor(_logging.DEBUG):
+            to_logger().debug(f"Template Matched In-Game Exp Tooltip Text: \"{self._last_text}\".")
+
+        with self._measure_stage("parse"):
+            total_exp = parse_current_exp(self._last_text)
+
+        if total_exp is None and self._fallback is not None:
+            to_logger().debug("Template matching failed. Using fallback recognizer.")
+
+            total_exp = self._fallback.recognize_exp(image)
+            self._last_text = self._fallback.get_last_text()
+
+            if total_exp is not None:
+                self.learn(image, self._fallback.get_last_text_fragments())
+
+        return total_exp
+
+    def learn(self, image : _numpy.ndarray, text_fragments : list[TextFragment]) -> int:
+        """
+        Adds glyph samples from image of in-game exp tooltip, where text fragments are already known.
+        Text fragment is used only if number of glyphs in its area is equal to number of its non-space characters.
+
+        Returns
+            Number of added glyph samples.
+        """
+        height = image.shape[0]
+        glyphs = [glyph for line in segment_glyphs(image) for glyph in line]
+
+        number_of_added = 0
+
+        for text_fragment in text_fragments:
+            points = (text_fragment.polygon.lb, text_fragment.polygon.rb, text_fragment.polygon.rt, text_fragment.polygon.lt)
+            left    = min(point.x for point in points)
+            right   = max(point.x for point in points)
+            top     = min(point.y for point in points)
+            bottom  = max(point.y for point in points)
+
+            characters = text_fragment.text.replace(" ", "")
+            fragment_glyphs = [glyph for glyph in glyphs if left <= glyph.get_center_x() <= right and top <= glyph.get_center_y() <= bottom]
+
+            if len(characters) == len(fragment_glyphs):
+                for character, glyph in zip(characters, fragment_glyphs):
+                    if character in LEARNABLE_CHARACTERS and self._atlas.add(height, character, glyph.image):
+                        number_of_added += 1
+
+        if number_of_added > 0:
+            to_logger().info(f"Learned {number_of_added} new glyph sample(s) for template recognizer.")
+
+            if self._atlas_file_name is not None:
+                self._atlas.save(self._atlas_file_name)
+
+        return number_of_added
+
+
+class CachedRecognizer(Recognizer):
+    """
+    Remembers results of wrapped recognizer for most recently seen images of in-game exp tooltip.
+    Images are identified by hash of their binarized form, so repeated measurement of unchanged tooltip skips recognition.
+    Only successful recognitions are cached.
+    """
+    _recognizer     : Recognizer
+    _max_size       : int
+    _cache          : _OrderedDict[bytes, tuple[int, str]] # key: hash of binarized image, value: (total exp, text)
+    _last_text      : str
+    _number_of_hits     : int
+    _number_of_misses   : int
+
+    def __init__(self, recognizer : Recognizer, max_size : int):
+        """
+        max_size
+            Maximal number of cached results. Least recently used result is removed first.
+        """
+        self._recognizer        = recognizer
+        self._max_size          = max(max_size, 1)
+        self._cache             = _OrderedDict()
+        self._last_text         = ""
+        self._number_of_hits    = 0
+        self._number_of_misses  = 0
+
+    def get_name(self) -> str:
+        return self._recognizer.get_name()
+
+    def get_last_text(self) -> str:
+        return self._last_text
+
+    def to_recognizer(self) -> Recognizer:
+        return self._recognizer
+
+    def get_number_of_hits(self) -> int:
+        return self._number_of_hits
+
+    def get_number_of_misses(self) -> int:
+        return self._number_of_misses
+
+    def clear(self):
+        self._cache.clear()
+
+    def set_stage_timer(self, stage_timer : StageTimer | None):
+        super().set_stage_timer(stage_timer)
+        self._recognizer.set_stage_timer(stage_timer)
+
+    def recognize_exp(self, image : _numpy.ndarray) -> int | None:
+        with self._measure_stage("cache"):
+            key = _hash_image(binarize(image))
+
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+            self._number_of_hits += 1
+            to_logger().debug(f"Recognition cache hit. (hits={self._number_of_hits}, misses={self._number_of_misses})")
+
+            cached_total_exp, self._last_text = result
+            return cached_total_exp
+
+        self._number_of_misses += 1
+        to_logger().debug(f"Recognition cache miss. (hits={self._number_of_hits}, misses={self._number_of_misses})")
+
+        total_exp : int | None = self._recognizer.recognize_exp(image)
+        self._last_text = self._recognizer.get_last_text()
+
+        # failure isn't cached, so same image is recognized again
+        if total_exp is None:
+            return None
+
+        self._cache[key] = (total_exp, self._last_text)
+        if len(self._cache) > self._max_size:
+            self._cache.popitem(last = False)
+
+        return total_exp
+
+
+def _hash_image(image : _numpy.ndarray) -> bytes:
+    hash_ = _blake2b(digest_size = 16)
+    hash_.update(str(image.shape).encode())
+    hash_.update(_numpy.ascontiguousarray(image).data)
+    return hash_.digest()
+
+
+def create_recognizer(settings : Settings) -> Recognizer:
+    """
+    Creates recognizer selected by 'recognizer_engine' setting.
+    Wraps it in cache, if 'recognition_cache_size' setting is positive.
+    """
+    recognizer = _create_engine(settings)
+
+    cache_size = settings.get_int("recognition_cache_size")
+    if cache_size > 0:
+        return CachedRecognizer(recognizer, cache_size)
+
+    return recognizer
+
+
+def _create_engine(settings : Settings) -> Recognizer:
+    engine_name = settings.get_str("recognizer_engine")
+
+    if engine_name not in RECOGNIZER_ENGINE_NAMES:
+        to_logger().error(f"Unknown recognizer engine \"{engine_name}\". Using \"easyocr\" instead.")
+        engine_name = "easyocr"
+
+    to_logger().info(f"Recognizer Engine: {engine_name}")
+
+    if engine_name == "template":
+        atlas_file_name = settings.get_str("_data_path") + "\\cache\\glyph_atlas.npz"
+        return TemplateRecognizer(atlas_file_name, EasyOCRRecognizer(settings))
+
+    return EasyOCRRecognizer(settings)
@@ -0,0 +1,263 @@
+import sys      as _sys
+import ctypes   as _ctypes
+import numpy    as _numpy
+import cv2      as _cv2
+
+from typing import Any
+
+from .LogManager import to_logger
+
+
+class ScreenCapture:
+    """
+    Grabs rectangular region of screen.
+    """
+    def grab(self, left : int, top : int, width : int, height : int) -> _numpy.ndarray:
+        """
+        left, top
+            Position of region on screen, in pixels.
+        width, height
+            Size of region, in pixels.
+
+        Returns
+            Image of region in OpenCV format (BGR).
+            Returned array is reused by next call of 'grab', so it needs to be copied to be kept.
+            Part of region which is outside of screen is black.
+        """
+        raise NotImplementedError("This method need to be overridden.")
+
+    def close(self):
+        pass
+
+
+class _ImageBuffer:
+    """
+    Reusable BGR image, reallocated only when size changes.
+    """
+    _image : _numpy.ndarray
+
+    def __init__(self):
+        self._image = _numpy.zeros((0, 0, 3), dtype = _numpy.uint8)
+
+    def to_image(self, width : int, height : int) -> _numpy.ndarray:
+        if self._image.shape[0] != height or self._image.shape[1] != width:
+            self._image = _numpy.zeros((height, width, 3), dtype = _numpy.uint8)
+        return self._image
+
+
+class FileScreenCapture(ScreenCapture):
+    """
+    Grabs region from image file instead of screen.
+    For tests, benchmarks and measuring from screenshots.
+    """
+    _screen : _numpy.ndarray
+    _buffer : _ImageBuffer
+
+    def __init__(self, file_name : str | None = None):
+        """
+        file_name
+            Image file, which is used as screen.
+            None - Screen is empty until 'load' or 'set_screen' is called.
+        """
+        self._screen = _numpy.zeros((0, 0, 3), dtype = _numpy.uint8)
+        self._buffer = _ImageBuffer()
+
+        if file_name is not None:
+            self.load(file_name)
+
+    def load(self, file_name : str):
+        """
+        Raises
+            ValueError - When file is not an image.
+        """
+        # 'imdecode' instead of 'imread', because 'imread' can't open files with non-ascii characters in path on Windows.
+        screen = _cv2.imdecode(_numpy.fromfile(file_name, dtype = _numpy.uint8), _cv2.IMREAD_COLOR)
+        if screen is None:
+            raise ValueError(f"Can't decode image from file \"{file_name}\".")
+        self._screen = screen
+
+    def set_screen(self, screen : _numpy.ndarray):
+        """
+        screen
+            Image in OpenCV format (BGR). Not copied.
+        """
+        self._screen = screen
+
+    def get_screen_size(self) -> tuple[int, int]:
+        """
+        Returns
+            Width and height of screen image.
+        """
+        return self._screen.shape[1], self._screen.shape[0]
+
+    def grab(self, left : int, top : int, width : int, height : int) -> _numpy.ndarray:
+        image = self._buffer.to_image(width, height)
+
+        screen_height, screen_width = self._screen.shape[:2]
+
+        source_left     = max(left, 0)
+        source_top      = max(top, 0)
+        source_right    = min(left + width, screen_width)
+        source_bottom   = min(top + height, screen_height)
+
+        if source_left >= source_right or source_top >= source_bottom:
+            image.fill(0)
+        else:
+            if source_left != left or source_top != top or source_right != left + width or source_bottom != top + height:
+                image.fill(0)
+
+            image[source_top - top:source_bottom - top, source_left - left:source_right - left] = self._screen[source_top:source_bottom, source_left:source_right]
+
+        return image
+
+
+class PillowScreenCapture(ScreenCapture):
+    """
+    Grabs region with Pillow. Used when there is no faster backend.
+    """
+    _buffer : _ImageBuffer
+
+    def __init__(self):
+        self._buffer = _ImageBuffer()
+
+    def grab(self, left : int, top : int, width : int, height : int) -> _numpy.ndarray:
+        from PIL import ImageGrab as _ImageGrab
+
+        region = _ImageGrab.grab(bbox = (left, top, left + width, top + height))
+
+        image = self._buffer.to_image(width, height)
+        _cv2.cvtColor(_numpy.asarray(region.convert("RGB")), _cv2.COLOR_RGB2BGR, dst = image)
+        return image
+
+
+class _BITMAPINFOHEADER(_ctypes.Structure):
+    _fields_ = [
+        ("biSize",          _ctypes.c_uint32),
+        ("biWidth",         _ctypes.c_int32),
+        ("biHeight",        _ctypes.c_int32),
+        ("biPlanes",        _ctypes.c_uint16),
+        ("biBitCount",      _ctypes.c_uint16),
+        ("biCompression",   _ctypes.c_uint32),
+        ("biSizeImage",     _ctypes.c_uint32),
+        ("biXPelsPerMeter", _ctypes.c_int32),
+        ("biYPelsPerMeter", _ctypes.c_int32),
+        ("biClrUsed",       _ctypes.c_uint32),
+        ("biClrImportant",  _ctypes.c_uint32),
+    ]
+
+
+_BI_RGB         = 0
+_DIB_RGB_COLORS = 0
+_SRCCOPY        = 0x00CC0020
+_CAPTUREBLT     = 0x40000000
+
+
+class GDIScreenCapture(ScreenCapture):
+    """
+    Grabs only requested region with GDI 'BitBlt' into DIB section, which memory is directly viewed as NumPy array.
+    DIB section is reused while size of region doesn't change. Windows only.
+    """
+    _user32         : Any # ctypes.WinDLL
+    _gdi32          : Any # ctypes.WinDLL
+
+    _screen_dc      : int | None
+    _memory_dc      : int | None
+    _bitmap         : int | None
+    _old_bitmap     : int | None
+    _bgra           : _numpy.ndarray    # view on memory of DIB section
+    _buffer         : _ImageBuffer
+
+    def __init__(self):
+        self._user32 = _ctypes.windll.user32
+        self._gdi32  = _ctypes.windll.gdi32
+
+        HANDLE = _ctypes.c_void_p
+
+        self._user32.GetDC.argtypes                 = [HANDLE]
+        self._user32.GetDC.restype                  = HANDLE
+        self._user32.ReleaseDC.argtypes             = [HANDLE, HANDLE]
+        self._gdi32.CreateCompatibleDC.argtypes     = [HANDLE]
+        self._gdi32.CreateCompatibleDC.restype      = HANDLE
+        self._gdi32.CreateDIBSection.argtypes       = [HANDLE, _ctypes.c_void_p, _ctypes.c_uint32, _ctypes.POINTER(_ctypes.c_void_p), HANDLE, _ctypes.c_uint32]
+        self._gdi32.CreateDIBSection.restype        = HANDLE
+        self._gdi32.SelectObject.argtypes           = [HANDLE, HANDLE]
+        self._gdi32.SelectObject.restype            = HANDLE
+        self._gdi32.BitBlt.argtypes                 = [HANDLE, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, HANDLE, _ctypes.c_int, _ctypes.c_int, _ctypes.c_uint32]
+        self._gdi32.DeleteObject.argtypes           = [HANDLE]
+        self._gdi32.DeleteDC.argtypes               = [HANDLE]
+
+        self._screen_dc     = self._user32.GetDC(None)
+        self._memory_dc     = self._gdi32.CreateCompatibleDC(self._screen_dc)
+        self._bitmap        = None
+        self._old_bitmap    = None
+        self._bgra          = _numpy.zeros((0, 0, 4), dtype = _numpy.uint8)
+        self._buffer        = _ImageBuffer()
+
+    def _prepare_bitmap(self, width : int, height : int):
+        if self._bgra.shape[0] == height and self._bgra.shape[1] == width:
+            return
+
+        self._release_bitmap()
+
+        header = _BITMAPINFOHEADER()
+        header.biSize           = _ctypes.sizeof(_BITMAPINFOHEADER)
+        header.biWidth          = width
+        header.biHeight         = -height # top-down
+        header.biPlanes         = 1
+        header.biBitCount       = 32
+        header.biCompression    = _BI_RGB
+
+        bits = _ctypes.c_void_p()
+        self._bitmap = self._gdi32.CreateDIBSection(self._memory_dc, _ctypes.byref(header), _DIB_RGB_COLORS, _ctypes.byref(bits), None, 0)
+        if not self._bitmap or not bits.value:
+            raise RuntimeError("Can't create DIB section for screen capture.")
+
+        self._old_bitmap = self._gdi32.SelectObject(self._memory_dc, self._bitmap)
+
+        pixels = (_ctypes.c_uint8 * (width * height * 4)).from_address(bits.value)
+        self._bgra = _numpy.ctypeslib.as_array(pixels).reshape(height, width, 4)
+
+    def _release_bitmap(self):
+        if self._bitmap:
+            self._gdi32.SelectObject(self._memory_dc, self._old_bitmap)
+            self._gdi32.DeleteObject(self._bitmap)
+            self._bitmap = None
+            self._old_bitmap = None
+            self._bgra = _numpy.zeros((0, 0, 4), dtype = _numpy.uint8)
+
+    def grab(self, left : int, top : int, width : int, height : int) -> _numpy.ndarray:
+        self._prepare_bitmap(width, height)
+
+        self._bgra.fill(0)
+        if not self._gdi32.BitBlt(self._memory_dc, 0, 0, width, height, self._screen_dc, left, top, _SRCCOPY | _CAPTUREBLT):
+            to_logger().warning("BitBlt failed while grabbing region of screen.")
+        self._gdi32.GdiFlush()
+
+        image = self._buffer.to_image(width, height)
+        _cv2.cvtColor(self._bgra, _cv2.COLOR_BGRA2BGR, dst = image)
+        return image
+
+    def close(self):
+        self._release_bitmap()
+
+        if self._memory_dc:
+            self._gdi32.DeleteDC(self._memory_dc)
+            self._memory_dc = None
+
+        if self._screen_dc:
+            self._user32.ReleaseDC(None, self._screen_dc)
+            self._screen_dc = None
+
+
+def create_screen_capture() -> ScreenCapture:
+    """
+    Returns
+        Fastest screen capture backend available on current system.
+    """
+    if _sys.platform == "win32":
+        try:
+            return GDIScreenCapture()
+        except (OSError, AttributeError) as exception:
+            to_logger().warning(f"Can't use GDI screen capture. Using Pillow instead. {str(exception)}")
+
+    return PillowScreenCapture()
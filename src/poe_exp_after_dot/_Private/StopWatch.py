@@ -1,4 +1,9 @@
-from time import time as _get_time
+import threading as _threading
+
+from time           import time as _get_time, perf_counter as _perf_counter
+from collections    import deque as _deque
+from contextlib     import contextmanager as _contextmanager
+from typing         import Iterator
 
 class StopWatch:
     _start          : float     # in seconds
@@ -42,4 +47,111 @@ class StopWatch:
         Returns
             Time from the epoch in seconds.
         """
-        return self._stop
\ No newline at end of file
+        return self._stop
+
+
+def get_percentile(sorted_values : list[float], percent : int) -> float:
+    """
+    Nearest rank method.
+
+    sorted_values
+        Need to be sorted in ascending order and not empty.
+    """
+    return sorted_values[max(-(-len(sorted_values) * percent // 100) - 1, 0)]
+
+
+class StageStatistics:
+    p50     : float     # in seconds
+    p95     : float     # in seconds
+    max     : float     # in seconds
+    count   : int       # number of durations in window
+
+    def __init__(self, p50 : float, p95 : float, max_ : float, count : int):
+        self.p50    = p50
+        self.p95    = p95
+        self.max    = max_
+        self.count  = count
+
+
+class StageTimer:
+    """
+    Measures durations of named stages with high-resolution clock.
+    Keeps only last durations of each stage (rolling window), from which statistics are computed.
+    Stages can be measured from any thread.
+    """
+    _window_size    : int
+    _durations      : dict[str, _deque[float]] # key: stage name, value: durations in seconds
+    _lock           : _threading.Lock
+    _local          : _threading.local          # 'collectors' - list of dictionaries from 'collect' of this thread
+
+    def __init__(self, *, window_size : int = 100):
+        """
+        window_size
+            Number of last durations kept for each stage.
+        """
+        self._window_size   = max(window_size, 1)
+        self._durations     = {}
+        self._lock          = _threading.Lock()
+        self._local         = _threading.local()
+
+    @_contextmanager
+    def measure(self, stage_name : str) -> Iterator[None]:
+        """
+        Measures duration of code in 'with' block. Duration is added even if exception is raised.
+        """
+        begin = _perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage_name, _perf_counter() - begin)
+
+    @_contextmanager
+    def collect(self) -> Iterator[dict[str, float]]:
+        """
+        Durations of stages measured by current thread inside 'with' block are also summed up in yielded dictionary.
+        Key is stage name, value is duration in seconds.
+        """
+        collected : dict[str, float] = {}
+
+        collectors = self._local.__dict__.setdefault("collectors", [])
+        collectors.append(collected)
+        try:
+            yield collected
+        finally:
+            collectors.pop()
+
+    def add(self, stage_name : str, duration : float):
+        """
+        duration
+            In seconds.
+        """
+        with self._lock:
+            durations = self._durations.get(stage_name)
+            if durations is None:
+                durations = self._durations[stage_name] = _deque(maxlen = self._window_size)
+            durations.append(duration)
+
+        for collected in getattr(self._local, "collectors", ()):
+            collected[stage_name] = collected.get(stage_name, 0.0) + duration
+
+    def get_statistics(self, stage_name : str) -> StageStatistics | None:
+        """
+        Returns
+            Statistics of durations in window.
+            None    - If stage hasn't been measured yet.
+        """
+        with self._lock:
+            durations = sorted(self._durations.get(stage_name, ()))
+
+        if not durations:
+            return None
+
+        return StageStatistics(get_percentile(durations, 50), get_percentile(durations, 95), durations[-1], len(durations))
+
+    def get_stage_names(self) -> list[str]:
+        with self._lock:
+            return list(self._durations.keys())
+
+    def clear(self):
+        with self._lock:
+            self._durations.clear()
@@ -0,0 +1,148 @@
+import os           as _os
+import json         as _json
+import threading    as _threading
+
+from datetime   import datetime as _datetime
+from typing     import Any, Iterator
+
+from .LogManager import to_logger
+from .StopWatch  import get_percentile
+
+
+TELEMETRY_BACKUP_COUNT = 3 # number of rotated files kept beside current one ('<file_name>.1' is the newest)
+
+
+class TelemetryLog:
+    """
+    Appends one compact JSON record per line (JSONL).
+    When file exceeds maximal size, it's rotated: '<file_name>' -> '<file_name>.1' -> ... -> '<file_name>.<TELEMETRY_BACKUP_COUNT>'.
+    Records can be appended from any thread.
+    """
+    _file_name  : str
+    _max_size   : int
+    _lock       : _threading.Lock
+
+    def __init__(self, file_name : str, max_size : int):
+        """
+        max_size
+            In bytes. Maximal size of file, after which it's rotated.
+        """
+        self._file_name = file_name
+        self._max_size  = max(max_size, 1)
+        self._lock      = _threading.Lock()
+
+    def get_file_name(self) -> str:
+        return self._file_name
+
+    def append(self, record : dict[str, Any]):
+        line = _json.dumps(record, separators = (",", ":")) + "\n"
+
+        with self._lock:
+            try:
+                _os.makedirs(_os.path.dirname(self._file_name), exist_ok = True)
+
+                if _os.path.isfile(self._file_name) and _os.path.getsize(self._file_name) + len(line) > self._max_size:
+                    self._rotate()
+
+                with open(self._file_name, "a") as file:
+                    file.write(line)
+            except OSError as exception:
+                to_logger().warning(f"Can't write telemetry record. {str(exception)}")
+
+    def _rotate(self):
+        for index in range(TELEMETRY_BACKUP_COUNT - 1, 0, -1):
+            older_file_name = f"{self._file_name}.{index}"
+            if _os.path.isfile(older_file_name):
+                _os.replace(older_file_name, f"{self._file_name}.{index + 1}")
+
+        _os.replace(self._file_name, f"{self._file_name}.1")
+
+
+def iterate_records(file_name : str) -> Iterator[dict[str, Any]]:
+    """
+    Streams records from rotated files and current file, from the oldest to the newest.
+    Malformed lines are skipped.
+    """
+    file_names = [f"{file_name}.{index}" for index in range(TELEMETRY_BACKUP_COUNT, 0, -1)] + [file_name]
+
+    for file_name_ in file_names:
+        if not _os.path.isfile(file_name_):
+            continue
+
+        with open(file_name_, "r") as file:
+            for line in file:
+                try:
+                    record = _json.loads(line)
+                except ValueError:
+                    continue
+
+                if isinstance(record, dict):
+                    yield record
+
+
+class _GroupStatistics:
+    count           : int
+    failures        : int
+    latencies       : list[float]               # in milliseconds, capture + recognize
+    stage_durations : dict[str, list[float]]    # key: stage name, value: durations in milliseconds
+
+    def __init__(self):
+        self.count              = 0
+        self.failures           = 0
+        self.latencies          = []
+        self.stage_durations    = {}
+
+
+def create_perf_report(file_name : str) -> str:
+    """
+    Summarizes telemetry records for each engine, layout, version and day:
+    number of measurements, failure rate and latency percentiles (capture + recognize),
+    then percentiles of each stage, so one stage can be compared across engines.
+
+    Returns
+        Text of report.
+    """
+    groups : dict[tuple[str, str, str, str], _GroupStatistics] = {}
+
+    for record in iterate_records(file_name):
+        try:
+            day     = _datetime.fromtimestamp(float(record["time"])).strftime("%Y-%m-%d")
+            key     = (str(record["engine"]), str(record["layout"]), str(record.get("version", "")), day)
+            stages  = {str(stage_name) : float(duration) for stage_name, duration in record["stages"].items()}
+            latency = stages.get("capture", 0.0) + stages.get("recognize", 0.0)
+            is_success = bool(record["is_success"])
+        except (KeyError, ValueError, TypeError, AttributeError):
+            continue
+
+        group = groups.setdefault(key, _GroupStatistics())
+        group.count += 1
+        group.failures += int(not is_success)
+        group.latencies.append(latency)
+        for stage_name, duration in stages.items():
+            group.stage_durations.setdefault(stage_name, []).append(duration)
+
+    if not groups:
+        return f"There are no telemetry records in \"{file_name}\"."
+
+    lines = [f"{'engine':<10} {'layout':<10} {'version':<8} {'day':<10} {'count':>7} {'failures':>9} {'p50 [ms]':>9} {'p95 [ms]':>9} {'max [ms]':>9}"]
+
+    for (engine, layout, version, day), group in sorted(groups.items()):
+        latencies = sorted(group.latencies)
+        lines.append(
+            f"{engine:<10} {layout:<10} {version:<8} {day:<10} {group.count:>7} {group.failures / group.count:>9.1%} "
+            f"{get_percentile(latencies, 50):>9.1f} {get_percentile(latencies, 95):>9.1f} {latencies[-1]:>9.1f}"
+        )
+
+    lines.append("")
+    lines.append(f"{'engine':<10} {'layout':<10} {'version':<8} {'day':<10} {'stage':<10} {'count':>7} {'p50 [ms]':>9} {'p95 [ms]':>9} {'max [ms]':>9}")
+
+    # stages in order of their first appearance in records
+    for (engine, layout, version, day), group in sorted(groups.items()):
+        for stage_name, durations in group.stage_durations.items():
+            durations = sorted(durations)
+            lines.append(
+                f"{engine:<10} {layout:<10} {version:<8} {day:<10} {stage_name:<10} {len(durations):>7} "
+                f"{get_percentile(durations, 50):>9.1f} {get_percentile(durations, 95):>9.1f} {durations[-1]:>9.1f}"
+            )
+
+    return "\n".join(lines)
@@ -0,0 +1,70 @@
+import numpy    as _numpy
+import cv2      as _cv2
+
+from poe_exp_after_dot._Private.Recognizers import TextFragment
+
+
+_FONT               = _cv2.FONT_HERSHEY_SIMPLEX
+_BACKGROUND_COLOR   = (12, 16, 20)
+_LABEL_COLOR        = (150, 160, 170)
+_VALUE_COLOR        = (230, 230, 230)
+_TEXT_TO_HEIGHT_RATIO = 0.25    # height of digits relative to height of tooltip image, in two lines mode
+
+
+def format_exp(exp : int, separator : str) -> str:
+    """
+    separator
+        Thousands separator, one of: ",", ".", " ".
+    """
+    return f"{exp:,}".replace(",", separator)
+
+
+def render_tooltip(current_exp : str, next_level_exp : str, *, height : int = 73, width : int = 600, is_two_lines : bool = False) -> tuple[_numpy.ndarray, list[TextFragment]]:
+    """
+    Renders synthetic in-game exp tooltip with OpenCV font.
+
+    is_two_lines
+        False   - "Current Exp: <current_exp> Next Level: <next_level_exp>" in one line, font scaled only with height.
+        True    - "Next Level: <next_level_exp>" is in second line, font is scaled to fit into image.
+
+    Returns
+        Image of synthetic in-game exp tooltip (BGR) and text fragments (words) with their areas.
+    """
+    lines = [["Current", "Exp:", current_exp], ["Next", "Level:", next_level_exp]] if is_two_lines else [["Current", "Exp:", current_exp, "Next", "Level:", next_level_exp]]
+
+    if is_two_lines:
+        # scale is found from size of text for scale 1.0, lines need to be separated by gap (with descenders too)
+        text_height = _cv2.getTextSize("0", _FONT, 1.0, 1)[0][1]
+        scale = height * _TEXT_TO_HEIGHT_RATIO / text_height
+        word_gap = max(round(height * _TEXT_TO_HEIGHT_RATIO), 4)
+
+        max_line_width = max(sum(_cv2.getTextSize(word, _FONT, scale, 1)[0][0] for word in words) + (len(words) - 1) * word_gap for words in lines)
+        if max_line_width > width - 20:
+            scale *= (width - 20) / max_line_width
+            word_gap = max(round(word_gap * (width - 20) / max_line_width), 4)
+
+        baselines = [height * 2 // 5, height * 17 // 20]
+    else:
+        scale = 0.7 * height / 73
+        word_gap = 12
+        baselines = [height * 2 // 5]
+
+    image = _numpy.full((height, width, 3), _BACKGROUND_COLOR, dtype = _numpy.uint8)
+
+    text_fragments = []
+
+    for words, y in zip(lines, baselines):
+        x = 10
+
+        for word in words:
+            color = _VALUE_COLOR if word[0].isdigit() else _LABEL_COLOR
+
+            (text_width, text_height), baseline = _cv2.getTextSize(word, _FONT, scale, 1)
+            _cv2.putText(image, word, (x, y), _FONT, scale, color, 1, _cv2.LINE_AA)
+
+            left, right, top, bottom = x - 1, x + text_width + 1, y - text_height - 2, y + baseline + 1
+            text_fragments.append(TextFragment(([[left, top], [right, top], [right, bottom], [left, bottom]], word)))
+
+            x += text_width + word_gap
+
+    return image, text_fragments
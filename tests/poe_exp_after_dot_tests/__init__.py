@@ -7,10 +7,25 @@ poe_exp_after_dot_tests unit_tests [<option>...] [-- <pytest_argument>...]
         Run test in specified default order.
 
 Note: 'pytest' is executed from '<project_path>\\tests\\poe_exp_after_dot_tests\\unit_tests' directory. 
+
+poe_exp_after_dot_tests benchmarks [<option>...]
+<option>
+    --suites=<suite_name>[,<suite_name>...]
+        Benchmarks to run (default: all). Suites: recognizers, register.
+    --engines=<engine_name>[,<engine_name>...]
+        Recognizer engines to benchmark (default: all). Not available engines are skipped.
+    --repeat=<number>
+        Number of recognitions of each sample (default: 3).
+    --easyocr-profile=<name>=<value>[,<name>=<value>...]
+        Overrides values of default EasyOCR profile, names are same as in 'easyocr_profile' setting.
+        For example: --easyocr-profile=device=cpu,number_of_threads=4,is_quantize=false
+    --entries=<number>
+        Number of entries added to exp data register by 'register' suite (default: 1000000).
 """
 import sys as _sys
 
 from .              import unit_tests as _unit_tests
+from .              import benchmarks as _benchmarks
 from .unit_tests    import _CommandArgumentError
 
 
@@ -22,6 +37,8 @@ def _run(mode : str, arguments : list[str]) -> int:
     match mode:
         case "unit_tests":
             return _unit_tests._parse_and_run(arguments)
+        case "benchmarks":
+            return _benchmarks._parse_and_run(arguments)
         case _:
             raise _CommandArgumentError(f"Undefined mode \"{mode}\".")
 
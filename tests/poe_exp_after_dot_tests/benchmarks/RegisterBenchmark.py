@@ -0,0 +1,70 @@
+from time import perf_counter as _perf_counter
+
+from poe_exp_after_dot._Private.Measurer import Measurer
+
+
+# exp of level 90 (base: 1_934_009_687, to next: 160_890_604), fits many small steps
+_BASE_EXP       = 1_934_009_687
+_EXP_STEP       = 10
+_TIME_STEP      = 1.0   # in seconds
+
+# number of times each navigation is repeated
+_NAVIGATIONS    = 10_000
+
+
+class RegisterBenchmarkResult:
+    number_of_entries   : int
+    timings             : dict[str, float] # key: operation name, value: duration, in seconds
+
+    def __init__(self, number_of_entries : int):
+        self.number_of_entries  = number_of_entries
+        self.timings            = {}
+
+    def to_report(self) -> str:
+        lines = [f"Register: {self.number_of_entries} entries"]
+        lines.append(f"    {'operation':<22} {'total [ms]':>11} {'per op [us]':>12}")
+
+        for operation_name, duration in self.timings.items():
+            number_of_operations = self.number_of_entries if operation_name == "update" else _NAVIGATIONS
+            lines.append(f"    {operation_name:<22} {duration * 1000:>11.1f} {duration * 1_000_000 / number_of_operations:>12.2f}")
+
+        return "\n".join(lines)
+
+
+def run_register_benchmark(number_of_entries : int) -> RegisterBenchmarkResult:
+    """
+    Measures appending of entries (through 'Measurer.update'), navigation over them and cutting them.
+    """
+    result = RegisterBenchmarkResult(number_of_entries)
+    measurer = Measurer()
+
+    begin = _perf_counter()
+    for index in range(number_of_entries):
+        measurer.update(_BASE_EXP + index * _EXP_STEP, index * _TIME_STEP)
+    result.timings["update"] = _perf_counter() - begin
+
+    begin = _perf_counter()
+    for _ in range(_NAVIGATIONS):
+        measurer.go_to_previous_entry()
+        measurer.get_exp_per_hour()
+    result.timings["previous + read"] = _perf_counter() - begin
+
+    begin = _perf_counter()
+    for _ in range(_NAVIGATIONS):
+        measurer.go_to_first_entry()
+        measurer.go_to_last_entry()
+        measurer.get_total_exp()
+    result.timings["first + last + read"] = _perf_counter() - begin
+
+    # newest entry is cut, then measured again
+    begin = _perf_counter()
+    for _ in range(_NAVIGATIONS):
+        measurer.go_to_last_entry()
+        total_exp = measurer.get_total_exp()
+        time_ = measurer.get_time_since_epoch()
+
+        measurer.remove_current_entry_and_all_entries_above()
+        measurer.update(total_exp, time_)
+    result.timings["cut + update"] = _perf_counter() - begin
+
+    return result
@@ -0,0 +1,278 @@
+import os       as _os
+import numpy    as _numpy
+
+from time import perf_counter as _perf_counter
+
+from poe_exp_after_dot._Private.Settings    import Settings
+from poe_exp_after_dot._Private.Recognizers import Recognizer, EasyOCRRecognizer, EasyOCRProfile, TemplateRecognizer, RECOGNIZER_ENGINE_NAMES
+
+from ..TooltipRenderer      import render_tooltip, format_exp
+from ..unit_tests           import _CommandArgumentError
+from .RegisterBenchmark     import run_register_benchmark
+
+
+_EXIT_SUCCESS = 0
+_EXIT_FAILURE = 1
+
+SUITE_NAMES = ["recognizers", "register"]
+
+
+# name: (in_game_exp_tooltip_width, in_game_exp_tooltip_height), same as default layouts in 'Overlay'
+LAYOUT_TOOLTIP_SIZES = {
+    "1280x720"  : (286 + 40, 46),
+    "1920x1080" : (446 + 40, 73),
+    "2560x1440" : (587 + 40, 97),
+    "3840x2160" : (893 + 40, 147),
+}
+
+# thousands separators accepted by 'parse_current_exp'
+SEPARATORS = [",", ".", " "]
+
+EXP_MAGNITUDES = [0, 525, 91_574, 1_234_567, 54_180_008, 987_654_321, 4_250_334_443]
+
+# contains all digits, used to teach template recognizer before benchmark
+_TRAINING_EXP = 1_234_567_890
+
+
+class Sample:
+    layout_name     : str
+    separator       : str
+    expected_exp    : int
+    image           : _numpy.ndarray
+
+    def __init__(self, layout_name : str, separator : str, expected_exp : int, image : _numpy.ndarray):
+        self.layout_name    = layout_name
+        self.separator      = separator
+        self.expected_exp   = expected_exp
+        self.image          = image
+
+
+def create_corpus() -> list[Sample]:
+    """
+    Returns
+        Synthetic in-game exp tooltips for each default layout, each thousands separator and each exp magnitude.
+    """
+    corpus = []
+
+    for layout_name, (width, height) in LAYOUT_TOOLTIP_SIZES.items():
+        for separator in SEPARATORS:
+            for exp in EXP_MAGNITUDES:
+                next_level_exp = exp + exp // 10 + 1
+                image, _ = render_tooltip(format_exp(exp, separator), format_exp(next_level_exp, separator), width = width, height = height, is_two_lines = True)
+                corpus.append(Sample(layout_name, separator, exp, image))
+
+    return corpus
+
+
+class BenchmarkResult:
+    engine_name     : str
+    latencies       : dict[str, list[float]]    # key: layout name, value: latency of each recognition, in seconds
+    correct_counts  : dict[str, int]            # key: layout name
+    sample_counts   : dict[str, int]            # key: layout name
+
+    def __init__(self, engine_name : str):
+        self.engine_name    = engine_name
+        self.latencies      = {}
+        self.correct_counts = {}
+        self.sample_counts  = {}
+
+    def add(self, layout_name : str, latency : float, is_correct : bool):
+        self.latencies.setdefault(layout_name, []).append(latency)
+        self.correct_counts[layout_name] = self.correct_counts.get(layout_name, 0) + int(is_correct)
+        self.sample_counts[layout_name] = self.sample_counts.get(layout_name, 0) + 1
+
+    def to_report(self) -> str:
+        lines = [f"Engine: {self.engine_name}"]
+        lines.append(f"    {'layout':<10} {'samples':>8} {'p50 [ms]':>10} {'p95 [ms]':>10} {'per sec':>9} {'accuracy':>9}")
+
+        for layout_name in list(self.latencies) + ["all"]:
+            if layout_name == "all":
+                latencies   = [latency for layout_latencies in self.latencies.values() for latency in layout_latencies]
+                correct     = sum(self.correct_counts.values())
+                count       = sum(self.sample_counts.values())
+            else:
+                latencies   = self.latencies[layout_name]
+                correct     = self.correct_counts[layout_name]
+                count       = self.sample_counts[layout_name]
+
+            if count == 0:
+                continue
+
+            p50, p95    = _numpy.percentile(latencies, [50, 95]) * 1000
+            throughput  = len(latencies) / sum(latencies) if sum(latencies) > 0 else float("inf")
+
+            lines.append(f"    {layout_name:<10} {count:>8} {p50:>10.2f} {p95:>10.2f} {throughput:>9.1f} {correct / count:>9.1%}")
+
+        return "\n".join(lines)
+
+
+def run_benchmark(engine_name : str, recognizer : Recognizer, corpus : list[Sample], repeat : int) -> BenchmarkResult:
+    """
+    repeat
+        Number of recognitions of each sample. Only result of first recognition counts to accuracy.
+    """
+    result = BenchmarkResult(engine_name)
+
+    for sample in corpus:
+        for index in range(repeat):
+            begin = _perf_counter()
+            total_exp = recognizer.recognize_exp(sample.image)
+            latency = _perf_counter() - begin
+
+            if index == 0:
+                result.add(sample.layout_name, latency, total_exp == sample.expected_exp)
+            else:
+                result.latencies[sample.layout_name].append(latency)
+
+    return result
+
+
+def is_easyocr_available() -> bool:
+    """
+    Returns
+        True    - If EasyOCR models are already downloaded (benchmarks don't use network).
+    """
+    model_path = _os.environ.get("EASYOCR_MODULE_PATH", _os.path.expanduser("~/.EasyOCR")) + "/model"
+    return all(_os.path.isfile(model_path + "/" + file_name) for file_name in ["craft_mlt_25k.pth", "english_g2.pth"])
+
+
+def create_engine(engine_name : str, easyocr_profile : EasyOCRProfile | None = None) -> Recognizer | None:
+    """
+    Template recognizer is taught in advance, with one sample for each layout and each of ',' and '.' separators.
+
+    easyocr_profile
+        None - Default profile.
+
+    Returns
+        None    - If engine is not available.
+    """
+    settings = Settings()
+    settings.set_tmp_bool("_is_debug", False)
+    settings.set_tmp_dict("easyocr_profile", (easyocr_profile or EasyOCRProfile()).to_dict())
+
+    match engine_name:
+        case "template":
+            recognizer = TemplateRecognizer()
+
+            for width, height in LAYOUT_TOOLTIP_SIZES.values():
+                for separator in [",", "."]:
+                    image, text_fragments = render_tooltip(format_exp(_TRAINING_EXP, separator), format_exp(_TRAINING_EXP, separator), width = width, height = height, is_two_lines = True)
+                    recognizer.learn(image, text_fragments)
+
+            return recognizer
+
+        case "easyocr":
+            if not is_easyocr_available():
+                return None
+
+            easyocr_recognizer = EasyOCRRecognizer(settings)
+            try:
+                easyocr_recognizer.wait_until_loaded()
+            except RuntimeError:
+                return None
+
+            print(f"EasyOCR Profile: {easyocr_recognizer.to_profile()}")
+
+            return easyocr_recognizer
+
+    raise _CommandArgumentError(f"Engine \"{engine_name}\" is unknown.")
+
+
+def parse_easyocr_profile(text : str) -> EasyOCRProfile:
+    """
+    text
+        <name>=<value>[,<name>=<value>...], where name is name of value in 'easyocr_profile' setting.
+        For example: "device=cpu,number_of_threads=4".
+
+    Raises
+        _CommandArgumentError - When text is malformed.
+    """
+    profile = EasyOCRProfile()
+    defaults = profile.to_dict()
+
+    for item in text.split(","):
+        name, *value = item.split("=", 1)
+        if name not in defaults or not value:
+            raise _CommandArgumentError(f"Value \"{item}\" of EasyOCR profile is malformed or unknown.")
+
+        default = defaults[name]
+        try:
+            if isinstance(default, bool):
+                if value[0] not in ["true", "false"]:
+                    raise ValueError()
+                setattr(profile, name, value[0] == "true")
+            elif isinstance(default, int):
+                setattr(profile, name, int(value[0]))
+            else:
+                setattr(profile, name, value[0])
+        except ValueError:
+            raise _CommandArgumentError(f"Value \"{item}\" of EasyOCR profile need to be {type(default).__name__}.")
+
+    return profile
+
+
+def _parse_integer(name : str, text : str) -> int:
+    try:
+        value = int(text)
+    except ValueError:
+        raise _CommandArgumentError(f"Value of option \"{name}\" need to be an integer.")
+    if value < 1:
+        raise _CommandArgumentError(f"Value of option \"{name}\" need to be positive.")
+    return value
+
+
+def _parse_and_run(arguments : list[str]) -> int:
+    suite_names         : list[str]                 = list(SUITE_NAMES)
+    engine_names        : list[str]                 = list(RECOGNIZER_ENGINE_NAMES)
+    repeat              : int                       = 3
+    easyocr_profile     : EasyOCRProfile | None     = None
+    number_of_entries   : int                       = 1_000_000
+
+    for argument in arguments:
+        name, *value = argument.split("=", 1)
+        match (name, *value):
+            case ["--suites", suite_names_text]:
+                suite_names = suite_names_text.split(",")
+                for suite_name in suite_names:
+                    if suite_name not in SUITE_NAMES:
+                        raise _CommandArgumentError(f"Suite \"{suite_name}\" is unknown.")
+            case ["--engines", engine_names_text]:
+                engine_names = engine_names_text.split(",")
+            case ["--repeat", repeat_text]:
+                repeat = _parse_integer(name, repeat_text)
+            case ["--easyocr-profile", profile_text]:
+                easyocr_profile = parse_easyocr_profile(profile_text)
+            case ["--entries", number_of_entries_text]:
+                number_of_entries = _parse_integer(name, number_of_entries_text)
+            case ["--suites" | "--engines" | "--repeat" | "--easyocr-profile" | "--entries"]:
+                raise _CommandArgumentError(f"Option \"{name}\" need to have value.")
+            case [name, *_]:
+                raise _CommandArgumentError(f"Option \"{name}\" is unknown.")
+
+    is_success = True
+
+    if "recognizers" in suite_names:
+        is_success = _run(engine_names, repeat, easyocr_profile) == _EXIT_SUCCESS and is_success
+
+    if "register" in suite_names:
+        print(run_register_benchmark(number_of_entries).to_report())
+
+    return _EXIT_SUCCESS if is_success else _EXIT_FAILURE
+
+
+def _run(engine_names : list[str], repeat : int, easyocr_profile : EasyOCRProfile | None) -> int:
+    corpus = create_corpus()
+    print(f"Corpus: {len(corpus)} samples ({len(LAYOUT_TOOLTIP_SIZES)} layouts, {len(SEPARATORS)} separators, {len(EXP_MAGNITUDES)} exp magnitudes), repeat: {repeat}.")
+
+    is_any = False
+
+    for engine_name in engine_names:
+        recognizer = create_engine(engine_name, easyocr_profile)
+        if recognizer is None:
+            print(f"Engine: {engine_name}\n    Not available. Skipped.")
+            continue
+
+        print(run_benchmark(engine_name, recognizer, corpus, repeat).to_report())
+        is_any = True
+
+    return _EXIT_SUCCESS if is_any else _EXIT_FAILURE
@@ -71,7 +71,18 @@ _order = [
     "test_text_generator.py",
 
     "test_settings.py",
+    "test_stop_watch.py",
     "test_measurer.py",
+    "test_exp_data_database.py",
+    "test_character_register.py",
+    "test_screen_capture.py",
+    "test_recognizers.py",
+    "test_measure_worker.py",
+    "test_auto_saver.py",
+    "test_character_cache.py",
+    "test_exp_bar_sampler.py",
+    "test_batch_measure.py",
+    "test_telemetry.py",
     "test_logic.py",
     "test_overlay.py",
 ]
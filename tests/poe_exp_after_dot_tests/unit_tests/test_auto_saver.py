@@ -0,0 +1,180 @@
+import os   as _os
+import json as _json
+import time as _time
+
+from poe_exp_after_dot._Private.Measurer    import Measurer, SaveJob, get_journal_file_name
+from poe_exp_after_dot._Private.AutoSaver   import AutoSaver
+
+
+def _load_total_exps(file_name : str) -> list[int]:
+    measurer = Measurer()
+    measurer.load_exp_data(file_name)
+    measurer.go_to_first_entry()
+
+    total_exps = []
+    for _ in range(measurer.get_number_of_entries()):
+        total_exps.append(measurer.get_total_exp())
+        measurer.go_to_next_entry()
+
+    return total_exps
+
+
+def test_auto_saver(tmpdir):
+    file_name = str(tmpdir.join("exp_data.json"))
+
+    measurer = Measurer()
+    auto_saver = AutoSaver(0.2)
+
+    # first save rewrites whole file, next ones append to journal file
+    for index in range(3):
+        measurer.update(1_000 + index * 100, 1_000.0 + index * 60)
+        auto_saver.request(measurer.prepare_save_exp_data(file_name))
+
+    # debounced
+    assert auto_saver.is_busy()
+    assert not _os.path.isfile(file_name)
+
+    deadline = _time.monotonic() + 5
+    while auto_saver.is_busy() and _time.monotonic() < deadline:
+        _time.sleep(0.01)
+
+    assert not auto_saver.is_busy()
+    assert _load_total_exps(file_name) == [1_000, 1_100, 1_200]
+
+    with open(file_name, "r") as file:
+        assert len(_json.load(file)) == 1
+    with open(get_journal_file_name(file_name), "r") as file:
+        assert len(file.readlines()) == 2
+
+    # flush doesn't wait for delay
+    measurer.go_to_previous_entry()
+    measurer.remove_current_entry_and_all_entries_above()
+    measurer.update(1_150, 1_100.0)
+    auto_saver.request(measurer.prepare_save_exp_data(file_name))
+    auto_saver.flush()
+
+    assert not auto_saver.is_busy()
+    assert _load_total_exps(file_name) == [1_000, 1_150]
+    assert not _os.path.isfile(file_name + ".tmp")
+
+    # stop finishes waiting jobs
+    measurer.update(1_300, 1_200.0)
+    auto_saver.request(measurer.prepare_save_exp_data(file_name))
+    auto_saver.stop()
+
+    assert _load_total_exps(file_name) == [1_000, 1_150, 1_300]
+
+
+def test_auto_saver_failure(tmpdir):
+    file_name = str(tmpdir.join("missing", "exp_data.json"))
+
+    measurer = Measurer()
+    auto_saver = AutoSaver(0.0)
+
+    measurer.update(1_000, 1_000.0)
+    job = measurer.prepare_save_exp_data(file_name)
+    auto_saver.request(job)
+    auto_saver.flush()
+
+    assert job.is_failed()
+
+    # files are in unknown state, so whole file is rewritten
+    _os.makedirs(_os.path.dirname(file_name))
+    measurer.update(1_100, 1_060.0)
+    auto_saver.request(measurer.prepare_save_exp_data(file_name))
+    auto_saver.stop()
+
+    assert _load_total_exps(file_name) == [1_000, 1_100]
+    assert not _os.path.isfile(get_journal_file_name(file_name))
+
+
+def test_auto_saver_absorbs_waiting_jobs(tmpdir, monkeypatch):
+    file_name = str(tmpdir.join("exp_data.json"))
+    database_file_name = str(tmpdir.join("exp_data.db"))
+
+    written_files = []
+    run = SaveJob.run
+    def count_run(job : SaveJob):
+        written_files.append(_os.path.basename(job.get_file_name()))
+        run(job)
+    monkeypatch.setattr(SaveJob, "run", count_run)
+
+    measurer = Measurer()
+    database_measurer = Measurer()
+    auto_saver = AutoSaver(60.0)
+
+    # whole file, then journal records of following measurements are appended at once
+    for index in range(4):
+        measurer.update(1_000 + index * 100, 1_000.0 + index * 60)
+        auto_saver.request(measurer.prepare_save_exp_data(file_name))
+
+        database_measurer.update(1_000 + index * 100, 1_000.0 + index * 60)
+        auto_saver.request(database_measurer.prepare_save_exp_data(database_file_name))
+
+    auto_saver.flush()
+
+    assert written_files == ["exp_data.json", "exp_data.json", "exp_data.db"]
+    with open(get_journal_file_name(file_name), "r") as file:
+        assert len(file.readlines()) == 3
+    assert _load_total_exps(file_name) == [1_000, 1_100, 1_200, 1_300]
+    assert _load_total_exps(database_file_name) == [1_000, 1_100, 1_200, 1_300]
+
+    # rewrite of whole file replaces waiting journal records, changes of database are merged
+    written_files.clear()
+
+    measurer.update(1_400, 1_240.0)
+    auto_saver.request(measurer.prepare_save_exp_data(file_name))
+    auto_saver.request(measurer._register.prepare_save(file_name, is_compact = True))
+
+    database_measurer.go_to_previous_entry()
+    database_measurer.remove_current_entry_and_all_entries_above()
+    database_measurer.update(1_250, 1_200.0)
+    auto_saver.request(database_measurer.prepare_save_exp_data(database_file_name))
+    database_measurer.update(1_400, 1_240.0)
+    auto_saver.request(database_measurer.prepare_save_exp_data(database_file_name))
+
+    auto_saver.stop()
+
+    assert written_files == ["exp_data.json", "exp_data.db"]
+    assert not _os.path.isfile(get_journal_file_name(file_name))
+    assert _load_total_exps(file_name) == [1_000, 1_100, 1_200, 1_300, 1_400]
+    assert _load_total_exps(database_file_name) == [1_000, 1_100, 1_250, 1_400]
+
+
+class _CountingJob(SaveJob):
+    number_of_runs : int
+
+    def __init__(self):
+        super().__init__("manifest.json")
+
+        self.number_of_runs = 0
+
+    def _write(self):
+        self.number_of_runs += 1
+
+
+def test_auto_saver_idle_job(tmpdir):
+    file_name = str(tmpdir.join("exp_data.json"))
+
+    measurer = Measurer()
+    idle_job = _CountingJob()
+    auto_saver = AutoSaver(60.0)
+    auto_saver.set_idle_job(idle_job)
+
+    # run once after all waiting jobs
+    for index in range(3):
+        measurer.update(1_000 + index * 100, 1_000.0 + index * 60)
+        auto_saver.request(measurer.prepare_save_exp_data(file_name))
+    auto_saver.flush()
+
+    assert idle_job.number_of_runs == 1
+
+    # nothing to run
+    auto_saver.flush()
+    assert idle_job.number_of_runs == 1
+
+    measurer.update(1_300, 1_180.0)
+    auto_saver.request(measurer.prepare_save_exp_data(file_name))
+    auto_saver.stop()
+
+    assert idle_job.number_of_runs == 2
@@ -0,0 +1,104 @@
+import os       as _os
+import json     as _json
+import numpy    as _numpy
+import cv2      as _cv2
+
+from poe_exp_after_dot._Private.Settings        import Settings
+from poe_exp_after_dot._Private.Measurer        import Measurer
+from poe_exp_after_dot._Private.Recognizers     import TemplateRecognizer
+from poe_exp_after_dot._Private.BatchMeasure    import ImageMeasurement, apply_measurements, find_image_files, measure_images, run_batch_measure
+from poe_exp_after_dot_tests.TooltipRenderer    import render_tooltip, format_exp
+
+
+_TIME = 1_700_000_000.0
+
+
+def _make_settings(data_path : str) -> Settings:
+    settings = Settings()
+    settings.merge({
+        "recognizer_engine" : "template",
+        "easyocr_profile" : {"number_of_threads" : 0},
+        "is_detect_layout" : True,
+        "selected_layout_name" : "1200x300",
+        "layouts" : {
+            "1200x300" : {
+                "in_game_exp_bar_x"             : 100,
+                "in_game_exp_bar_y"             : 290,
+                "in_game_exp_bar_width"         : 600,
+                "in_game_exp_bar_height"        : 5,
+
+                "in_game_exp_tooltip_x_offset"  : 24,
+                "in_game_exp_tooltip_y"         : 200,
+                "in_game_exp_tooltip_width"     : 486,
+                "in_game_exp_tooltip_height"    : 73,
+            },
+        },
+    })
+    settings.set_tmp_str("_data_path", data_path)
+    settings.set_tmp_bool("_is_debug", False)
+    settings.set_tmp_dict("_command_line_layout", {})
+
+    # glyphs of tooltip font are already learned
+    recognizer = TemplateRecognizer(data_path + "\\cache\\glyph_atlas.npz")
+    image, text_fragments = render_tooltip(format_exp(1_234_567_890, ","), format_exp(1_234_567_890, ","), width = 486, is_two_lines = True)
+    recognizer.learn(image, text_fragments)
+
+    return settings
+
+
+def _save_screenshot(file_name : str, current_exp : int, cursor_x : int, time_ : float):
+    screen = _numpy.zeros((300, 1200, 3), dtype = _numpy.uint8)
+
+    tooltip, _ = render_tooltip(format_exp(current_exp, ","), format_exp(current_exp + 100_000, ","), width = 486, is_two_lines = True)
+    left = cursor_x + 24
+    screen[200:273, left:left + 486] = tooltip
+
+    assert _cv2.imwrite(file_name, screen)
+    _os.utime(file_name, (time_, time_))
+
+
+def test_batch_measure(tmpdir):
+    data_path = str(tmpdir.mkdir("data"))
+    images_path = str(tmpdir.mkdir("images"))
+
+    settings = _make_settings(data_path)
+
+    # names are not in order of time
+    _save_screenshot(_os.path.join(images_path, "c.png"), 1_000_000, 150, _TIME)
+    _save_screenshot(_os.path.join(images_path, "a.png"), 1_010_000, 400, _TIME + 60)
+    _save_screenshot(_os.path.join(images_path, "b.png"), 1_025_000, 650, _TIME + 120)
+    with open(_os.path.join(images_path, "notes.txt"), "w") as file:
+        file.write("not an image")
+
+    file_names = find_image_files(images_path)
+    assert [_os.path.basename(file_name) for file_name in file_names] == ["c.png", "a.png", "b.png"]
+
+    measurements = measure_images(settings, file_names, number_of_processes = 2)
+    assert [measurement.total_exp for measurement in measurements] == [1_000_000, 1_010_000, 1_025_000]
+    assert [measurement.time_ for measurement in measurements] == [_TIME, _TIME + 60, _TIME + 120]
+
+    # whole run
+    exp_data_file_name = run_batch_measure(settings, images_path)
+
+    with open(exp_data_file_name, "r") as file:
+        exp_data = _json.load(file)
+
+    assert [entry["total_exp"] for entry in exp_data] == [1_000_000, 1_010_000, 1_025_000]
+    assert exp_data[2]["exp_per_hour"] == 15_000 * 60
+
+
+def test_apply_measurements():
+    measurer = Measurer()
+
+    number_of_updated = apply_measurements(measurer, [
+        ImageMeasurement("b.png", _TIME + 60, 1_030_000, ""),
+        ImageMeasurement("a.png", _TIME, 1_000_000, ""),
+        ImageMeasurement("c.png", _TIME + 90, None, "Current Exp:"),    # not recognized
+        ImageMeasurement("d.png", _TIME + 60, 1_030_000, ""),           # same time
+        ImageMeasurement("e.png", _TIME + 120, 99_999_999_999, ""),     # out of range
+    ])
+
+    assert number_of_updated == 2
+    assert measurer.get_number_of_entries() == 2
+    assert measurer.get_total_exp() == 1_030_000
+    assert measurer.get_exp_per_hour() == 30_000 * 60
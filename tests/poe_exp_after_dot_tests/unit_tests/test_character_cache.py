@@ -0,0 +1,70 @@
+from poe_exp_after_dot._Private.Measurer        import Measurer
+from poe_exp_after_dot._Private.AutoSaver       import AutoSaver
+from poe_exp_after_dot._Private.CharacterCache  import CharacterCache, estimate_measurer_size
+
+
+def _make_measurer(number_of_entries : int) -> Measurer:
+    measurer = Measurer()
+    for index in range(number_of_entries):
+        measurer.update(1_934_009_687 + index * 10, 1_000.0 + index * 60)
+    return measurer
+
+
+def test_character_cache():
+    auto_saver = AutoSaver(0.0)
+    cache = CharacterCache(2, estimate_measurer_size(10), 30 * 60, auto_saver)
+
+    first, second, third = _make_measurer(3), _make_measurer(4), _make_measurer(5)
+
+    cache.put("first", first)
+    cache.put("second", second)
+    assert cache.get_names() == ["first", "second"]
+
+    # the least recently used one is evicted above capacity
+    cache.put("third", third)
+    assert cache.get_names() == ["second", "third"]
+
+    # taken one is removed, so it can be changed
+    assert cache.take("second") is second
+    assert cache.take("second") is None
+
+    # above maximal size (3 + 5 + 4 entries)
+    cache.put("first", first)
+    cache.put("second", second)
+    assert cache.get_names() == ["first", "second"]
+
+    cache.discard("first")
+    assert cache.get_names() == ["second"]
+
+    cache.close()
+    auto_saver.stop()
+
+
+def test_character_cache_prefetch(tmpdir):
+    file_name = str(tmpdir.join("exp_data.json"))
+
+    # save is still waiting, when measurer is evicted
+    auto_saver = AutoSaver(60.0)
+    cache = CharacterCache(1, estimate_measurer_size(100), 30 * 60, auto_saver)
+
+    measurer = _make_measurer(3)
+    auto_saver.request(measurer.prepare_save_exp_data(file_name))
+    cache.put("first", measurer)
+    cache.put("second", _make_measurer(1))
+    assert cache.get_names() == ["second"]
+
+    # loader waits for save of evicted measurer
+    cache.discard("second")
+    cache.prefetch("first", file_name)
+
+    prefetched = cache.take("first")
+    assert prefetched is not None and prefetched is not measurer
+    assert prefetched.get_number_of_entries() == 3
+    assert not auto_saver.is_saving(file_name)
+
+    # missing file
+    cache.prefetch("missing", str(tmpdir.join("missing.json")))
+    assert cache.take("missing") is None
+
+    cache.close()
+    auto_saver.stop()
@@ -0,0 +1,99 @@
+import os   as _os
+import json as _json
+
+from poe_exp_after_dot._Private.Measurer            import Measurer, get_journal_file_name
+from poe_exp_after_dot._Private.CharacterRegister   import CharacterRegister, CharacterSummary
+
+
+def test_character_register_manifest(tmpdir):
+    data_path = str(tmpdir.mkdir("data"))
+
+    register = CharacterRegister(data_path)
+    register.add_character("")
+    register.scan_for_characters()
+    register.add_character("Bob")
+
+    assert register.get_character_names(is_include_empty_name = True) == ["", "Bob"]
+    assert register.get_summary("Bob") is None
+
+    # summary is written after exp data is saved
+    measurer = Measurer()
+    measurer.update(1_934_009_687, 1_000.0)
+    measurer.update(1_934_009_687 + 10_000, 1_060.0)
+
+    exp_data_file_name = register.to_character("Bob").get_exp_data_file_name()
+    measurer.save_exp_data(exp_data_file_name)
+    register.update_summary("Bob", measurer)
+    register.prepare_save_manifest().run()
+
+    with open(register.get_manifest_file_name(), "r") as file:
+        manifest = _json.load(file)
+    assert manifest["characters"]["Bob"]["file_size"] == _os.path.getsize(exp_data_file_name)
+
+    # measured size is kept in summary
+    assert register.get_summary("Bob").file_size == _os.path.getsize(exp_data_file_name)
+
+    # unchanged manifest isn't written again
+    _os.remove(register.get_manifest_file_name())
+    register.prepare_save_manifest().run()
+    assert not _os.path.isfile(register.get_manifest_file_name())
+
+    # summary is taken immediately, manifest is written by job
+    measurer.update(1_934_009_687 + 20_000, 1_120.0)
+    register.update_summary("Bob", measurer)
+    assert register.get_summary("Bob").number_of_entries == 3
+
+    measurer.save_exp_data(exp_data_file_name)
+    register.prepare_save_manifest().run()
+
+    # with journal file
+    file_size = _os.path.getsize(exp_data_file_name) + _os.path.getsize(get_journal_file_name(exp_data_file_name))
+    assert register.get_summary("Bob").file_size == file_size
+
+    with open(register.get_manifest_file_name(), "r") as file:
+        assert _json.load(file)["characters"]["Bob"]["number_of_entries"] == 3
+
+    # manifest is trusted, while characters folder isn't changed
+    other_register = CharacterRegister(data_path)
+    other_register.add_character("")
+    other_register.scan_for_characters()
+
+    assert other_register.get_character_names(is_include_empty_name = True) == ["", "Bob"]
+    assert other_register.get_summary("Bob") == CharacterSummary(3, 90, 1_934_029_687, 1_120.0, file_size)
+    assert other_register.get_summary("") is None
+
+    # removed character is removed from manifest
+    other_register.destroy_character("Bob")
+    assert not _os.path.isfile(exp_data_file_name)
+
+    with open(other_register.get_manifest_file_name(), "r") as file:
+        assert list(_json.load(file)["characters"]) == [""]
+
+
+def test_character_register_stale_manifest(tmpdir):
+    data_path = str(tmpdir.mkdir("data"))
+
+    register = CharacterRegister(data_path)
+    register.add_character("")
+    register.scan_for_characters()
+    register.update_summary("", Measurer())
+    register.prepare_save_manifest().run()
+
+    # characters folder has changed, so it's scanned again, summaries of existing characters are kept
+    _os.makedirs(data_path + "\\characters", exist_ok = True)
+    _os.utime(data_path + "\\characters", ns = (1, 1))
+
+    other_register = CharacterRegister(data_path)
+    other_register.add_character("")
+    other_register.scan_for_characters()
+
+    assert other_register.get_character_names(is_include_empty_name = True) == [""]
+    assert other_register.get_summary("") == CharacterSummary(0, 0, 0, 0.0, 2)
+
+    # malformed manifest is ignored
+    with open(register.get_manifest_file_name(), "w") as file:
+        file.write("{")
+
+    malformed_register = CharacterRegister(data_path)
+    malformed_register.scan_for_characters()
+    assert malformed_register.get_summary("") is None
@@ -0,0 +1,58 @@
+import numpy    as _numpy
+
+from poe_exp_after_dot._Private.Settings        import Settings
+from poe_exp_after_dot._Private.ScreenCapture   import FileScreenCapture
+from poe_exp_after_dot._Private.ExpBarSampler   import ExpBarSampler, find_fill_column
+
+
+def _make_exp_bar(fill_column : int, *, width : int = 820, height : int = 5) -> _numpy.ndarray:
+    image = _numpy.full((height, width, 3), (20, 18, 16), dtype = _numpy.uint8)
+    image[:, :fill_column] = (60, 170, 90)
+    return image
+
+
+def test_find_fill_column():
+    assert find_fill_column(_make_exp_bar(0)) == 0
+    assert find_fill_column(_make_exp_bar(1)) == 1
+    assert find_fill_column(_make_exp_bar(411)) == 411
+    assert find_fill_column(_make_exp_bar(819)) == 819
+    assert find_fill_column(_make_exp_bar(820)) == 820
+
+    # noise
+    image = _make_exp_bar(300)
+    image[2, 500] = (40, 40, 40)
+    assert find_fill_column(image) == 300
+
+    assert find_fill_column(_numpy.zeros((0, 0, 3), dtype = _numpy.uint8)) == 0
+
+
+def test_exp_bar_sampler():
+    settings = Settings()
+    settings.set_tmp_dict("_solved_layout", {
+        "in_game_exp_bar_x"         : 10,
+        "in_game_exp_bar_y"         : 20,
+        "in_game_exp_bar_width"     : 820,
+        "in_game_exp_bar_height"    : 5,
+    })
+
+    screen = _numpy.zeros((40, 900, 3), dtype = _numpy.uint8)
+    screen_capture = FileScreenCapture()
+    screen_capture.set_screen(screen)
+
+    sampler = ExpBarSampler(settings, screen_capture)
+
+    screen[20:25, 10:830] = _make_exp_bar(100)
+
+    assert sampler.is_changed() == False # first sample is reference
+    assert sampler.get_fill_column() == 100
+    assert sampler.is_changed() == False
+
+    screen[20:25, 10:830] = _make_exp_bar(101)
+    assert sampler.is_changed() == True
+    assert sampler.get_fill_column() == 101
+    assert sampler.is_changed() == False
+
+    sampler.invalidate()
+    screen[20:25, 10:830] = _make_exp_bar(150)
+    assert sampler.is_changed() == False
+    assert sampler.get_fill_column() == 150
@@ -0,0 +1,86 @@
+import os as _os
+
+from poe_exp_after_dot._Private.Measurer            import Measurer
+from poe_exp_after_dot._Private.ExpDataDatabase     import ExpDataDatabase
+from poe_exp_after_dot._Private.ExpThresholdInfo    import EXP_THRESHOLD_INFO_TABLE
+from poe_exp_after_dot._Private.CharacterRegister   import get_exp_data_file_name, migrate_exp_data_to_database
+
+
+# level 1 (to next: 525) and level 2 (base: 525, to next: 1235)
+_TOTAL_EXPS = [100, 300, 500, 600, 900, 1_200]
+_TIMES      = [1_000.0, 1_060.0, 1_120.0, 5_000.0, 5_060.0, 5_120.0]
+
+
+def _make_measurer() -> Measurer:
+    measurer = Measurer()
+    for total_exp, time_ in zip(_TOTAL_EXPS, _TIMES):
+        measurer.update(total_exp, time_)
+    return measurer
+
+
+def _to_total_exps(measurer : Measurer) -> list[int]:
+    total_exps = []
+
+    measurer.go_to_first_entry()
+    for _ in range(measurer.get_number_of_entries()):
+        total_exps.append(measurer.get_total_exp())
+        measurer.go_to_next_entry()
+
+    return total_exps
+
+
+def test_exp_data_database(tmpdir):
+    file_name = str(tmpdir.join("exp_data.db"))
+
+    measurer = _make_measurer()
+    measurer.save_exp_data(file_name)
+
+    with ExpDataDatabase(file_name) as database:
+        assert database.get_number_of_entries() == 6
+        assert [row[0] for row in database.read_rows(1, 3)] == [300, 500]
+
+        # infos are shared with table
+        assert database.read_rows(0, 1)[0][1] is EXP_THRESHOLD_INFO_TABLE[0]
+
+    # same entries as saved
+    loaded_measurer = Measurer()
+    loaded_measurer.load_exp_data(file_name)
+    assert loaded_measurer._register.export_to_str() == measurer._register.export_to_str()
+
+    # changes are written into database, without journal file
+    loaded_measurer.go_to_previous_entry()
+    loaded_measurer.remove_current_entry_and_all_entries_above()
+    loaded_measurer.update(1_000, 5_200.0)
+    loaded_measurer.save_exp_data(file_name)
+
+    assert not _os.path.isfile(str(tmpdir.join("exp_data.journal")))
+
+    # tail first
+    tail_measurer = Measurer()
+    tail_measurer.load_exp_data(file_name, tail_size = 2, is_background = True)
+    assert tail_measurer.get_total_exp() == 1_000
+
+    tail_measurer.go_to_first_entry()
+    assert _to_total_exps(tail_measurer) == [100, 300, 500, 600, 1_000]
+
+
+def test_migrate_exp_data_to_database(tmpdir):
+    data_path = str(tmpdir.mkdir("data"))
+
+    assert migrate_exp_data_to_database(data_path) == f"There is no exp data in \"{data_path}\"."
+
+    json_file_name = get_exp_data_file_name("", data_path, "json")
+    measurer = _make_measurer()
+    measurer.save_exp_data(json_file_name)
+
+    # journal file is migrated too
+    measurer.update(1_500, 5_180.0)
+    measurer.save_exp_data(json_file_name)
+
+    report = migrate_exp_data_to_database(data_path)
+    assert report.startswith("Migrated 7 entries of Generic Character")
+
+    migrated_measurer = Measurer()
+    migrated_measurer.load_exp_data(get_exp_data_file_name("", data_path, "sqlite"))
+    assert _to_total_exps(migrated_measurer) == _TOTAL_EXPS + [1_500]
+    assert _os.path.isfile(json_file_name)
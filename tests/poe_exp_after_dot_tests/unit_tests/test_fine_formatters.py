@@ -1,5 +1,5 @@
 from poe_exp_after_dot._Private.FineFormatters import SECONDS_IN_WEEK, SECONDS_IN_DAY, SECONDS_IN_HOUR, SECONDS_IN_MINUTE, LT, GT
-from poe_exp_after_dot._Private.FineFormatters import FineTime, FineExpPerHour, FinePercent, FineBareLevel, FineExp
+from poe_exp_after_dot._Private.FineFormatters import FineTime, FineExpPerHour, FinePercent, FineBareLevel, FineExp, FineStageTime
 
 def test_fine_exp():
     assert str(FineExp()) == "0exp"
@@ -269,3 +269,15 @@ def test_fine_percent():
     assert str(FinePercent(12.3499, two_dig_after_dot_color = "green")) == "12.<font color=\"green\">34</font>%"
     assert str(FinePercent(12.3499, integer_color = "blue", two_dig_after_dot_color = "green")) == "<font color=\"blue\">12</font>.<font color=\"green\">34</font>%"
 
+def test_fine_stage_time():
+    assert str(FineStageTime()) == "-"
+    assert FineStageTime().p50 == 0.0
+
+    stage_time = FineStageTime(0.0032, 0.0051, 0.012)
+    assert str(stage_time) == "3.2/5.1/12.0ms"
+    assert f"{stage_time.p95:.0f}" == "5"
+    assert "{0.max:.1f}".format(stage_time) == "12.0"
+
+    assert str(FineStageTime(1, 2, 3, value_color = "#FFFFFF", unit_color = "grey")) == (
+        "<font color=\"#FFFFFF\">1000.0</font>/<font color=\"#FFFFFF\">2000.0</font>/<font color=\"#FFFFFF\">3000.0</font><font color=\"grey\">ms</font>"
+    )
@@ -0,0 +1,60 @@
+import threading as _threading
+import numpy     as _numpy
+
+from PySide6.QtCore import Qt
+
+from poe_exp_after_dot._Private.MeasureWorker import MeasureWorker
+
+
+def test_measure_worker():
+    is_started  = _threading.Event()
+    is_released = _threading.Event()
+    is_done     = _threading.Event()
+    results     = []
+    durations   = []
+
+    def recognize(image : _numpy.ndarray, capture_duration : float) -> int | None:
+        durations.append(capture_duration)
+        is_started.set()
+        is_released.wait(5)
+        if image[0, 0] == 255:
+            raise ValueError("Broken image.")
+        return int(image[0, 0])
+
+    def on_measured(request_id, total_exp, time_, exception):
+        # result is still on its way
+        assert worker.is_busy()
+        results.append((request_id, total_exp, time_, exception))
+        if len(results) == 2:
+            is_done.set()
+
+    worker = MeasureWorker(recognize)
+    # direct connection, so there is no need for event loop
+    worker.measured.connect(on_measured, Qt.ConnectionType.DirectConnection)
+
+    assert not worker.is_busy()
+
+    first_id = worker.request(_numpy.full((1, 1), 10, dtype = _numpy.uint8), 1.0, 0.1)
+    assert is_started.wait(5)
+
+    # first request is being processed, so these wait, and newer one replaces older one
+    second_id   = worker.request(_numpy.full((1, 1), 20, dtype = _numpy.uint8), 2.0, 0.2)
+    third_id    = worker.request(_numpy.full((1, 1), 255, dtype = _numpy.uint8), 3.0, 0.3)
+
+    assert first_id < second_id < third_id
+    assert worker.get_last_request_id() == third_id
+    assert worker.is_busy()
+
+    is_released.set()
+
+    assert is_done.wait(5)
+
+    assert results[0] == (first_id, 10, 1.0, None)
+    assert results[1][:3] == (third_id, None, 3.0)
+    assert isinstance(results[1][3], ValueError)
+
+    # capture duration goes with its image, not with the newest request
+    assert durations == [0.1, 0.3]
+
+    worker.stop()
+    assert not worker.is_busy()
@@ -1,9 +1,20 @@
-from math import isclose as _isclose
-from time import time as _get_time
+import os           as _os
+import json         as _json
+import tracemalloc  as _tracemalloc
+import numpy        as _numpy
+import pytest       as _pytest
+
+from math           import isclose as _isclose
+from time           import time as _get_time
+from dataclasses    import make_dataclass as _make_dataclass, fields as _fields
 
 from poe_exp_after_dot._Private.FineFormatters import SECONDS_IN_WEEK, SECONDS_IN_DAY, SECONDS_IN_HOUR, SECONDS_IN_MINUTE, LT, GT
 from poe_exp_after_dot._Private.FineFormatters import FineTime, FineExpPerHour, FinePercent, FineBareLevel, FineExp
 from poe_exp_after_dot._Private.Logic          import Measurer
+from poe_exp_after_dot._Private.Measurer       import Entry, Register, ExpOutOfRange, find_exp_threshold_info, find_exp_threshold_infos, derive_entry_columns, create_session_report, get_journal_file_name
+from poe_exp_after_dot._Private.ExpThresholdInfo import ExpThresholdInfo, EXP_THRESHOLD_INFO_TABLE
+from poe_exp_after_dot._Private                import Measurer as _measurer_module
+from poe_exp_after_dot_tests.benchmarks        import run_register_benchmark
 
 def test_measurer():
     time_ = 0
@@ -179,6 +190,533 @@ def test_measurer():
     #print(_update(measurer, 2750, 60 * 60))
     #print(_update(measurer, 3000, 60 * 60))
 
+def test_measurer_journal(tmpdir, monkeypatch):
+    file_name = _os.path.join(str(tmpdir), "exp_data.json")
+    journal_file_name = get_journal_file_name(file_name)
+
+    measurer = Measurer()
+    for index in range(5):
+        measurer.update(1000 + index * 10, 60.0 * index)
+
+    # new file, whole exp data is written
+    measurer.save_exp_data(file_name)
+    assert not _os.path.exists(journal_file_name)
+
+    with open(file_name, "r") as file:
+        text = file.read()
+    assert [entry["total_exp"] for entry in _json.loads(text)] == [1000, 1010, 1020, 1030, 1040]
+    assert len(text.split("\n")) == 5 + 2 # one entry per line
+
+    # changes are appended to journal
+    measurer.go_to_previous_entry()
+    measurer.go_to_previous_entry()
+    measurer.remove_current_entry_and_all_entries_above()
+    measurer.update(2000, 600.0)
+    measurer.save_exp_data(file_name)
+
+    with open(file_name, "r") as file:
+        assert file.read() == text
+
+    with open(journal_file_name, "r") as file:
+        assert len(file.readlines()) == 1 # remove and update are saved as one record
+
+    loaded = Measurer()
+    loaded.load_exp_data(file_name)
+    assert loaded.get_number_of_entries() == 3
+    assert loaded.get_total_exp() == 2000
+    assert _to_total_exps(loaded) == [1000, 1010, 2000]
+
+    # nothing changed
+    loaded.save_exp_data(file_name)
+    with open(journal_file_name, "r") as file:
+        assert len(file.readlines()) == 1 # remove and update are saved as one record
+
+    # record cut by killed application
+    with open(journal_file_name, "a") as file:
+        file.write("{\"add\": 3, \"entry\": {\"total_")
+
+    loaded = Measurer()
+    loaded.load_exp_data(file_name)
+    assert _to_total_exps(loaded) == [1000, 1010, 2000]
+
+    loaded.update(2100, 660.0)
+    loaded.save_exp_data(file_name) # compacts, because journal is malformed
+    assert not _os.path.exists(journal_file_name)
+
+    loaded = Measurer()
+    loaded.load_exp_data(file_name)
+    assert _to_total_exps(loaded) == [1000, 1010, 2000, 2100]
+
+    # compaction when journal gets too long
+    monkeypatch.setattr(_measurer_module, "_JOURNAL_COMPACTION_THRESHOLD", 3)
+
+    for index in range(3):
+        loaded.update(2200 + index, 720.0 + index)
+        loaded.save_exp_data(file_name)
+    assert _os.path.exists(journal_file_name)
+
+    loaded.update(2300, 800.0)
+    loaded.save_exp_data(file_name)
+    assert not _os.path.exists(journal_file_name)
+
+    measurer = Measurer()
+    measurer.load_exp_data(file_name)
+    assert _to_total_exps(measurer) == [1000, 1010, 2000, 2100, 2200, 2201, 2202, 2300]
+
+
+def test_register():
+    measurer = Measurer()
+    for index in range(5):
+        measurer.update(1000 + index * 10, 60.0 * index)
+
+    register = Register()
+    register.load_from_str(measurer._register.export_to_str())
+
+    # entries are made on demand, same entry is returned until register changes
+    current = register.to_current()
+    assert current is not None and current.total_exp == 1040
+    assert register.to_current() is current
+
+    register.go_to_previous()
+    register.go_to_previous()
+    assert register.to_current().total_exp == 1020 # type: ignore[union-attr]
+
+    register.remove_current_and_all_above()
+    assert register.get_number() == 2
+    assert register.to_current().total_exp == 1010 # type: ignore[union-attr]
+
+    register.go_to_before_first()
+    register.remove_current_and_all_above()
+    assert not register.is_any()
+    assert register.to_current() is None
+    assert register.export_to_str() == "[]"
+
+
+def test_find_exp_threshold_info():
+    total_exps = [0, 1, 524, 525, 526, 1_934_009_687, 3_932_818_529, 3_932_818_530, 4_250_334_443, 4_250_334_444]
+    for info in EXP_THRESHOLD_INFO_TABLE:
+        total_exps += [info.base_exp, info.base_exp + info.exp_to_next // 2]
+
+    for total_exp in total_exps:
+        # same as linear scan of table
+        expected = next(info for info in reversed(EXP_THRESHOLD_INFO_TABLE) if total_exp >= info.base_exp)
+        assert find_exp_threshold_info(total_exp) is expected
+
+    levels, base_exps, progresses = find_exp_threshold_infos(_numpy.array(total_exps))
+
+    for index, total_exp in enumerate(total_exps):
+        measurer = Measurer()
+        measurer.update(total_exp, 0.0)
+
+        assert levels[index] == measurer.get_level()
+        assert base_exps[index] == find_exp_threshold_info(total_exp).base_exp
+        assert progresses[index] == measurer.get_progress()
+
+    for total_exp in [-1, 4_250_334_445]:
+        with _pytest.raises(ExpOutOfRange):
+            find_exp_threshold_info(total_exp)
+        with _pytest.raises(ExpOutOfRange, match = str(total_exp)):
+            find_exp_threshold_infos(_numpy.array([1000, total_exp, 2000]))
+
+
+def test_measurer_jumps(tmpdir):
+    # levels: 89, 90 x 6, 91; sessions: [0, 1], [2, 3], [4, 7]
+    time_ = 1_700_000_000.0
+    measurer = Measurer()
+    measurer.update(1_934_009_687 - 10_000, time_)
+    measurer.update(1_934_009_687 + 50_000, time_ + 10 * SECONDS_IN_MINUTE)
+    measurer.update(1_934_009_687 + 60_000, time_ + 2 * SECONDS_IN_HOUR)
+    measurer.update(1_934_009_687 + 70_000, time_ + 2 * SECONDS_IN_HOUR + SECONDS_IN_MINUTE)
+    measurer.update(1_934_009_687 + 80_000, time_ + 5 * SECONDS_IN_HOUR)
+    measurer.update(1_934_009_687 + 90_000, time_ + 5 * SECONDS_IN_HOUR + 20 * SECONDS_IN_MINUTE)
+    measurer.update(1_934_009_687 + 110_000, time_ + 5 * SECONDS_IN_HOUR + 40 * SECONDS_IN_MINUTE)
+    measurer.update(2_094_900_291 + 10_000, time_ + 5 * SECONDS_IN_HOUR + 50 * SECONDS_IN_MINUTE)
+
+    # page
+    measurer.go_to_entry_page(3)
+    assert measurer.get_current_entry_index() == 2
+    measurer.go_to_entry_page(100)
+    assert measurer.get_current_entry_page() == 8
+    measurer.go_to_entry_page(-5)
+    assert measurer.get_current_entry_page() == 0
+
+    # time, the older entry is taken, when both are equally near
+    for time_offset, index in [(-100, 0), (5 * SECONDS_IN_MINUTE, 0), (2 * SECONDS_IN_HOUR + 50, 3), (10 * SECONDS_IN_HOUR, 7)]:
+        measurer.go_to_entry_nearest_time(time_ + time_offset)
+        assert measurer.get_current_entry_index() == index
+
+    # level
+    assert measurer.go_to_first_entry_of_level(90)
+    assert measurer.get_current_entry_index() == 1
+    assert not measurer.go_to_first_entry_of_level(92)
+    assert measurer.get_current_entry_index() == 1
+
+    measurer.go_to_last_entry()
+    indices = []
+    for _ in range(4):
+        measurer.go_to_previous_level()
+        indices.append(measurer.get_current_entry_index())
+    assert indices == [1, 0, 0, 0]
+
+    indices = []
+    for _ in range(3):
+        measurer.go_to_next_level()
+        indices.append(measurer.get_current_entry_index())
+    assert indices == [1, 7, 7]
+
+    # session
+    measurer.go_to_last_entry()
+    indices = []
+    for _ in range(4):
+        measurer.go_to_previous_session()
+        indices.append(measurer.get_current_entry_index())
+    assert indices == [4, 2, 0, 0]
+
+    indices = []
+    for _ in range(3):
+        measurer.go_to_next_session()
+        indices.append(measurer.get_current_entry_index())
+    assert indices == [2, 4, 4]
+
+    measurer.go_to_before_first_entry()
+    measurer.go_to_next_session()
+    assert measurer.get_current_entry_index() == 0
+
+    # session, which began before loaded entries
+    file_name = str(tmpdir.join("exp_data.json"))
+    measurer.save_exp_data(file_name)
+
+    loaded_measurer = Measurer()
+    loaded_measurer.load_exp_data(file_name, tail_size = 2)
+    loaded_measurer.go_to_previous_session()
+    assert loaded_measurer.get_current_entry_index() == 4
+
+
+def test_measurer_level_jumps_when_level_goes_down():
+    # levels: 1, 2, 2, 1, 1, 2, 2
+    measurer = Measurer()
+    for index, total_exp in enumerate([100, 600, 700, 200, 300, 800, 900]):
+        measurer.update(total_exp, 1_000.0 + index * SECONDS_IN_MINUTE)
+
+    assert measurer.go_to_first_entry_of_level(2)
+    assert measurer.get_current_entry_index() == 1
+    assert measurer.go_to_first_entry_of_level(1)
+    assert measurer.get_current_entry_index() == 0
+
+    measurer.go_to_last_entry()
+    indices = []
+    for _ in range(5):
+        measurer.go_to_previous_level()
+        indices.append(measurer.get_current_entry_index())
+    assert indices == [5, 3, 1, 0, 0]
+
+    indices = []
+    for _ in range(4):
+        measurer.go_to_next_level()
+        indices.append(measurer.get_current_entry_index())
+    assert indices == [1, 3, 5, 5]
+
+
+def test_measurer_recompute():
+    generator = _numpy.random.default_rng(17)
+
+    # mostly small steps, some level changes (both ways), some values out of range
+    total_exps = 1_900_000_000 + _numpy.cumsum(generator.integers(-1_000, 2_000_000, 2000))
+    total_exps[generator.integers(0, 2000, 20)] = 10_000
+    total_exps[generator.integers(0, 2000, 5)] = 5_000_000_000
+    times = _numpy.cumsum(generator.uniform(0.5, 120.0, 2000)) + 1_700_000_000.0
+
+    expected = Measurer()
+    for total_exp, time_ in zip(total_exps.tolist(), times.tolist()):
+        expected.update(total_exp, time_)
+
+    measurer = Measurer()
+    assert measurer.recompute(total_exps, times) == 5
+
+    assert measurer._register.export_to_str() == expected._register.export_to_str()
+    assert measurer.get_number_of_entries() == 1995
+    assert measurer.get_current_entry_index() == 1994
+
+    raw_total_exps, raw_times = measurer.to_raw_exp_data()
+    assert raw_total_exps.tolist() == [total_exp for total_exp in total_exps.tolist() if total_exp != 5_000_000_000]
+
+    columns = derive_entry_columns(raw_total_exps, raw_times)
+    assert columns["level"][-1] == expected.get_level()
+    assert columns["exp_per_hour"][-1] == expected.get_exp_per_hour()
+
+    measurer.recompute(raw_total_exps, raw_times)
+    assert measurer._register.export_to_str() == expected._register.export_to_str()
+
+    assert measurer.recompute(_numpy.array([], dtype = _numpy.int64), _numpy.array([])) == 0
+    assert measurer.get_number_of_entries() == 0
+
+    with _pytest.raises(ValueError):
+        measurer.recompute(_numpy.array([1000, 1010]), _numpy.array([60.0, 60.0]))
+    with _pytest.raises(ValueError):
+        measurer.recompute(_numpy.array([1000, 1010]), _numpy.array([60.0]))
+
+
+def test_measurer_window_exp_per_hour():
+    measurer = Measurer()
+    assert measurer.get_window_exp_per_hour(5 * SECONDS_IN_MINUTE) == 0
+    assert measurer.get_session_exp_per_hour() == 0
+
+    # 1000 exp each minute for 2 hours, then 4000 exp each minute for 10 minutes
+    time_ = 1_700_000_000.0
+    total_exp = 1_934_009_687
+    for _ in range(120):
+        measurer.update(total_exp, time_)
+        total_exp += 1000
+        time_ += SECONDS_IN_MINUTE
+    for _ in range(10):
+        measurer.update(total_exp, time_)
+        total_exp += 4000
+        time_ += SECONDS_IN_MINUTE
+
+    assert measurer.get_exp_per_hour() == 4000 * 60
+    assert measurer.get_window_exp_per_hour(5 * SECONDS_IN_MINUTE) == 4000 * 60
+    assert measurer.get_window_exp_per_hour(15 * SECONDS_IN_MINUTE) == (6 * 1000 + 9 * 4000) * 60 // 15
+    assert measurer.get_window_exp_per_hour(SECONDS_IN_HOUR) == (51 * 1000 + 9 * 4000) * 60 // 60
+    assert measurer.get_session_exp_per_hour() == (120 * 1000 + 9 * 4000) * 60 // 129
+
+    # windows end at current entry
+    for _ in range(10):
+        measurer.go_to_previous_entry()
+    assert measurer.get_window_exp_per_hour(5 * SECONDS_IN_MINUTE) == 1000 * 60
+
+    measurer.go_to_first_entry()
+    assert measurer.get_window_exp_per_hour(5 * SECONDS_IN_MINUTE) == 0
+
+    # loaded entries are in the same session
+    loaded = Measurer()
+    loaded._register.load_from_str(measurer._register.export_to_str())
+    assert loaded.get_session_exp_per_hour() == (120 * 1000 + 9 * 4000) * 60 // 129
+    assert loaded.get_window_exp_per_hour(5 * SECONDS_IN_MINUTE) == 4000 * 60
+
+
+def test_measurer_sessions():
+    measurer = Measurer()
+    assert measurer.get_number_of_sessions() == 0
+    assert measurer.get_current_session_index() is None
+    assert measurer.to_current_session() is None
+    assert create_session_report(measurer) == "There are no entries in exp data."
+
+    # 3 sessions: level 89 -> 90 in 10 minutes, then 1 minute, then 40 minutes
+    time_ = 1_700_000_000.0
+    measurer.update(1_934_009_687 - 10_000, time_)
+    measurer.update(1_934_009_687 + 50_000, time_ + 10 * SECONDS_IN_MINUTE)
+    measurer.update(1_934_009_687 + 60_000, time_ + 2 * SECONDS_IN_HOUR)
+    measurer.update(1_934_009_687 + 70_000, time_ + 2 * SECONDS_IN_HOUR + SECONDS_IN_MINUTE)
+    measurer.update(1_934_009_687 + 80_000, time_ + 5 * SECONDS_IN_HOUR)
+    measurer.update(1_934_009_687 + 90_000, time_ + 5 * SECONDS_IN_HOUR + 20 * SECONDS_IN_MINUTE)
+    measurer.update(1_934_009_687 + 110_000, time_ + 5 * SECONDS_IN_HOUR + 40 * SECONDS_IN_MINUTE)
+
+    sessions = measurer.to_sessions()
+    assert [(session.begin, session.end) for session in sessions] == [(0, 1), (2, 3), (4, 6)]
+    assert [session.duration for session in sessions] == [10 * SECONDS_IN_MINUTE, SECONDS_IN_MINUTE, 40 * SECONDS_IN_MINUTE]
+    assert [session.exp_gained for session in sessions] == [60_000, 10_000, 30_000]
+    assert [session.levels_gained for session in sessions] == [1, 0, 0]
+    assert [session.exp_per_hour for session in sessions] == [360_000, 600_000, 45_000]
+
+    assert measurer.get_current_session_index() == 2
+    assert measurer.get_session_exp_per_hour() == 45_000
+
+    # current session ends at current entry
+    measurer.go_to_previous_entry()
+    session = measurer.to_current_session()
+    assert session is not None and (session.begin, session.end, session.exp_gained) == (4, 5, 10_000)
+
+    # cut and add keep index up to date
+    measurer.go_to_previous_entry()
+    measurer.remove_current_entry_and_all_entries_above()
+    assert measurer.get_number_of_sessions() == 2
+
+    measurer.update(1_934_009_687 + 75_000, time_ + 2 * SECONDS_IN_HOUR + 2 * SECONDS_IN_MINUTE)
+    assert measurer.get_number_of_sessions() == 2
+    assert measurer.to_sessions()[-1].exp_gained == 15_000
+
+    # gap is configurable
+    measurer.set_session_idle_gap(4 * SECONDS_IN_HOUR)
+    assert measurer.get_number_of_sessions() == 1
+
+    report = create_session_report(measurer)
+    assert len(report.split("\n")) == 2
+    assert "85,000" in report
+
+
+def test_entry_memory():
+    measurer = Measurer()
+    for index in range(3):
+        measurer.update(1_934_009_687 + index * 10, 60.0 * index)
+    exp_data = _json.loads(measurer._register.export_to_str())
+
+    entry = Entry.from_dict(exp_data[-1])
+    assert entry.info is EXP_THRESHOLD_INFO_TABLE[89]
+    assert not hasattr(entry, "__dict__")
+    assert ExpThresholdInfo.from_dict({"level" : 90, "base_exp" : 1, "exp_to_next" : 2}) == ExpThresholdInfo(90, 1, 2)
+
+    # previous representation: each entry has own '__dict__' and own copy of info
+    unslotted_info_type = _make_dataclass("_UnslottedExpThresholdInfo", [field.name for field in _fields(ExpThresholdInfo)])
+    unslotted_entry_type = _make_dataclass("_UnslottedEntry", [field.name for field in _fields(Entry)])
+
+    def to_unslotted_entry(dict_ : dict) -> object:
+        entry = Entry.from_dict(dict_)
+        values = {field.name : getattr(entry, field.name) for field in _fields(Entry)}
+        values["info"] = unslotted_info_type(**dict_["info"])
+        return unslotted_entry_type(**values)
+
+    number_of_entries = 100_000
+    unslotted_size = _measure_allocated_size(lambda: [to_unslotted_entry(exp_data[index % 3]) for index in range(number_of_entries)])
+    slotted_size = _measure_allocated_size(lambda: [Entry.from_dict(exp_data[index % 3]) for index in range(number_of_entries)])
+
+    print(f"Memory of {number_of_entries} entries: {unslotted_size / 1024:.0f} KiB -> {slotted_size / 1024:.0f} KiB, saved {(unslotted_size - slotted_size) / 1024:.0f} KiB.")
+    assert slotted_size < unslotted_size * 0.75
+
+
+def _measure_allocated_size(create) -> int:
+    """
+    Returns
+        Size of memory allocated by 'create' and still held by its result, in bytes.
+    """
+    _tracemalloc.start()
+    try:
+        result = create()
+        size, _ = _tracemalloc.get_traced_memory()
+    finally:
+        _tracemalloc.stop()
+
+    del result
+    return size
+
+
+def test_register_benchmark():
+    result = run_register_benchmark(1000)
+
+    assert list(result.timings) == ["update", "previous + read", "first + last + read", "cut + update"]
+    assert "Register: 1000 entries" in result.to_report()
+
+
+def test_measurer_tail_loading(tmpdir):
+    file_name = _os.path.join(str(tmpdir), "exp_data.json")
+
+    measurer = Measurer()
+    for index in range(10):
+        measurer.update(1000 + index * 10, 60.0 * index)
+    measurer.save_exp_data(file_name)
+
+    measurer.update(1100, 600.0)
+    measurer.save_exp_data(file_name) # into journal
+
+    # only newest entries are parsed
+    loaded = Measurer()
+    loaded.load_exp_data(file_name, tail_size = 3)
+    assert not loaded._register.is_loaded()
+    assert loaded.get_number_of_entries() == 11
+    assert loaded.get_current_entry_page() == 11
+    assert loaded.get_total_exp() == 1100
+    assert loaded.get_window_exp_per_hour(2 * SECONDS_IN_MINUTE) == 600
+    assert not loaded._register.is_loaded()
+
+    # navigation to older entries loads them
+    for _ in range(3):
+        loaded.go_to_previous_entry()
+    assert loaded.get_total_exp() == 1070
+    assert not loaded._register.is_loaded()
+
+    loaded.go_to_previous_entry()
+    assert loaded.get_total_exp() == 1060
+    assert loaded._register.is_loaded()
+    assert _to_total_exps(loaded) == [1000 + index * 10 for index in range(11)]
+
+    # window beyond loaded entries loads them
+    loaded = Measurer()
+    loaded.load_exp_data(file_name, tail_size = 3)
+    assert loaded.get_window_exp_per_hour(SECONDS_IN_HOUR) == 600
+    assert loaded._register.is_loaded()
+
+    # in background
+    loaded = Measurer()
+    loaded.load_exp_data(file_name, tail_size = 3, is_background = True)
+    loaded._register._head_future.result() # type: ignore[union-attr]
+    assert loaded.poll_loading()
+    assert loaded._register.export_to_str() == measurer._register.export_to_str()
+
+    # changes of tail are saved without loading older entries
+    loaded = Measurer()
+    loaded.load_exp_data(file_name, tail_size = 3)
+    loaded.go_to_previous_entry()
+    loaded.remove_current_entry_and_all_entries_above()
+    loaded.update(1200, 660.0)
+    loaded.save_exp_data(file_name)
+    assert not loaded._register.is_loaded()
+
+    loaded = Measurer()
+    loaded.load_exp_data(file_name)
+    assert _to_total_exps(loaded) == [1000 + index * 10 for index in range(9)] + [1200]
+
+    # removal of all entries
+    loaded = Measurer()
+    loaded.load_exp_data(file_name, tail_size = 3)
+    loaded.go_to_before_first_entry()
+    loaded.remove_current_entry_and_all_entries_above()
+    assert loaded.get_number_of_entries() == 0
+    assert loaded._register.export_to_str() == "[]"
+
+    # file with fewer entries than tail is loaded whole
+    loaded = Measurer()
+    loaded.load_exp_data(file_name, tail_size = 100)
+    assert loaded._register.is_loaded()
+
+
+def test_measurer_tail_loading_of_indented_file(tmpdir):
+    file_name = _os.path.join(str(tmpdir), "exp_data.json")
+
+    measurer = Measurer()
+    for index in range(200):
+        measurer.update(1000 + index * 10, 60.0 * index)
+
+    # as written by older versions, with ",\n" inside each entry
+    with open(file_name, "w") as file:
+        _json.dump(_json.loads(measurer._register.export_to_str()), file, indent = 4)
+
+    for tail_size in [2, 1000]:
+        loaded = Measurer()
+        loaded.load_exp_data(file_name, tail_size = tail_size, is_background = True)
+        assert loaded._register.is_loaded()
+        assert _to_total_exps(loaded) == [1000 + index * 10 for index in range(200)]
+
+
+def test_measurer_tail_loading_sessions(tmpdir):
+    file_name = _os.path.join(str(tmpdir), "exp_data.json")
+
+    measurer = Measurer()
+    for index in range(20):
+        measurer.update(1000 + index * 10, 60.0 * index)
+    measurer.save_exp_data(file_name)
+
+    # current entry in head, which isn't loaded yet
+    loaded = Measurer()
+    loaded.load_exp_data(file_name, tail_size = 10)
+    loaded.go_to_first_entry()
+
+    session = loaded.to_current_session()
+    assert session is not None
+    assert (session.begin, session.end) == (0, 0)
+    assert loaded.get_current_session_index() == 0
+    assert loaded._register.is_loaded()
+
+
+def _to_total_exps(measurer : Measurer) -> list[int]:
+    total_exps = []
+
+    measurer.go_to_first_entry()
+    for _ in range(measurer.get_number_of_entries()):
+        total_exps.append(measurer.get_total_exp())
+        measurer.go_to_next_entry()
+
+    return total_exps
+
+
 _time_accumulator = 0.0
 
 def _update(measurer : Measurer, total_exp : int, elapsed_time : float) -> str:
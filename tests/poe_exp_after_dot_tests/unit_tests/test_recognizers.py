@@ -0,0 +1,200 @@
+import numpy    as _numpy
+
+from poe_exp_after_dot._Private.Settings    import Settings
+from poe_exp_after_dot._Private.StopWatch   import StageTimer
+from poe_exp_after_dot._Private.Recognizers import CachedRecognizer, EasyOCRProfile, TemplateRecognizer, TextFragment, locate_text_lines, parse_current_exp
+from poe_exp_after_dot_tests.TooltipRenderer import render_tooltip
+from poe_exp_after_dot_tests.benchmarks      import create_corpus, create_engine, run_benchmark
+
+
+def test_parse_current_exp():
+    assert parse_current_exp("") == None
+    assert parse_current_exp("Current Exp: 0 Next Level: 525 ") == 0
+    assert parse_current_exp("Current Exp: 1,234,567 Next Level: 1,249,629 ") == 1234567
+    assert parse_current_exp("Current Exp: 1.234.567 Next Level: 1.249.629 ") == 1234567
+    assert parse_current_exp("Current Exp: 1 234 567 Next Level: 1 249 629 ") == 1234567
+    assert parse_current_exp("Some Text Current  Exp:  3,932,818,530 Next Level: 4,250,334,444 ") == 3932818530
+
+    assert parse_current_exp("Current Exp: 1,234,567") == None
+    assert parse_current_exp("Current Exp: 1,2?4,567 Next Level: 1,249,629 ") == None
+    assert parse_current_exp("Current Exp: 01,234 Next Level: 1,249,629 ") == None
+
+
+def test_easyocr_profile():
+    settings = Settings()
+
+    profile = EasyOCRProfile.from_settings(settings)
+    assert profile.to_dict() == EasyOCRProfile().to_dict()
+
+    settings.set_dict("easyocr_profile", {"device" : "cpu", "number_of_threads" : 4, "is_allowlist" : False, "batch_size" : 0})
+
+    profile = EasyOCRProfile.from_settings(settings)
+    assert profile.device == "cpu"
+    assert profile.number_of_threads == 4
+    assert profile.is_quantize == True
+    assert profile.batch_size == 1
+    assert profile.to_recognition_options() == {"allowlist" : None, "decoder" : "greedy", "batch_size" : 1}
+
+    # invalid values
+    settings.set_dict("easyocr_profile", {"device" : "tpu", "is_quantize" : "yes", "decoder" : "fast"})
+
+    profile = EasyOCRProfile.from_settings(settings)
+    assert profile.device == "auto"
+    assert profile.is_quantize == True
+    assert profile.decoder == "greedy"
+
+    allowlist = EasyOCRProfile().to_recognition_options()["allowlist"]
+    assert " " in allowlist and "," in allowlist and "0" in allowlist
+
+
+def test_locate_text_lines():
+    image, text_fragments = render_tooltip("1,234,567", "9,876,500")
+
+    # vertical borders
+    image[:, 0:2] = 255
+    image[:, -2:] = 255
+
+    boxes = locate_text_lines(image)
+
+    assert len(boxes) == 1
+    x_min, x_max, y_min, y_max = boxes[0]
+    assert y_min <= text_fragments[0].polygon.lt.y + 2 and y_max >= text_fragments[-1].polygon.lb.y - 2
+    assert x_min == 0 and x_max == image.shape[1]
+
+    # two lines
+    first_image, _  = render_tooltip("1,234,567", "9,876,500", height = 40)
+    second_image, _ = render_tooltip("7,654,321", "9,876,500", height = 40)
+
+    boxes = locate_text_lines(_numpy.concatenate([first_image, second_image]))
+
+    assert len(boxes) == 2
+    assert boxes[0][3] <= boxes[1][2] + 2 * 2
+
+    assert locate_text_lines(_numpy.zeros((40, 100, 3), dtype = _numpy.uint8)) == []
+
+
+def test_template_recognizer(tmpdir):
+    atlas_file_name = tmpdir + "\\glyph_atlas.npz"
+
+    recognizer = TemplateRecognizer(atlas_file_name)
+
+    image, text_fragments = render_tooltip("1,234,567", "9,876,500")
+
+    # nothing learned yet
+    assert recognizer.recognize_exp(image) == None
+
+    assert recognizer.learn(image, text_fragments) > 0
+    assert recognizer.learn(image, text_fragments) == 0 # same samples
+
+    assert recognizer.recognize_exp(image) == 1234567
+    assert recognizer.get_last_text().startswith("Current Exp: 1,234,567 ")
+
+    image, _ = render_tooltip("7,654,321", "9,876,500")
+    assert recognizer.recognize_exp(image) == 7654321
+
+    image, _ = render_tooltip("50,090,050", "59,876,500")
+    assert recognizer.recognize_exp(image) == 50090050
+
+    # from file
+    recognizer = TemplateRecognizer(atlas_file_name)
+
+    assert recognizer.recognize_exp(image) == 50090050
+
+    # other height of tooltip image
+    image, _ = render_tooltip("7,654,321", "9,876,500", height = 46)
+    assert recognizer.recognize_exp(image) == None
+
+
+def test_template_recognizer_on_benchmark_corpus():
+    recognizer = create_engine("template")
+    assert recognizer is not None
+
+    result = run_benchmark("template", recognizer, create_corpus(), 1)
+
+    assert result.correct_counts == result.sample_counts
+
+
+def test_template_recognizer_fallback():
+    image, text_fragments = render_tooltip("1,234,567", "9,876,500")
+    fallback = _FakeFallbackRecognizer(1234567, "Current Exp: 1,234,567 Next Level: 9,876,500 ", text_fragments)
+
+    recognizer = TemplateRecognizer(None, fallback) # type: ignore[arg-type]
+
+    assert recognizer.recognize_exp(image) == 1234567
+    assert fallback.number_of_calls == 1
+
+    # learned from fallback
+    assert recognizer.recognize_exp(image) == 1234567
+    assert fallback.number_of_calls == 1
+
+
+def test_cached_recognizer():
+    image, text_fragments = render_tooltip("1,234,567", "9,876,500")
+    other_image, _ = render_tooltip("1,234,568", "9,876,500")
+    fake = _FakeFallbackRecognizer(1234567, "Current Exp: 1,234,567 Next Level: 9,876,500 ", text_fragments)
+
+    recognizer = CachedRecognizer(fake, 1) # type: ignore[arg-type]
+
+    assert recognizer.recognize_exp(image) == 1234567
+    assert recognizer.recognize_exp(image.copy()) == 1234567
+    assert recognizer.get_last_text() == "Current Exp: 1,234,567 Next Level: 9,876,500 "
+    assert fake.number_of_calls == 1
+    assert (recognizer.get_number_of_hits(), recognizer.get_number_of_misses()) == (1, 1)
+
+    # small change of brightness doesn't change binarized image
+    assert recognizer.recognize_exp(_numpy.clip(image.astype(_numpy.int16) + 3, 0, 255).astype(_numpy.uint8)) == 1234567
+    assert fake.number_of_calls == 1
+
+    # other image pushes out least recently used one
+    recognizer.recognize_exp(other_image)
+    recognizer.recognize_exp(image)
+    assert fake.number_of_calls == 3
+
+    # failures are not cached
+    fake = _FakeFallbackRecognizer(None, "", [])
+    recognizer = CachedRecognizer(fake, 8) # type: ignore[arg-type]
+
+    assert recognizer.recognize_exp(image) == None
+    assert recognizer.recognize_exp(image) == None
+    assert fake.number_of_calls == 2
+
+
+def test_recognizer_stages():
+    image, text_fragments = render_tooltip("1,234,567", "9,876,500")
+    stage_timer = StageTimer()
+
+    template_recognizer = TemplateRecognizer()
+    template_recognizer.learn(image, text_fragments)
+
+    recognizer = CachedRecognizer(template_recognizer, 8)
+    recognizer.set_stage_timer(stage_timer)
+
+    assert recognizer.recognize_exp(image) == 1234567
+    assert recognizer.recognize_exp(image) == 1234567 # from cache
+
+    assert sorted(stage_timer.get_stage_names()) == ["cache", "ocr", "parse"]
+    assert stage_timer.get_statistics("cache").count == 2   # type: ignore[union-attr]
+    assert stage_timer.get_statistics("ocr").count == 1     # type: ignore[union-attr]
+
+
+class _FakeFallbackRecognizer:
+    number_of_calls : int
+
+    def __init__(self, total_exp : int | None, text : str, text_fragments : list[TextFragment]):
+        self._total_exp         = total_exp
+        self._text              = text
+        self._text_fragments    = text_fragments
+        self.number_of_calls    = 0
+
+    def recognize_exp(self, image : _numpy.ndarray) -> int | None:
+        self.number_of_calls += 1
+        return self._total_exp
+
+    def get_name(self) -> str:
+        return "fake"
+
+    def get_last_text(self) -> str:
+        return self._text
+
+    def get_last_text_fragments(self) -> list[TextFragment]:
+        return self._text_fragments
@@ -0,0 +1,47 @@
+import numpy    as _numpy
+import cv2      as _cv2
+
+from poe_exp_after_dot._Private.ScreenCapture import FileScreenCapture
+
+
+def test_file_screen_capture(tmpdir):
+    screen = _numpy.arange(20 * 10 * 3, dtype = _numpy.uint32).astype(_numpy.uint8).reshape(10, 20, 3)
+
+    file_name = str(tmpdir + "\\screen.png")
+    _cv2.imwrite(file_name, screen)
+
+    screen_capture = FileScreenCapture(file_name)
+
+    assert screen_capture.get_screen_size() == (20, 10)
+
+    image = screen_capture.grab(2, 3, 5, 4)
+    assert image.shape == (4, 5, 3)
+    assert _numpy.array_equal(image, screen[3:7, 2:7])
+
+    # buffer is reused
+    assert screen_capture.grab(4, 1, 5, 4) is image
+    assert _numpy.array_equal(image, screen[1:5, 4:9])
+
+    # partially outside of screen
+    image = screen_capture.grab(17, -2, 5, 4)
+    assert _numpy.array_equal(image[2:, :3], screen[:2, 17:])
+    assert not image[:2].any()
+    assert not image[:, 3:].any()
+
+    # fully outside of screen
+    image = screen_capture.grab(30, 30, 5, 4)
+    assert image.shape == (4, 5, 3)
+    assert not image.any()
+
+
+def test_file_screen_capture_not_image(tmpdir):
+    file_name = str(tmpdir + "\\screen.png")
+    with open(file_name, "w") as file:
+        file.write("not an image")
+
+    try:
+        FileScreenCapture(file_name)
+    except ValueError:
+        pass
+    else:
+        assert False, "Expected ValueError exception."
@@ -0,0 +1,53 @@
+from poe_exp_after_dot._Private.StopWatch import StageTimer
+
+
+def test_stage_timer():
+    stage_timer = StageTimer(window_size = 20)
+
+    assert stage_timer.get_statistics("ocr") == None
+    assert stage_timer.get_stage_names() == []
+
+    for index in range(1, 31):
+        stage_timer.add("ocr", index / 1000)
+
+    # only last 20 durations (0.011 .. 0.030)
+    statistics = stage_timer.get_statistics("ocr")
+    assert statistics is not None
+    assert statistics.count == 20
+    assert statistics.p50 == 0.020
+    assert statistics.p95 == 0.029
+    assert statistics.max == 0.030
+
+    # measured even if exception is raised
+    try:
+        with stage_timer.measure("parse"):
+            raise ValueError()
+    except ValueError:
+        pass
+
+    statistics = stage_timer.get_statistics("parse")
+    assert statistics is not None and statistics.count == 1 and statistics.max >= 0.0
+
+    assert stage_timer.get_stage_names() == ["ocr", "parse"]
+
+    stage_timer.clear()
+    assert stage_timer.get_statistics("ocr") == None
+
+
+def test_stage_timer_collect():
+    stage_timer = StageTimer()
+
+    stage_timer.add("capture", 0.5)
+
+    with stage_timer.collect() as outer:
+        stage_timer.add("ocr", 0.25)
+
+        with stage_timer.collect() as inner:
+            stage_timer.add("ocr", 0.5)
+            stage_timer.add("parse", 0.125)
+
+    stage_timer.add("parse", 1.0)
+
+    assert outer == {"ocr" : 0.75, "parse" : 0.125}
+    assert inner == {"ocr" : 0.5, "parse" : 0.125}
+    assert stage_timer.get_statistics("parse").count == 2 # type: ignore[union-attr]
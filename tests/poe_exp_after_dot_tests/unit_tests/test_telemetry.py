@@ -0,0 +1,72 @@
+import os       as _os
+
+from datetime import datetime as _datetime
+
+from poe_exp_after_dot._Private.Telemetry import TelemetryLog, TELEMETRY_BACKUP_COUNT, iterate_records, create_perf_report
+
+
+def _make_record(time_ : float, engine : str, is_success : bool, capture : float, recognize : float) -> dict:
+    return {
+        "time"          : time_,
+        "version"       : "0.2.0",
+        "engine"        : engine,
+        "layout"        : "1920x1080",
+        "width"         : 486,
+        "height"        : 73,
+        "is_success"    : is_success,
+        "stages"        : {"capture" : capture, "ocr" : recognize - 0.5, "recognize" : recognize},
+    }
+
+
+def test_telemetry_log_rotation(tmpdir):
+    file_name = _os.path.join(str(tmpdir), "cache", "telemetry.jsonl")
+
+    record = _make_record(0.0, "template", True, 1.0, 2.0)
+    record_size = 200 # in bytes, records are a bit shorter
+
+    telemetry_log = TelemetryLog(file_name, record_size * 2)
+
+    for index in range(20):
+        record["time"] = float(index)
+        telemetry_log.append(record)
+
+    # newest records are kept, oldest are dropped with oldest rotated file
+    times = [record["time"] for record in iterate_records(file_name)]
+    assert times == sorted(times)
+    assert times[-1] == 19.0
+    assert times[0] > 0.0
+
+    assert _os.path.isfile(f"{file_name}.{TELEMETRY_BACKUP_COUNT}")
+    assert not _os.path.isfile(f"{file_name}.{TELEMETRY_BACKUP_COUNT + 1}")
+    assert _os.path.getsize(file_name) <= record_size * 2
+
+
+def test_create_perf_report(tmpdir):
+    file_name = _os.path.join(str(tmpdir), "telemetry.jsonl")
+
+    assert create_perf_report(file_name).startswith("There are no telemetry records")
+
+    day = _datetime(2024, 3, 25, 12).timestamp()
+    next_day = _datetime(2024, 3, 26, 12).timestamp()
+
+    telemetry_log = TelemetryLog(file_name, 1024 * 1024)
+    for index in range(10):
+        telemetry_log.append(_make_record(day + index, "template", index != 0, 1.0, 2.0 + index))
+    telemetry_log.append(_make_record(next_day, "easyocr", True, 1.0, 99.0))
+
+    with open(file_name, "a") as file:
+        file.write("{malformed\n")
+
+    latency_report, stage_report = create_perf_report(file_name).split("\n\n")
+
+    lines = latency_report.split("\n")
+    assert len(lines) == 3
+    assert lines[1].split() == ["easyocr", "1920x1080", "0.2.0", "2024-03-26", "1", "0.0%", "100.0", "100.0", "100.0"]
+    assert lines[2].split() == ["template", "1920x1080", "0.2.0", "2024-03-25", "10", "10.0%", "7.0", "12.0", "12.0"]
+
+    # each stage of each group
+    lines = stage_report.split("\n")
+    assert len(lines) == 7
+    assert lines[1].split() == ["easyocr", "1920x1080", "0.2.0", "2024-03-26", "capture", "1", "1.0", "1.0", "1.0"]
+    assert lines[5].split() == ["template", "1920x1080", "0.2.0", "2024-03-25", "ocr", "10", "5.5", "10.5", "10.5"]
+    assert lines[6].split() == ["template", "1920x1080", "0.2.0", "2024-03-25", "recognize", "10", "6.0", "11.0", "11.0"]